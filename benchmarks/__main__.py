@@ -0,0 +1,51 @@
+import argparse
+import json
+import os
+import sys
+from benchmarks.suite import BENCHMARKS, compare, run_suite
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Testy wydajności najczęściej wykonywanych ścieżek silnika pokera.")
+    parser.add_argument("--only", nargs='+', choices=sorted(BENCHMARKS), help="uruchom tylko wybrane pomiary")
+    parser.add_argument("--scale", type=int, default=1, help="mnożnik liczby operacji w każdym pomiarze")
+    parser.add_argument("--warmup", type=int, default=1, help="liczba przebiegów rozgrzewkowych")
+    parser.add_argument("--repeats", type=int, default=5, help="liczba mierzonych przebiegów")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="plik z wynikami odniesienia")
+    parser.add_argument("--threshold", type=float, default=0.25, help="dopuszczalny spadek wydajności (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="zapisz wyniki jako nowe odniesienie")
+    args = parser.parse_args()
+
+    report = run_suite(args.only, args.scale, args.warmup, args.repeats)
+    if args.save_baseline:
+        saved = report
+        if args.only and os.path.exists(args.baseline):
+            # Z --only aktualizujemy tylko wybrane pomiary, zachowując pozostałe odniesienia.
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            saved["results"].update(report["results"])
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(saved, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+    regressions = []
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        report["threshold"] = args.threshold
+        report["comparison"] = compare(report, baseline, args.threshold)
+        regressions = [entry["name"] for entry in report["comparison"] if entry["regression"]]
+        report["regressions"] = regressions
+        missing = [entry["name"] for entry in report["comparison"] if entry.get("missing_baseline")]
+        report["missing_baseline"] = missing
+        if missing:
+            print(f"Uwaga: brak odniesienia dla pomiarów: {', '.join(missing)}.", file=sys.stderr)
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
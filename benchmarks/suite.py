@@ -0,0 +1,311 @@
+import os
+import platform
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+from src.logic.deck import Deck
+from src.logic.player import Player
+from src.logic.hand_ranker import hand_rank
+from src.logic.hand_evaluator import evaluate, score_category
+from src.logic.draw_outcomes import clear_cache, draw_outcomes
+from src.engine.game_engine import GameEngine
+from src.engine.policies import RandomBotPolicy
+from src.fileops.history_archive import HistoryArchive, HistoryArchiveWriter
+from src.fileops.history_logger import HistoryLogger
+from src.fileops.session_manager import SessionManager
+
+SEED = 2025
+Benchmark = Tuple[Callable[[], None], int, Callable[[], None]]
+
+
+def _random_hands(count: int, seed: int = SEED) -> List[List[int]]:
+    rng = random.Random(seed)
+    cards = list(range(52))
+    return [rng.sample(cards, 5) for _ in range(count)]
+
+
+def _worst_case_hands(count: int, seed: int = SEED) -> List[List[int]]:
+    # Najdłuższa ścieżka hand_rank: brak koloru i strita, więc sprawdzane są wszystkie gałęzie aż do wysokiej karty.
+    hands = []
+    for hand in _random_hands(count * 4, seed):
+        if score_category(evaluate(hand)) == 0 and hand_rank(hand)[0] == 0:
+            hands.append(hand)
+            if len(hands) == count:
+                break
+    return hands
+
+
+def _noop() -> None:
+    pass
+
+
+def bench_hand_rank_random(scale: int) -> Benchmark:
+    hands = _random_hands(20_000 * scale)
+
+    def run():
+        for hand in hands:
+            hand_rank(hand)
+    return run, len(hands), _noop
+
+
+def bench_hand_rank_worst_case(scale: int) -> Benchmark:
+    hands = _worst_case_hands(20_000 * scale)
+
+    def run():
+        for hand in hands:
+            hand_rank(hand)
+    return run, len(hands), _noop
+
+
+def bench_evaluate_random(scale: int) -> Benchmark:
+    hands = _random_hands(20_000 * scale)
+
+    def run():
+        for hand in hands:
+            evaluate(hand)
+    return run, len(hands), _noop
+
+
+def bench_draw_outcomes(scale: int) -> Benchmark:
+    # Bez pamięci podręcznej: mierzy samo wyliczanie dobieranych kart przy wymianie 1-4 kart.
+    hands = _random_hands(200 * scale)
+    discards = [list(range(5 - held, 5)) for held in range(1, 5)]
+
+    def run():
+        clear_cache()
+        for i, hand in enumerate(hands):
+            draw_outcomes(hand, discards[i % 4])
+    return run, len(hands), _noop
+
+
+def bench_deck_construct(scale: int) -> Benchmark:
+    rng = random.Random(SEED)
+    count = 20_000 * scale
+
+    def run():
+        for _ in range(count):
+            Deck(rng)
+    return run, count, _noop
+
+
+def bench_deck_shuffle(scale: int) -> Benchmark:
+    deck = Deck(random.Random(SEED))
+    count = 20_000 * scale
+
+    def run():
+        for _ in range(count):
+            deck.reset()
+            deck.shuffle()
+    return run, count, _noop
+
+
+def bench_deck_deal(scale: int) -> Benchmark:
+    deck = Deck(random.Random(SEED))
+    players = Player.create_players([{"name": f"P{i}", "stack": 1000, "is_human": False} for i in range(4)])
+    count = 20_000 * scale
+
+    def run():
+        for _ in range(count):
+            deck.reset()
+            for player in players:
+                player.hand.clear()
+            deck.deal(players, 5)
+    return run, count, _noop
+
+
+def bench_deck_draw(scale: int) -> Benchmark:
+    deck = Deck(random.Random(SEED))
+    count = 2_000 * scale
+
+    def run():
+        for _ in range(count):
+            deck.reset()
+            for _ in range(52):
+                deck.draw()
+    return run, count * 52, _noop
+
+
+def _tableless_policy() -> RandomBotPolicy:
+    # Tablice wymiany i percentyli w data/ są budowane lokalnie i nie trafiają do repozytorium, więc pomiary
+    # grają bez nich, żeby ścieżka kodu i wyniki nie zależały od zawartości katalogu danych.
+    policy = RandomBotPolicy()
+    policy.discard_table = None
+    policy.percentile_table = None
+    return policy
+
+
+def bench_play_round(scale: int) -> Benchmark:
+    players = Player.create_players([{"name": f"Bot {i}", "stack": 1000, "is_human": False} for i in range(4)])
+    game = GameEngine(players, None, seed=SEED, default_policy=_tableless_policy(), headless=True)
+    count = 2_000 * scale
+
+    def run():
+        game.round_counter = 0
+        for _ in range(count):
+            # Stałe stosy utrzymują stół w komplecie, więc każda iteracja to pełne rozdanie.
+            for player in players:
+                player.stack = 1000
+            game.play_round()
+    return run, count, _noop
+
+
+def _sample_histories(count: int) -> List[dict]:
+    histories = []
+    logger = _Collector(histories)
+    players = Player.create_players([{"name": f"Bot {i}", "stack": 1000, "is_human": False} for i in range(4)])
+    game = GameEngine(players, logger, seed=SEED, default_policy=_tableless_policy(), headless=True)
+    for _ in range(count):
+        for player in players:
+            player.stack = 1000
+        game.play_round()
+    return histories
+
+
+class _Collector:
+    def __init__(self, histories: List[dict]):
+        self.histories = histories
+
+    def save_hand_history(self, history_data: dict) -> None:
+        self.histories.append(history_data)
+
+
+def _bench_history_logger(mode: str, scale: int) -> Benchmark:
+    histories = _sample_histories(2_000 * scale)
+    directory = tempfile.mkdtemp(prefix="bench_history_")
+
+    def run():
+        logger = HistoryLogger(data_dir=os.path.join(directory, str(time.perf_counter_ns())), mode=mode)
+        for history in histories:
+            logger.save_hand_history(history)
+        logger.close()
+    return run, len(histories), lambda: shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_history_logger_jsonl(scale: int) -> Benchmark:
+    return _bench_history_logger('jsonl', scale)
+
+
+def bench_history_logger_binary(scale: int) -> Benchmark:
+    return _bench_history_logger('binary', scale)
+
+
+def bench_history_archive_encode(scale: int) -> Benchmark:
+    histories = _sample_histories(2_000 * scale)
+    directory = tempfile.mkdtemp(prefix="bench_archive_")
+    path = os.path.join(directory, "hands.p5h")
+
+    def run():
+        with HistoryArchiveWriter(path) as writer:
+            for history in histories:
+                writer.add(history)
+    return run, len(histories), lambda: shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_history_archive_decode(scale: int) -> Benchmark:
+    histories = _sample_histories(2_000 * scale)
+    directory = tempfile.mkdtemp(prefix="bench_archive_")
+    path = os.path.join(directory, "hands.p5h")
+    with HistoryArchiveWriter(path) as writer:
+        for history in histories:
+            writer.add(history)
+
+    def run():
+        with HistoryArchive(path) as archive:
+            for _ in archive.iter_hands():
+                pass
+    return run, len(histories), lambda: shutil.rmtree(directory, ignore_errors=True)
+
+
+def bench_session_checkpoint(scale: int) -> Benchmark:
+    directory = tempfile.mkdtemp(prefix="bench_session_")
+    manager = SessionManager(data_dir=directory)
+    players = Player.create_players([{"name": f"Bot {i}", "stack": 1000, "is_human": False} for i in range(4)])
+    game = GameEngine(players, None, seed=SEED, default_policy=_tableless_policy(), headless=True)
+    session_data = game.get_session_data()
+    count = 200 * scale
+
+    def run():
+        for round_counter in range(1, count + 1):
+            session_data["round_counter"] = round_counter
+            manager.save_checkpoint(session_data)
+    return run, count, lambda: shutil.rmtree(directory, ignore_errors=True)
+
+
+BENCHMARKS: Dict[str, Callable[[int], Benchmark]] = {
+    "hand_rank.random": bench_hand_rank_random,
+    "hand_rank.worst_case": bench_hand_rank_worst_case,
+    "evaluate.random": bench_evaluate_random,
+    "draw_outcomes.exact": bench_draw_outcomes,
+    "deck.construct": bench_deck_construct,
+    "deck.shuffle": bench_deck_shuffle,
+    "deck.deal": bench_deck_deal,
+    "deck.draw": bench_deck_draw,
+    "engine.play_round": bench_play_round,
+    "history_logger.jsonl": bench_history_logger_jsonl,
+    "history_logger.binary": bench_history_logger_binary,
+    "history_archive.encode": bench_history_archive_encode,
+    "history_archive.decode": bench_history_archive_decode,
+    "session_manager.checkpoint": bench_session_checkpoint,
+}
+
+
+def measure(factory: Callable[[int], Benchmark], scale: int = 1, warmup: int = 1, repeats: int = 5) -> dict:
+    run, ops, cleanup = factory(scale)
+    try:
+        for _ in range(warmup):
+            run()
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+    finally:
+        cleanup()
+    best = min(timings)
+    median = statistics.median(timings)
+    return {
+        "ops": ops,
+        "repeats": repeats,
+        "best_seconds": best,
+        "median_seconds": median,
+        "ops_per_second": ops / best if best > 0 else 0.0,
+        "median_ops_per_second": ops / median if median > 0 else 0.0
+    }
+
+
+def run_suite(names: List[str] = None, scale: int = 1, warmup: int = 1, repeats: int = 5) -> dict:
+    names = names or list(BENCHMARKS)
+    results = {}
+    for name in names:
+        results[name] = measure(BENCHMARKS[name], scale, warmup, repeats)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": SEED,
+        "scale": scale,
+        "results": results
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> List[dict]:
+    comparison = []
+    for name, result in report["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            # Pomiar bez odniesienia nie jest pilnowany przez próg regresji, więc musi być widoczny w raporcie.
+            comparison.append({"name": name, "baseline_ops_per_second": None, "ops_per_second": result["median_ops_per_second"],
+                               "ratio": None, "regression": False, "missing_baseline": True})
+            continue
+        # Porównujemy medianę, bo pojedynczy najlepszy pomiar bywa przypadkowo szybki.
+        ratio = result["median_ops_per_second"] / reference["median_ops_per_second"] if reference["median_ops_per_second"] else 0.0
+        comparison.append({
+            "name": name,
+            "baseline_ops_per_second": reference["median_ops_per_second"],
+            "ops_per_second": result["median_ops_per_second"],
+            "ratio": ratio,
+            "regression": ratio < 1.0 - threshold
+        })
+    return comparison
@@ -1,11 +1,16 @@
 import json
-import os
+import sys
 from src.logic.player import Player
 from src.engine.game_engine import GameEngine
+from src.engine.replay import GameReplayer
+from src.utils.metrics import Metrics
 from src.fileops.session_manager import SessionManager
 from src.fileops.history_logger import HistoryLogger
+from src.fileops.history_store import HistoryStore
 
-def load_config() -> dict:
+def load_config(quiet: bool = False) -> dict:
+    # W trybie quiet komunikaty trafiają na stderr, żeby nie psuć wyjścia maszynowego (np. --json).
+    out = sys.stderr if quiet else sys.stdout
     default_config = {
         "small_blind": 25,
         "big_blind": 50,
@@ -18,21 +23,20 @@ def load_config() -> dict:
     }
     try:
         with open('config.json', 'r', encoding='utf-8') as f:
-            print("Wczytano konfigurację z pliku config.json.")
+            print("Wczytano konfigurację z pliku config.json.", file=out)
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"Ostrzeżenie: Nie udało się wczytać pliku config.json ({e}). Używam domyślnych ustawień.")
+        print(f"Ostrzeżenie: Nie udało się wczytać pliku config.json ({e}). Używam domyślnych ustawień.", file=out)
         return default_config
 
-def replay_hand_from_history(filename: str):
+def replay_hand_from_history(history_logger: HistoryLogger, game_id: str, hand_id: str):
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            history = json.load(f)
-    except FileNotFoundError:
-        print(f"Błąd: Nie znaleziono pliku historii '{filename}'.")
-        return
+        history = history_logger.load_hand(game_id, hand_id)
     except json.JSONDecodeError:
-        print(f"Błąd: Plik historii '{filename}' jest uszkodzony.")
+        print(f"Błąd: Historia rozdania '{hand_id}' gry '{game_id}' jest uszkodzona.")
+        return
+    if history is None:
+        print(f"Błąd: Nie znaleziono historii rozdania '{hand_id}' gry '{game_id}'.")
         return
 
     player_map = {p['id']: p['name'] for p in history['players']}
@@ -85,13 +89,59 @@ def replay_hand_from_history(filename: str):
     print("Koniec odtwarzania.")
     print("="*20 + "\n")
 
+def run_simulation(config: dict, n_hands: int) -> None:
+    player_specs = [
+        {"name": p_data['name'], "stack": config['initial_stack'], "is_human": p_data['is_human']}
+        for p_data in config['players']
+    ]
+    game = GameEngine(
+        players=Player.create_players(player_specs),
+        history_logger=None,
+        small_blind=config['small_blind'],
+        big_blind=config['big_blind'],
+        headless=True,
+        metrics=Metrics()
+    )
+    stats = game.simulate(n_hands)
+    print(f"Rozegrano {stats['hands']} rozdań w {stats['seconds']:.3f} s ({stats['hands_per_second']:,.0f} rozdań/s).")
+    snapshot = game.metrics.snapshot()
+    for phase, timer in snapshot['timers'].items():
+        print(f"  {phase}: średnio {timer['mean_us']:.1f} µs, maks. {timer['max_us']:.1f} µs")
+    print("  " + ", ".join(f"{name}: {count}" for name, count in sorted(snapshot['counters'].items())))
+
+def play_game(game: GameEngine, session_manager: SessionManager) -> None:
+    try:
+        while True:
+            game.players = [p for p in game.players if p.stack > 0]
+            if len(game.players) < 2:
+                print("Zbyt mało graczy, aby kontynuować.")
+                break
+            game.play_round()
+            session_data = game.get_session_data()
+            session_manager.save_checkpoint(session_data)
+            print(f"Postęp gry został zapisany. ID Twojej gry to: {game.game_id}")
+            if input("Zagrać kolejną rundę? (t/n): ").lower() != 't':
+                break
+    except KeyboardInterrupt:
+        print("\nGra przerwana.")
+    print("\nKoniec Gry.")
+
+def fast_forward_game(history_logger: HistoryLogger, session_manager: SessionManager, game_id: str, hand_number: int):
+    session_data = session_manager.load_session(game_id)
+    human_names = [p['name'] for p in session_data.get('players', []) if p.get('is_human')]
+    try:
+        return GameReplayer(history_logger, game_id).fast_forward(hand_number, human_names)
+    except ValueError as e:
+        print(f"Błąd: {e}")
+        return None
+
 def main():
     print("Witaj w Pokerze Pięciokartowym Dobieranym!")
     session_manager = SessionManager()
-    history_logger = HistoryLogger()
+    history_logger = HistoryLogger(store=HistoryStore())
     game = None
     while True:
-        choice = input("Wybierz opcję: [N]owa gra, [W]czytaj grę, [O]dtwórz rozdanie, [Z]akończ: ").upper()
+        choice = input("Wybierz opcję: [N]owa gra, [W]czytaj grę, [O]dtwórz rozdanie, [P]rzewiń grę, [S]ymulacja, [Z]akończ: ").upper()
         if choice == 'N':
             print("Rozpoczynanie nowej gry...")
             config = load_config()
@@ -110,30 +160,41 @@ def main():
                 small_blind=config['small_blind'],
                 big_blind=config['big_blind']
             )
-            try:
-                while True:
-                    game.players = [p for p in game.players if p.stack > 0]
-                    if len(game.players) < 2:
-                        print("Zbyt mało graczy, aby kontynuować.")
-                        break
-                    game.play_round()
-                    session_data = game.get_session_data()
-                    session_manager.save_session(session_data)
-                    print(f"Postęp gry został zapisany. ID Twojej gry to: {game.game_id}")
-                    if input("Zagrać kolejną rundę? (t/n): ").lower() != 't':
-                        break
-            except KeyboardInterrupt:
-                print("\nGra przerwana.")
-            print("\nKoniec Gry.")
+            play_game(game, session_manager)
         elif choice == 'W':
-            print("Wczytywanie sesji nie jest obecnie w pełni wspierane w tym trybie.")
+            game_id_input = input("Podaj ID gry do wczytania: ").strip()
+            session_data = session_manager.load_session(game_id_input)
+            if not session_data:
+                continue
+            game = GameEngine.from_session_data(session_data, history_logger)
+            print(f"Wznowiono grę {game.game_id} po rundzie {game.round_counter}.")
+            play_game(game, session_manager)
         elif choice == 'O':
             print("\n--- Odtwarzanie Historii Rozdania ---")
             game_id_input = input("Podaj ID gry, z której chcesz odtworzyć rozdanie: ")
             hand_id_input = input("Podaj ID rozdania (np. round_1): ")
-            filename = os.path.join('data', f"history_{game_id_input}_{hand_id_input}.json")
-            replay_hand_from_history(filename)
+            replay_hand_from_history(history_logger, game_id_input, hand_id_input)
+        elif choice == 'P':
+            game_id_input = input("Podaj ID gry do przewinięcia: ").strip()
+            try:
+                hand_number = int(input("Podaj numer rozdania, po którym wznowić grę: "))
+            except ValueError:
+                print("Nieprawidłowy numer rozdania.")
+                continue
+            game = fast_forward_game(history_logger, session_manager, game_id_input, hand_number)
+            if game is None:
+                continue
+            print(f"Wznowiono grę {game_id_input} po rundzie {game.round_counter} jako nową grę {game.game_id}.")
+            play_game(game, session_manager)
+        elif choice == 'S':
+            try:
+                n_hands = int(input("Podaj liczbę rozdań do symulacji: "))
+            except ValueError:
+                print("Nieprawidłowa liczba rozdań.")
+                continue
+            run_simulation(load_config(), n_hands)
         elif choice == 'Z':
+            history_logger.close()
             print("Do widzenia!")
             break
         else:
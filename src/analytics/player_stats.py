@@ -0,0 +1,62 @@
+import os
+from typing import Dict, List
+import numpy as np
+from src.fileops.columnar_export import ACTION_CODES, STAGE_CODES, load_table
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    return np.divide(numerator, denominator, out=np.zeros(len(numerator), dtype=np.float64), where=denominator > 0)
+
+
+def compute_player_stats(out_dir: str) -> Dict[str, np.ndarray]:
+    names = np.load(os.path.join(out_dir, "player_names.npy"))
+    num_players = len(names)
+    hands = load_table(out_dir, "hands")
+    seats = load_table(out_dir, "seats")
+    actions = load_table(out_dir, "actions")
+    showdowns = load_table(out_dir, "showdowns")
+
+    seat_players = np.asarray(seats["player"])
+    hands_played = np.bincount(seat_players, minlength=num_players)
+    profit = np.bincount(
+        seat_players,
+        weights=np.asarray(seats["final_stack"], dtype=np.int64) - np.asarray(seats["initial_stack"], dtype=np.int64),
+        minlength=num_players
+    ).astype(np.int64)
+    # Rozdanie jest wygrane przez zwycięzcę puli głównej i przez każdego, kto zdobył pulę boczną.
+    seat_won = (np.asarray(hands["winner"])[np.asarray(seats["hand"])] == seat_players) | (np.asarray(seats["won"]) > 0)
+    hands_won = np.bincount(seat_players, weights=seat_won, minlength=num_players).astype(np.int64)
+
+    action_players = np.asarray(actions["player"])
+    action_codes = np.asarray(actions["action"])
+    calls = np.bincount(action_players[action_codes == ACTION_CODES["call"]], minlength=num_players)
+    raises = np.bincount(action_players[action_codes == ACTION_CODES["raise"]], minlength=num_players)
+
+    # VPIP liczy rozdania, nie akcje: para (rozdanie, gracz) wchodzi do licznika co najwyżej raz.
+    voluntary = (np.asarray(actions["stage"]) == STAGE_CODES["pre-exchange"]) & (
+        (action_codes == ACTION_CODES["call"]) | (action_codes == ACTION_CODES["raise"]))
+    keys = np.unique(np.asarray(actions["hand"])[voluntary].astype(np.int64) * num_players + action_players[voluntary])
+    vpip_hands = np.bincount(keys % num_players, minlength=num_players) if num_players else np.zeros(0, dtype=np.int64)
+
+    showdown_players = np.asarray(showdowns["player"])
+    showdowns_seen = np.bincount(showdown_players, minlength=num_players)
+    showdowns_won = np.bincount(showdown_players, weights=np.asarray(showdowns["won"]), minlength=num_players).astype(np.int64)
+
+    return {
+        "name": names,
+        "hands_played": hands_played,
+        "hands_won": hands_won,
+        "profit": profit,
+        "profit_per_hand": _ratio(profit, hands_played),
+        "vpip": _ratio(vpip_hands, hands_played),
+        "calls": calls,
+        "raises": raises,
+        "aggression_factor": _ratio(raises, calls),
+        "showdowns": showdowns_seen,
+        "showdown_win_rate": _ratio(showdowns_won, showdowns_seen),
+    }
+
+
+def stats_to_records(stats: Dict[str, np.ndarray]) -> List[dict]:
+    columns = list(stats)
+    return [dict(zip(columns, (stats[column][i].item() for column in columns))) for i in range(len(stats["name"]))]
@@ -0,0 +1,98 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class HandStarted(NamedTuple):
+    game_id: str
+    hand_id: str
+    timestamp: str
+    players: Tuple[Tuple[int, str, int], ...]
+    small_blind: int
+    big_blind: int
+    seed: int
+    deck: List[int]
+
+
+class BlindPosted(NamedTuple):
+    player_id: int
+    name: str
+    blind: str
+    amount: int
+
+
+class CardsDealt(NamedTuple):
+    hands: Dict[int, List[int]]
+
+
+class TurnStarted(NamedTuple):
+    player_id: int
+    name: str
+    stack: int
+    pot: int
+    current_bet: int
+    cards: Optional[List[int]]
+
+
+class ActionTaken(NamedTuple):
+    stage: str
+    player_id: int
+    name: str
+    action: str
+    amount: int
+    bet_in_round: int
+
+
+class ExchangeStarted(NamedTuple):
+    pass
+
+
+class CardsExchanged(NamedTuple):
+    player_id: int
+    name: str
+    discarded: List[int]
+
+
+class ExchangeFinished(NamedTuple):
+    final_hands: Dict[int, List[int]]
+
+
+class ShowdownStarted(NamedTuple):
+    pass
+
+
+class ShowdownHand(NamedTuple):
+    player_id: int
+    name: str
+    cards: List[int]
+    score: int
+
+
+class SidePot(NamedTuple):
+    amount: int
+    winner_id: int
+    name: str
+    eligible: Tuple[int, ...]
+
+
+class ShowdownResult(NamedTuple):
+    winner_id: Optional[int]
+    name: Optional[str]
+    pot: int
+    side_pots: Tuple[SidePot, ...] = ()
+
+
+class HandFinished(NamedTuple):
+    hand_id: str
+    final_stacks: Tuple[Tuple[int, str, int], ...]
+
+
+class HistorySaved(NamedTuple):
+    hand_id: str
+
+
+class EventSink(ABC):
+    interests: Tuple[type, ...] = ()
+
+    @abstractmethod
+    def handle(self, event: NamedTuple) -> None:
+        ...
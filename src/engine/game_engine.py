@@ -1,204 +1,307 @@
 import random
+import time
 import uuid
-from typing import List, Dict, Any
+from collections import deque
+from typing import List, Dict, Any, NamedTuple
 from datetime import datetime
 from src.logic.player import Player
 from src.logic.deck import Deck
-from src.logic.hand_ranker import hand_rank
-from src.utils.exceptions import InsufficientFundsError, InvalidActionError
+from src.logic.hand_evaluator import evaluate
 from src.fileops.history_logger import HistoryLogger
+from src.engine.policies import Policy, EquityBotPolicy, ConsolePolicy
+from src.utils.metrics import Metrics
+from src.engine.events import (
+    EventSink, HandStarted, BlindPosted, CardsDealt, TurnStarted, ActionTaken, ExchangeStarted,
+    CardsExchanged, ExchangeFinished, ShowdownStarted, ShowdownHand, ShowdownResult, SidePot, HandFinished, HistorySaved
+)
+from src.engine.pots import side_pots
+from src.engine.sinks import ConsoleSink, HistorySink, MetricsSink
 
 class GameEngine:
-    def __init__(self, players: List[Player], history_logger: HistoryLogger, small_blind: int = 25, big_blind: int = 50, game_id: str = None, dealer_pos: int = -1):
+    def __init__(self, players: List[Player], history_logger: HistoryLogger, small_blind: int = 25, big_blind: int = 50, game_id: str = None, dealer_pos: int = -1, seed: int = None,
+                 policies: Dict[int, Policy] = None, default_policy: Policy = None, headless: bool = False, metrics: Metrics = None,
+                 sinks: List[EventSink] = None, forked_from: Dict[str, str] = None):
         self.players = players
         self.history_logger = history_logger
-        self.deck = Deck()
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.rng = random.Random(self.seed)
+        self.deck = Deck(self.rng)
         self.small_blind = small_blind
         self.big_blind = big_blind
         self.pot = 0
+        # Stan rozdania aktualizowany przy każdej akcji: wkłady miejsc do puli, liczba graczy w grze
+        # i liczba graczy bez żetonów (all-in).
+        self._contributed: List[int] = []
+        self._live_count = 0
+        self._all_in_count = 0
         self.game_id = game_id if game_id else str(uuid.uuid4())
+        # Gra wznowiona z historii innej gry: {"game_id", "hand_id"} rozdania, po którym nastąpiło rozgałęzienie.
+        self.forked_from = forked_from
         self.dealer_pos = dealer_pos
         self.round_counter = 0
+        self.headless = headless
+        self.verbose = not headless
+        self.policies = policies if policies is not None else {}
+        self.default_policy = default_policy if default_policy is not None else EquityBotPolicy()
+        self.console_policy = ConsolePolicy()
+        self.metrics = metrics
+        self.sinks: List[EventSink] = []
+        self._routes: Dict[type, list] = {}
+        if self.verbose:
+            self.add_sink(ConsoleSink())
+        if history_logger is not None:
+            self.add_sink(HistorySink(history_logger))
+        if metrics is not None:
+            self.add_sink(MetricsSink(metrics))
+        for sink in sinks or ():
+            self.add_sink(sink)
 
     def get_session_data(self) -> Dict[str, Any]:
         player_data = [
-            {"name": p.name, "stack": p.stack, "is_human": p.is_human}
+            {"id": p.id, "name": p.name, "stack": p.stack, "is_human": p.is_human}
             for p in self.players
         ]
-        return {
+        # Generator rozdania jest co rundę ustawiany z (seed, round_counter), więc te dwie wartości
+        # w pełni opisują stan losowości stołu.
+        session_data = {
             "game_id": self.game_id,
             "small_blind": self.small_blind,
             "big_blind": self.big_blind,
             "dealer_pos": self.dealer_pos,
+            "round_counter": self.round_counter,
+            "seed": self.seed,
             "players": player_data
         }
+        if self.forked_from is not None:
+            session_data["forked_from"] = self.forked_from
+        return session_data
+
+    @classmethod
+    def from_session_data(cls, session_data: Dict[str, Any], history_logger: HistoryLogger, **kwargs) -> 'GameEngine':
+        players = [
+            Player(id=p_data.get("id", i), name=p_data["name"], stack=p_data["stack"], is_human=p_data["is_human"])
+            for i, p_data in enumerate(session_data["players"])
+        ]
+        game = cls(
+            players=players,
+            history_logger=history_logger,
+            small_blind=session_data["small_blind"],
+            big_blind=session_data["big_blind"],
+            game_id=session_data["game_id"],
+            dealer_pos=session_data.get("dealer_pos", -1),
+            seed=session_data.get("seed"),
+            forked_from=session_data.get("forked_from"),
+            **kwargs
+        )
+        game.round_counter = session_data.get("round_counter", 0)
+        return game
+
+    def add_sink(self, sink: EventSink) -> None:
+        self.sinks.append(sink)
+        routes: Dict[type, list] = {}
+        for registered in self.sinks:
+            for event_type in registered.interests:
+                routes.setdefault(event_type, []).append(registered)
+        self._routes = routes
 
-    def _post_blinds(self, hand_history: Dict[str, Any]):
+    def _emit(self, event: NamedTuple) -> None:
+        for sink in self._routes[type(event)]:
+            sink.handle(event)
+
+    def _post_blinds(self):
         num_players = len(self.players)
-        sb_player = self.players[(self.dealer_pos + 1) % num_players]
-        bb_player = self.players[(self.dealer_pos + 2) % num_players]
+        sb_seat = (self.dealer_pos + 1) % num_players
+        bb_seat = (self.dealer_pos + 2) % num_players
+        sb_player = self.players[sb_seat]
+        bb_player = self.players[bb_seat]
         
         sb_amount = min(self.small_blind, sb_player.stack)
         sb_player.stack -= sb_amount
         sb_player.bet_in_round = sb_amount
+        self._contributed[sb_seat] += sb_amount
+        if sb_amount and sb_player.stack == 0: self._all_in_count += 1
         self.pot += sb_amount
-        print(f"{sb_player.name} wnosi małą w ciemno: {sb_amount}.")
-        hand_history['bets'].append({
-            "stage": "blinds", "player_id": sb_player.id, "action": "BLIND", "amount": sb_amount
-        })
+        if BlindPosted in self._routes: self._emit(BlindPosted(sb_player.id, sb_player.name, "small", sb_amount))
 
         bb_amount = min(self.big_blind, bb_player.stack)
         bb_player.stack -= bb_amount
         bb_player.bet_in_round = bb_amount
+        self._contributed[bb_seat] += bb_amount
+        if bb_amount and bb_player.stack == 0: self._all_in_count += 1
         self.pot += bb_amount
-        print(f"{bb_player.name} wnosi dużą w ciemno: {bb_amount}.")
-        hand_history['bets'].append({
-            "stage": "blinds", "player_id": bb_player.id, "action": "BLIND", "amount": bb_amount
-        })
-        hand_history['pot'] = self.pot
+        if BlindPosted in self._routes: self._emit(BlindPosted(bb_player.id, bb_player.name, "big", bb_amount))
     
-    def _betting_round(self, stage_name: str, hand_history: Dict[str, Any]):
+    def _betting_round(self, stage_name: str):
+        players = self.players
+        num_players = len(players)
         if stage_name == 'pre-exchange':
             current_bet = self.big_blind
-            start_pos = (self.dealer_pos + 3) % len(self.players)
+            start_pos = (self.dealer_pos + 3) % num_players
         else:
             current_bet = 0
-            for p in self.players: p.bet_in_round = 0
-            start_pos = (self.dealer_pos + 1) % len(self.players)
-        
-        last_raiser = None
-        turn_pos = start_pos
+            for p in players: p.bet_in_round = 0
+            start_pos = (self.dealer_pos + 1) % num_players
         
-        if len([p for p in self.players if p.is_active]) <= 1: return
+        if self._live_count <= 1: return
 
-        active_players_in_round = [p for p in self.players if p.is_active]
-        player_to_act = len(active_players_in_round)
+        # Kolejka miejsc graczy, którzy mogą jeszcze działać (w grze i z żetonami): gracz po akcji wraca na jej koniec,
+        # a to_act mówi, ilu graczy z kolejki musi jeszcze zadecydować.
+        order = [*range(start_pos, num_players), *range(start_pos)]
+        ring = deque([seat for seat in order if players[seat].is_active and players[seat].stack > 0])
+        to_act = len(ring)
+        routes = self._routes
+        contributed = self._contributed
         
-        while player_to_act > 0:
-            player = self.players[turn_pos]
+        while to_act > 0:
+            seat = ring.popleft()
+            player = players[seat]
+            if TurnStarted in routes:
+                cards = list(player.hand) if player.is_human else None
+                self._emit(TurnStarted(player.id, player.name, player.stack, self.pot, current_bet, cards))
             
+            action, amount = self.prompt_action(player, current_bet)
+            
+            if action == 'fold':
+                player.fold()
+                self._live_count -= 1
+            elif action == 'call' or action == 'raise':
+                player.stack -= amount
+                self.pot += amount
+                player.bet_in_round += amount
+                contributed[seat] += amount
+                if amount and player.stack == 0: self._all_in_count += 1
             if player.is_active and player.stack > 0:
-                print(f"\nPula: {self.pot} | Aktualna stawka: {current_bet}")
-                print(f"Tura: {player.name} (Stos: {player.stack})")
-                if player.is_human: print(f"Twoje karty: {player.cards_to_str()}")
-                
-                action, amount = self.prompt_action(player, current_bet)
-                hand_history['bets'].append({"stage": stage_name, "player_id": player.id, "action": action, "amount": amount})
-
-                if action == 'fold': player.fold()
-                elif action == 'call':
-                    player.stack -= amount
-                    self.pot += amount
-                    player.bet_in_round += amount
-                    print(f"{player.name} wyrównuje o {amount}.")
-                elif action == 'raise':
-                    player.stack -= amount
-                    self.pot += amount
-                    player.bet_in_round += amount
-                    current_bet = player.bet_in_round
-                    last_raiser = player
-                    print(f"{player.name} przebija do {current_bet}.")
-                    player_to_act = len([p for p in self.players if p.is_active])
-                elif action == 'check':
-                    print(f"{player.name} czeka.")
+                ring.append(seat)
+            if ActionTaken in routes:
+                self._emit(ActionTaken(stage_name, player.id, player.name, action, amount, player.bet_in_round))
 
-            turn_pos = (turn_pos + 1) % len(self.players)
-            player_to_act -= 1
-
-            if player_to_act <= 0 and last_raiser is not None:
-                bets_equalized = all(p.bet_in_round == current_bet or not p.is_active for p in self.players)
-                if not bets_equalized:
-                    player_to_act = len([p for p in self.players if p.is_active and p.bet_in_round < current_bet])
+            if action == 'raise':
+                current_bet = player.bet_in_round
+                # Po przebiciu każdy pozostały gracz z kolejki działa jeszcze raz.
+                to_act = len(ring) - (player.stack > 0)
+            else:
+                to_act -= 1
 
 
-    def _exchange_cards_phase(self, hand_history: Dict[str, Any]):
-        print("\n--- Faza Wymiany Kart ---")
-        hand_history['discards'] = {}
+    def _exchange_cards_phase(self):
+        routes = self._routes
+        if ExchangeStarted in routes: self._emit(ExchangeStarted())
         for player in [p for p in self.players if p.is_active]:
-            indices = []
-            if player.is_human:
-                while True:
-                    try:
-                        indices_str = input(f"Wybierz indeksy do wymiany (0-4) rozdzielajac spacja dla {player.name}: ")
-                        indices = [] if not indices_str else [int(i) for i in indices_str.split()]
-                        if len(indices) > 4: raise ValueError("Można wymienić maks. 4 karty.")
-                        break
-                    except (ValueError, IndexError) as e: print(f"Błąd: {e}")
-            else:
-                if hand_rank(player.hand)[0] < 1:
-                    indices = random.sample(range(5), k=random.randint(1,4))
-
-            old_cards_str = [str(player.hand[i]) for i in indices]
-            hand_history['discards'][str(player.id)] = old_cards_str
-            
+            indices = self.policy_for(player).choose_discards(self, player)
+            if CardsExchanged in routes:
+                self._emit(CardsExchanged(player.id, player.name, [player.hand[i] for i in indices]))
             self._exchange_cards(player, indices)
-            print(f"{player.name} wymienia {len(indices)} kart.")
         
-        hand_history['final_hands'] = {
-            str(p.id): [str(c) for c in p.hand] for p in self.players if p.is_active
-        }
+        if ExchangeFinished in routes:
+            self._emit(ExchangeFinished({p.id: list(p.hand) for p in self.players if p.is_active}))
 
     def play_round(self):
+        metrics = self.metrics
+        routes = self._routes
+        if metrics is not None:
+            hand_start = mark = time.perf_counter()
         self.round_counter += 1
         hand_id = f"round_{self.round_counter}"
-        print(f"\n" + "="*20 + f" Nowa Runda ({hand_id}) " + "="*20)
-
-        hand_history = {
-            "game_id": self.game_id, "hand_id": hand_id, "timestamp": datetime.now().isoformat(),
-            "players": [{"id": p.id, "name": p.name, "initial_stack": p.stack} for p in self.players],
-            "bets": [], "blinds": {"small": self.small_blind, "big": self.big_blind}
-        }
+        hand_seed = (self.seed << 32) + self.round_counter
+        players_at_start = tuple((p.id, p.name, p.stack) for p in self.players) if HandStarted in routes else None
 
         self.dealer_pos = (self.dealer_pos + 1) % len(self.players)
         self.pot = 0
+        self._contributed = [0] * len(self.players)
+        self._live_count = len(self.players)
+        self._all_in_count = 0
         for p in self.players:
             p.is_active = True
             p.bet_in_round = 0
             p.hand.clear()
+            # Gracz bez żetonów siedzi przy stole jak gracz all-in, który nic nie wniósł do puli.
+            if p.stack == 0: self._all_in_count += 1
         
-        self.deck = Deck()
-        self.deck.shuffle()
-        hand_history['deck'] = [str(c) for c in self.deck.cards]
+        self.rng.seed(hand_seed)
+        self.deck.reset()
+        self.deck.shuffle(9 * len(self.players))
+        if HandStarted in routes:
+            self._emit(HandStarted(self.game_id, hand_id, datetime.now().isoformat(), players_at_start,
+                                   self.small_blind, self.big_blind, hand_seed, self.deck.cards[self.deck.position:]))
+        if metrics is not None: mark = self._lap("shuffle", mark)
         
-        self._post_blinds(hand_history)
+        self._post_blinds()
+        if metrics is not None: mark = self._lap("post_blinds", mark)
         
         self.deck.deal(self.players, 5)
-        hand_history['initial_hands'] = {p.id: [str(c) for c in p.hand] for p in self.players}
+        if CardsDealt in routes: self._emit(CardsDealt({p.id: list(p.hand) for p in self.players}))
+        if metrics is not None: mark = self._lap("deal", mark)
 
-        self._betting_round('pre-exchange', hand_history)
+        self._betting_round('pre-exchange')
+        if metrics is not None: mark = self._lap("betting_round", mark)
         
-        if len([p for p in self.players if p.is_active]) > 1:
-            self._exchange_cards_phase(hand_history)
+        if self._live_count > 1:
+            self._exchange_cards_phase()
+            if metrics is not None: mark = self._lap("exchange_cards", mark)
         
-        winner = self._showdown()
-        if winner:
-            print(f"\nZwycięzca: {winner.name}, otrzymuje {self.pot} żetonów.")
-            winner.stack += self.pot
-            hand_history['winner'] = {"player_id": winner.id, "pot_won": self.pot}
-        else:
-            print("Brak zwycięzcy w tej rundzie.")
+        awards = self._showdown()
+        for amount, pot_winner, _ in awards:
+            pot_winner.stack += amount
+        if ShowdownResult in routes:
+            self._emit(self._showdown_result(awards))
+        if metrics is not None: mark = self._lap("showdown", mark)
 
-        hand_history['final_player_state'] = [
-            {"id": p.id, "name": p.name, "final_stack": p.stack} for p in self.players
-        ]
+        if HandFinished in routes:
+            self._emit(HandFinished(hand_id, tuple((p.id, p.name, p.stack) for p in self.players)))
+        if self.history_logger is not None:
+            if HistorySaved in routes: self._emit(HistorySaved(hand_id))
+            # W trybie 'json' to pełny zapis pliku, w trybach dziennika tylko przekazanie do kolejki; sam zapis
+            # mierzy wątek HistoryLogger jako "history_write".
+            if metrics is not None: mark = self._lap("history_save", mark)
+
+        if metrics is not None:
+            metrics.incr("hands")
+            metrics.observe_hand(mark - hand_start)
 
-        self.history_logger.save_hand_history(hand_history)
-        print(f"Historia rozdania '{hand_id}' została zapisana.")
+    def _lap(self, phase: str, mark: float) -> float:
+        now = time.perf_counter()
+        self.metrics.add_time(phase, now - mark)
+        return now
     
-    def _showdown(self) -> Player:
-        active_players = [p for p in self.players if p.is_active]
-        if not active_players: return None
-        if len(active_players) == 1: return active_players[0]
-        print("\n--- Wyłożenie Kart (Showdown) ---")
-        best_rank = (-1,)
-        winner = None
-        for player in active_players:
-            rank = hand_rank(player.hand)
-            print(f"{player.name} ma: {player.cards_to_str()} (Układ: {rank})")
-            if rank > best_rank:
-                best_rank = rank
-                winner = player
-        return winner
+    def _showdown(self) -> List[tuple]:
+        players = self.players
+        if self._live_count == 0: return []
+        if self._live_count == 1:
+            player = next(p for p in players if p.is_active)
+            return [(self.pot, player, None)]
+        routes = self._routes
+        if ShowdownStarted in routes: self._emit(ShowdownStarted())
+        scores = {}
+        for seat, player in enumerate(players):
+            if player.is_active:
+                scores[seat] = evaluate(player.hand)
+                if ShowdownHand in routes: self._emit(ShowdownHand(player.id, player.name, list(player.hand), scores[seat]))
+        # Bez graczy all-in wszyscy w grze wyrównali stawkę, więc jest tylko jedna pula.
+        if self._all_in_count:
+            pots = side_pots(self._contributed, [p.is_active for p in players])
+        else:
+            pots = [(self.pot, list(scores))]
+        # Każdą pulę wygrywa najlepsza ręka spośród uprawnionych; przy remisie gracz wcześniej w kolejności.
+        awards = []
+        for amount, eligible in pots:
+            best_seat = eligible[0]
+            for seat in eligible:
+                if scores[seat] > scores[best_seat]:
+                    best_seat = seat
+            awards.append((amount, players[best_seat], eligible))
+        return awards
+
+    def _showdown_result(self, awards: List[tuple]) -> ShowdownResult:
+        if not awards:
+            return ShowdownResult(None, None, self.pot)
+        winner = awards[0][1]
+        won = sum(amount for amount, pot_winner, _ in awards if pot_winner is winner)
+        if len(awards) == 1:
+            return ShowdownResult(winner.id, winner.name, won)
+        players = self.players
+        pots = tuple(SidePot(amount, pot_winner.id, pot_winner.name, tuple(players[seat].id for seat in eligible))
+                     for amount, pot_winner, eligible in awards)
+        return ShowdownResult(winner.id, winner.name, won, pots)
 
     def _exchange_cards(self, player: Player, indices: List[int]):
         for idx in sorted(indices, reverse=True):
@@ -207,57 +310,29 @@ class GameEngine:
         for _ in indices:
             player.take_card(self.deck.draw())
 
-    def prompt_action(self, player: Player, current_bet: int) -> tuple[str, int]:
-        if player.is_human:
-            return self._prompt_human_action(player, current_bet)
-        else:
-            return self._get_bot_action(player, current_bet)
+    def policy_for(self, player: Player) -> Policy:
+        policy = self.policies.get(player.id)
+        if policy is not None:
+            return policy
+        if player.is_human and not self.headless:
+            return self.console_policy
+        return self.default_policy
 
-    def _prompt_human_action(self, player: Player, current_bet: int) -> tuple[str, int]:
-        to_call = current_bet - player.bet_in_round
-        valid_actions = ['fold']
-        if to_call == 0:
-            valid_actions.append('check')
-        else:
-            valid_actions.append(f'call ({to_call})')
-        if player.stack > to_call:
-            valid_actions.append('raise')
-        valid_actions_str = ', '.join(valid_actions)
-        while True:
-            action_str = input(f"Wybierz akcję [{valid_actions_str}]: ").lower().strip()
-            if action_str == 'fold': return 'fold', 0
-            if action_str == 'check' and to_call == 0: return 'check', 0
-            if action_str == 'call' and to_call > 0:
-                return 'call', min(to_call, player.stack)
-            if action_str == 'raise' and player.stack > to_call:
-                min_raise = current_bet + to_call if current_bet > 0 else self.big_blind
-                max_raise = player.stack + player.bet_in_round
-                try:
-                    raise_amount = int(input(f"Wprowadź całkowitą kwotę zakładu (min {min_raise}, max {max_raise}): "))
-                    if not (min_raise <= raise_amount <= max_raise):
-                        raise InvalidActionError(f"Kwota musi być pomiędzy {min_raise} a {max_raise}.")
-                    amount_to_add = raise_amount - player.bet_in_round
-                    if amount_to_add > player.stack:
-                        raise InsufficientFundsError("Niewystarczające środki.")
-                    return 'raise', amount_to_add
-                except ValueError:
-                    print("Nieprawidłowa kwota. Proszę podać liczbę.")
-                    continue
-            print("Nieprawidłowa akcja. Wybierz jedną z dostępnych opcji.")
+    def prompt_action(self, player: Player, current_bet: int) -> tuple[str, int]:
+        return self.policy_for(player).choose_action(self, player, current_bet)
 
-    def _get_bot_action(self, player: Player, current_bet: int) -> tuple[str, int]:
-        to_call = current_bet - player.bet_in_round
-        if to_call > 0:
-            if random.random() < 0.8 and player.stack >= to_call:
-                return 'call', min(to_call, player.stack)
-            else:
-                return 'fold', 0
-        else:
-            if random.random() < 0.7 or player.stack <= self.big_blind:
-                return 'check', 0
-            else:
-                raise_amount = self.big_blind * 2 - player.bet_in_round
-                if player.stack > raise_amount:
-                     return 'raise', raise_amount
-                else:
-                     return 'check', 0
+    def simulate(self, n_hands: int) -> Dict[str, Any]:
+        hands_played = 0
+        start = time.perf_counter()
+        for _ in range(n_hands):
+            self.players = [p for p in self.players if p.stack > 0]
+            if len(self.players) < 2:
+                break
+            self.play_round()
+            hands_played += 1
+        elapsed = time.perf_counter() - start
+        return {
+            "hands": hands_played,
+            "seconds": elapsed,
+            "hands_per_second": hands_played / elapsed if elapsed > 0 else 0.0
+        }
@@ -0,0 +1,223 @@
+from abc import ABC, abstractmethod
+from typing import List
+from src.logic.player import Player
+from src.logic.hand_evaluator import evaluate, score_category
+from src.logic.discard_table import DiscardTable, load_discard_table
+from src.logic.draw_outcomes import CATEGORY_NAMES, draw_outcomes
+from src.logic.equity import EquityEngine
+from src.logic.percentile_table import PercentileTable, load_percentile_table
+from src.logic.strategy_table import CALLED, CALL_RAISED, INFOSET_ACTIONS, RAISED, ROOT, StrategyTable, load_strategy_table
+from src.utils.exceptions import InsufficientFundsError, InvalidActionError
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.engine.game_engine import GameEngine
+
+# Mniej więcej połowa wszystkich układów to sama wysoka karta.
+WEAK_HAND_PERCENTILE = 0.5
+
+
+class Policy(ABC):
+    @abstractmethod
+    def choose_action(self, engine: 'GameEngine', player: Player, current_bet: int) -> tuple[str, int]:
+        ...
+
+    @abstractmethod
+    def choose_discards(self, engine: 'GameEngine', player: Player) -> List[int]:
+        ...
+
+
+class RandomBotPolicy(Policy):
+    def __init__(self, discard_table: DiscardTable = None, percentile_table: PercentileTable = None):
+        self.discard_table = discard_table if discard_table is not None else load_discard_table()
+        self.percentile_table = percentile_table if percentile_table is not None else load_percentile_table()
+
+    def choose_action(self, engine: 'GameEngine', player: Player, current_bet: int) -> tuple[str, int]:
+        rng = engine.rng
+        to_call = current_bet - player.bet_in_round
+        if to_call > 0:
+            if rng.random() < 0.8 and player.stack >= to_call:
+                return 'call', min(to_call, player.stack)
+            else:
+                return 'fold', 0
+        else:
+            if rng.random() < 0.7 or player.stack <= engine.big_blind:
+                return 'check', 0
+            else:
+                raise_amount = engine.big_blind * 2 - player.bet_in_round
+                if player.stack > raise_amount:
+                     return 'raise', raise_amount
+                else:
+                     return 'check', 0
+
+    def choose_discards(self, engine: 'GameEngine', player: Player) -> List[int]:
+        if self.discard_table is not None:
+            return self.discard_table.best_discards(player.hand)
+        if self.percentile_table is not None:
+            weak = self.percentile_table.percentile(player.hand) < WEAK_HAND_PERCENTILE
+        else:
+            weak = score_category(evaluate(player.hand)) < 1
+        if weak:
+            return engine.rng.sample(range(5), k=engine.rng.randint(1,4))
+        return []
+
+
+class PercentileBotPolicy(RandomBotPolicy):
+    def __init__(self, percentile_table: PercentileTable = None, discard_table: DiscardTable = None,
+                 raise_margin: float = 1.5):
+        super().__init__(discard_table, percentile_table)
+        self.raise_margin = raise_margin
+
+    def choose_action(self, engine: 'GameEngine', player: Player, current_bet: int) -> tuple[str, int]:
+        if self.percentile_table is None:
+            return super().choose_action(engine, player, current_bet)
+        opponents = sum(1 for p in engine.players if p.is_active and p is not player)
+        # Szansa pokonania wszystkich rywali, jeśli każdy z nich ma losową rękę po wymianie.
+        equity = self.percentile_table.draw_percentile(player.hand) ** opponents
+        to_call = current_bet - player.bet_in_round
+        if to_call > 0:
+            if player.stack >= to_call and equity * (engine.pot + to_call) >= to_call:
+                return 'call', to_call
+            return 'fold', 0
+        raise_amount = engine.big_blind * 2 - player.bet_in_round
+        if equity * (opponents + 1) > self.raise_margin and player.stack > raise_amount > 0:
+            return 'raise', raise_amount
+        return 'check', 0
+
+
+class EquityBotPolicy(RandomBotPolicy):
+    def __init__(self, equity_engine: EquityEngine = None, budget_ms: float = 5.0, raise_margin: float = 1.5,
+                 trials: int = 64):
+        super().__init__()
+        self.equity_engine = equity_engine if equity_engine is not None else EquityEngine(discard_table=self.discard_table)
+        self.budget_ms = budget_ms
+        self.raise_margin = raise_margin
+        self.trials = trials
+
+    def choose_action(self, engine: 'GameEngine', player: Player, current_bet: int) -> tuple[str, int]:
+        opponents = sum(1 for p in engine.players if p.is_active and p is not player)
+        # Licytacja odbywa się tylko przed wymianą, więc gracz nie zna jeszcze żadnych odrzuconych kart.
+        # Wynik dla ręki i liczby rywali zależy tylko od seeda gry i liczby prób, więc ta sama gra daje te same
+        # decyzje, a powtórzone ręce korzystają z pamięci podręcznej. budget_ms ogranicza czas decyzji; jeśli
+        # przerwie próby przed limitem trials, wpis jest uzupełniany przy kolejnych decyzjach, kosztem powtarzalności.
+        estimate = self.equity_engine.estimate(player.hand, opponents, self.budget_ms, max_trials=self.trials,
+                                               seed=engine.seed)
+        to_call = current_bet - player.bet_in_round
+        if to_call > 0:
+            if player.stack >= to_call and estimate.equity * (engine.pot + to_call) >= to_call:
+                return 'call', to_call
+            return 'fold', 0
+        raise_amount = engine.big_blind * 2 - player.bet_in_round
+        if estimate.low * (opponents + 1) > self.raise_margin and player.stack > raise_amount > 0:
+            return 'raise', raise_amount
+        return 'check', 0
+
+
+class CFRBotPolicy(RandomBotPolicy):
+    def __init__(self, strategy_table: StrategyTable = None, discard_table: DiscardTable = None):
+        super().__init__(discard_table)
+        self.strategy_table = strategy_table if strategy_table is not None else load_strategy_table()
+
+    def _infoset(self, engine: 'GameEngine', player: Player, current_bet: int) -> int:
+        # Stół wieloosobowy sprowadzany jest do abstrakcji heads-up, w której strategia była trenowana.
+        if current_bet == player.bet_in_round:
+            return CALLED
+        if current_bet <= engine.big_blind:
+            return ROOT
+        # Wobec przebicia rozróżnia rolę gracza: kto wcześniej wyrównał (mały blind po limpie), odpowiada
+        # z CALL_RAISED, a duży blind, którego wkład to tylko wpłacona stawka, odpowiada z RAISED.
+        big_blind_player = engine.players[(engine.dealer_pos + 2) % len(engine.players)]
+        limped = player.bet_in_round > engine.big_blind or (player.bet_in_round == engine.big_blind
+                                                            and player is not big_blind_player)
+        return CALL_RAISED if limped else RAISED
+
+    def choose_action(self, engine: 'GameEngine', player: Player, current_bet: int) -> tuple[str, int]:
+        if self.strategy_table is None:
+            return super().choose_action(engine, player, current_bet)
+        infoset = self._infoset(engine, player, current_bet)
+        weights = self.strategy_table.probabilities(infoset, self.strategy_table.bucket(player.hand))
+        draw = engine.rng.random() * (sum(weights) or 1)
+        action = INFOSET_ACTIONS[infoset][-1]
+        for name, weight in zip(INFOSET_ACTIONS[infoset], weights):
+            if draw < weight:
+                action = name
+                break
+            draw -= weight
+        to_call = current_bet - player.bet_in_round
+        if action == 'raise':
+            raise_amount = engine.big_blind * 2 - player.bet_in_round
+            if raise_amount > to_call and player.stack > raise_amount:
+                return 'raise', raise_amount
+            action = 'call' if to_call > 0 else 'check'
+        if action == 'fold':
+            return 'fold', 0
+        if to_call > 0:
+            return 'call', min(to_call, player.stack)
+        return 'check', 0
+
+
+class CheckDownPolicy(Policy):
+    def __init__(self, discard_table: DiscardTable = None, draw: bool = True):
+        self.discard_table = (discard_table if discard_table is not None else load_discard_table()) if draw else None
+
+    def choose_action(self, engine: 'GameEngine', player: Player, current_bet: int) -> tuple[str, int]:
+        to_call = current_bet - player.bet_in_round
+        if to_call > 0:
+            return 'call', min(to_call, player.stack)
+        return 'check', 0
+
+    def choose_discards(self, engine: 'GameEngine', player: Player) -> List[int]:
+        if self.discard_table is None:
+            return []
+        return self.discard_table.best_discards(player.hand)
+
+
+class ConsolePolicy(Policy):
+    def choose_action(self, engine: 'GameEngine', player: Player, current_bet: int) -> tuple[str, int]:
+        to_call = current_bet - player.bet_in_round
+        valid_actions = ['fold']
+        if to_call == 0:
+            valid_actions.append('check')
+        else:
+            valid_actions.append(f'call ({to_call})')
+        if player.stack > to_call:
+            valid_actions.append('raise')
+        valid_actions_str = ', '.join(valid_actions)
+        while True:
+            action_str = input(f"Wybierz akcję [{valid_actions_str}]: ").lower().strip()
+            if action_str == 'fold': return 'fold', 0
+            if action_str == 'check' and to_call == 0: return 'check', 0
+            if action_str == 'call' and to_call > 0:
+                return 'call', min(to_call, player.stack)
+            if action_str == 'raise' and player.stack > to_call:
+                min_raise = current_bet + to_call if current_bet > 0 else engine.big_blind
+                max_raise = player.stack + player.bet_in_round
+                try:
+                    raise_amount = int(input(f"Wprowadź całkowitą kwotę zakładu (min {min_raise}, max {max_raise}): "))
+                    if not (min_raise <= raise_amount <= max_raise):
+                        raise InvalidActionError(f"Kwota musi być pomiędzy {min_raise} a {max_raise}.")
+                    amount_to_add = raise_amount - player.bet_in_round
+                    if amount_to_add > player.stack:
+                        raise InsufficientFundsError("Niewystarczające środki.")
+                    return 'raise', amount_to_add
+                except ValueError:
+                    print("Nieprawidłowa kwota. Proszę podać liczbę.")
+                    continue
+            print("Nieprawidłowa akcja. Wybierz jedną z dostępnych opcji.")
+
+    def choose_discards(self, engine: 'GameEngine', player: Player) -> List[int]:
+        while True:
+            try:
+                indices_str = input(f"Wybierz indeksy do wymiany (0-4) rozdzielajac spacja dla {player.name} "
+                                    f"('?' przed indeksami pokazuje szanse układów): ")
+                hint = indices_str.startswith('?')
+                if hint:
+                    indices_str = indices_str[1:].strip()
+                indices = [] if not indices_str else [int(i) for i in indices_str.split()]
+                if len(indices) > 4: raise ValueError("Można wymienić maks. 4 karty.")
+                if not hint:
+                    return indices
+                # Wymiana jest jedyna w rozdaniu, a karty odrzucone przez rywali są zakryte, więc gracz nie zna
+                # żadnych kart spoza własnej ręki.
+                outcome = draw_outcomes(player.hand, indices, ())
+                print(', '.join(f"{CATEGORY_NAMES[category]} {p:.1%}" for category, p in enumerate(outcome.probabilities()) if p))
+            except (ValueError, IndexError) as e: print(f"Błąd: {e}")
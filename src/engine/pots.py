@@ -0,0 +1,18 @@
+from typing import List, Sequence, Tuple
+
+
+def side_pots(contributions: Sequence[int], live: Sequence[bool]) -> List[Tuple[int, List[int]]]:
+    # Pula główna i pule boczne jako (kwota, miejsca uprawnionych), od najniższego poziomu wkładu.
+    # Nadwyżka wkładów ponad najwyższy wkład gracza w grze trafia do ostatniej puli.
+    seats = range(len(contributions))
+    levels = sorted({contributions[seat] for seat in seats if live[seat] and contributions[seat] > 0})
+    if not levels:
+        return [(sum(contributions), [seat for seat in seats if live[seat]])]
+    pots = []
+    previous = 0
+    for i, level in enumerate(levels):
+        cap = level if i < len(levels) - 1 else max(contributions)
+        amount = sum(min(c, cap) - min(c, previous) for c in contributions)
+        pots.append((amount, [seat for seat in seats if live[seat] and contributions[seat] >= level]))
+        previous = level
+    return pots
@@ -0,0 +1,192 @@
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from src.logic.card import card_from_str
+from src.logic.hand_evaluator import evaluate
+from src.logic.player import Player
+from src.fileops.history_logger import HistoryLogger
+from src.engine.game_engine import GameEngine
+from src.engine.pots import side_pots
+
+
+class ReplayStep(NamedTuple):
+    history: dict
+    stacks: Dict[int, int]
+    errors: List[str]
+
+
+def _cards(cards: Iterable[str]) -> List[int]:
+    return [card_from_str(card) for card in cards]
+
+
+def check_hand(history: dict, expected_stacks: Optional[Dict[int, int]] = None) -> Tuple[Dict[int, int], List[str]]:
+    errors = []
+    players = history["players"]
+    ids = [p["id"] for p in players]
+    stacks = {p["id"]: p["initial_stack"] for p in players}
+    if expected_stacks is not None:
+        for player_id in ids:
+            if player_id in expected_stacks and expected_stacks[player_id] != stacks[player_id]:
+                errors.append(f"gracz {player_id}: stos początkowy {stacks[player_id]}, oczekiwano {expected_stacks[player_id]}")
+
+    deck = _cards(history["deck"]) if "deck" in history else None
+    if deck is not None and sorted(deck) != list(range(52)):
+        errors.append("talia nie jest permutacją 52 kart")
+        deck = None
+
+    initial_hands = {int(k): _cards(v) for k, v in history.get("initial_hands", {}).items()}
+    position = 5 * len(players)
+    if deck is not None:
+        for seat, player_id in enumerate(ids):
+            dealt = [deck[j * len(players) + seat] for j in range(5)]
+            if initial_hands.get(player_id) != dealt:
+                errors.append(f"gracz {player_id}: ręka początkowa nie zgadza się z talią")
+
+    blinds = history.get("blinds", {})
+    blind_bets = [bet for bet in history.get("bets", []) if bet["stage"] == "blinds"]
+    for offset, (bet, size) in enumerate(zip(blind_bets, (blinds.get("small"), blinds.get("big")))):
+        player_id = bet["player_id"]
+        if size is not None and bet.get("amount", 0) != min(size, stacks[player_id]):
+            errors.append(f"gracz {player_id}: blind {bet.get('amount', 0)}, oczekiwano {min(size, stacks[player_id])}")
+        if player_id != ids[(ids.index(blind_bets[0]["player_id"]) + offset) % len(ids)]:
+            errors.append(f"gracz {player_id}: blind wniesiony poza kolejnością")
+
+    contributions = dict.fromkeys(ids, 0)
+    folded = set()
+    for bet in history.get("bets", []):
+        player_id = bet["player_id"]
+        amount = bet.get("amount", 0)
+        if amount < 0 or contributions[player_id] + amount > stacks[player_id]:
+            errors.append(f"gracz {player_id}: nieprawidłowa kwota {amount} ({bet['action']})")
+        contributions[player_id] += amount
+        if bet["action"] == "fold":
+            folded.add(player_id)
+    pot = sum(contributions.values())
+
+    active = [player_id for player_id in ids if player_id not in folded]
+    final_hands = {player_id: initial_hands.get(player_id, []) for player_id in active}
+    if len(active) > 1 and "discards" in history:
+        for player_id in active:
+            discarded = _cards(history["discards"].get(str(player_id), []))
+            kept = [card for card in initial_hands.get(player_id, []) if card not in discarded]
+            if deck is not None:
+                kept += deck[position:position + len(discarded)]
+            position += len(discarded)
+            final_hands[player_id] = kept
+        recorded = {int(k): _cards(v) for k, v in history.get("final_hands", {}).items()}
+        if deck is not None and recorded != final_hands:
+            errors.append("ręce po wymianie nie zgadzają się z talią i odrzuconymi kartami")
+
+    final_stacks = {player_id: stacks[player_id] - contributions[player_id] for player_id in ids}
+    awards = []
+    if len(active) == 1:
+        awards = [(pot, active[0], [active[0]])]
+    elif len(active) > 1:
+        scores = {player_id: evaluate(final_hands[player_id]) for player_id in active}
+        live = [player_id not in folded for player_id in ids]
+        for amount, eligible in side_pots([contributions[player_id] for player_id in ids], live):
+            eligible = [ids[seat] for seat in eligible]
+            pot_winner = eligible[0]
+            for player_id in eligible:
+                if scores[player_id] > scores[pot_winner]:
+                    pot_winner = player_id
+            awards.append((amount, pot_winner, eligible))
+    for amount, pot_winner, _ in awards:
+        final_stacks[pot_winner] += amount
+
+    winner_id = awards[0][1] if awards else None
+    recorded_winner = history.get("winner")
+    if recorded_winner is None:
+        if winner_id is not None:
+            errors.append(f"brak zapisanego zwycięzcy, oczekiwano gracza {winner_id}")
+    elif recorded_winner["player_id"] != winner_id:
+        errors.append(f"zwycięzca {recorded_winner['player_id']}, oczekiwano {winner_id}")
+    else:
+        won = sum(amount for amount, pot_winner, _ in awards if pot_winner == winner_id)
+        if recorded_winner["pot_won"] != won:
+            errors.append(f"wygrana pula {recorded_winner['pot_won']}, oczekiwano {won}")
+    expected_pots = [{"amount": amount, "winner_id": pot_winner, "eligible": eligible} for amount, pot_winner, eligible in awards]
+    if history.get("side_pots", []) != (expected_pots if len(awards) > 1 else []):
+        errors.append("pule boczne nie zgadzają się z wkładami graczy")
+
+    for state in history.get("final_player_state", []):
+        if final_stacks.get(state["id"]) != state["final_stack"]:
+            errors.append(f"gracz {state['id']}: stos końcowy {state['final_stack']}, oczekiwano {final_stacks.get(state['id'])}")
+    return final_stacks, errors
+
+
+class GameReplayer:
+    def __init__(self, history_logger: HistoryLogger, game_id: str):
+        self.history_logger = history_logger
+        self.game_id = game_id
+
+    def hands(self) -> Iterator[dict]:
+        return self.history_logger.iter_hands(self.game_id)
+
+    def replay(self) -> Iterator[ReplayStep]:
+        stacks: Dict[int, int] = {}
+        for history in self.hands():
+            hand_stacks, errors = check_hand(history, stacks)
+            stacks.update(hand_stacks)
+            yield ReplayStep(history, dict(stacks), errors)
+
+    def fast_forward(self, hand_number: int, human_names: Iterable[str] = (), **engine_kwargs) -> GameEngine:
+        target = f"round_{hand_number}"
+        human_names = set(human_names)
+        for step in self.replay():
+            if step.history["hand_id"] != target:
+                continue
+            history = step.history
+            players = [
+                Player(id=p["id"], name=p["name"], stack=step.stacks[p["id"]], is_human=p["name"] in human_names)
+                for p in history["players"]
+            ]
+            # Pierwszy blind wnosi gracz za rozdającym, więc z niego odtwarzamy pozycję rozdającego.
+            blind_ids = [bet["player_id"] for bet in history.get("bets", []) if bet["stage"] == "blinds"]
+            ids = [p.id for p in players]
+            dealer_pos = (ids.index(blind_ids[0]) - 1) % len(ids) if blind_ids else -1
+            seed = history["seed"] >> 32 if "seed" in history else None
+            game = GameEngine(
+                players=players,
+                history_logger=engine_kwargs.pop("history_logger", self.history_logger),
+                small_blind=history["blinds"]["small"],
+                big_blind=history["blinds"]["big"],
+                # Nowe rozdania nie mogą nadpisać już zapisanych round_{K+1}... tej gry, więc odgałęzienie
+                # dostaje własny identyfikator, a numeracja i ziarna rozdań biegną dalej jak w oryginale.
+                game_id=engine_kwargs.pop("game_id", None),
+                dealer_pos=dealer_pos,
+                seed=seed,
+                forked_from={"game_id": self.game_id, "hand_id": target},
+                **engine_kwargs
+            )
+            game.round_counter = hand_number
+            return game
+        raise ValueError(f"Nie znaleziono rozdania {target} w grze {self.game_id}.")
+
+    def verify(self) -> dict:
+        return verify_corpus(self.hands())
+
+
+def verify_corpus(hands: Iterable[dict], max_reported: int = 20) -> dict:
+    stacks_by_game: Dict[str, Dict[int, int]] = {}
+    checked = 0
+    failed = 0
+    errors = []
+    start = time.perf_counter()
+    for history in hands:
+        game_stacks = stacks_by_game.setdefault(history.get("game_id"), {})
+        hand_stacks, hand_errors = check_hand(history, game_stacks)
+        game_stacks.update(hand_stacks)
+        checked += 1
+        if hand_errors:
+            failed += 1
+            if len(errors) < max_reported:
+                errors.append({"game_id": history.get("game_id"), "hand_id": history.get("hand_id"), "errors": hand_errors})
+    elapsed = time.perf_counter() - start
+    return {
+        "hands": checked,
+        "games": len(stacks_by_game),
+        "failed_hands": failed,
+        "errors": errors,
+        "seconds": elapsed,
+        "hands_per_second": checked / elapsed if elapsed > 0 else 0.0
+    }
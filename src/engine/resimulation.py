@@ -0,0 +1,172 @@
+import itertools
+import os
+import time
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List
+from src.logic.card import card_from_str
+from src.logic.deck import Deck
+from src.logic.player import Player
+from src.engine.game_engine import GameEngine
+from src.engine.policies import Policy
+from src.utils.exceptions import ReplayMismatchError
+
+_COMPARED_FIELDS = ("bets", "initial_hands", "discards", "final_hands", "winner", "side_pots", "final_player_state")
+
+
+class ScriptedDeck(Deck):
+    def __init__(self, order: List[int]):
+        super().__init__()
+        self.order = tuple(order)
+        self.cards = list(self.order)
+
+    def reset(self) -> None:
+        self.cards[:] = self.order
+        self.position = 0
+        self.discards.clear()
+
+    def shuffle(self, num_cards: int = None) -> None:
+        pass
+
+
+class ScriptedPolicy(Policy):
+    def __init__(self, history: dict):
+        self.actions = iter([bet for bet in history.get("bets", []) if bet["stage"] != "blinds"])
+        self.discards = {int(k): [card_from_str(card) for card in v] for k, v in history.get("discards", {}).items()}
+
+    def choose_action(self, engine: 'GameEngine', player: Player, current_bet: int) -> tuple[str, int]:
+        bet = next(self.actions, None)
+        if bet is None:
+            raise ReplayMismatchError(f"silnik oczekuje akcji gracza {player.id}, a zapis się skończył")
+        if bet["player_id"] != player.id:
+            raise ReplayMismatchError(f"silnik oczekuje akcji gracza {player.id}, a zapis zawiera akcję gracza {bet['player_id']}")
+        return bet["action"], bet.get("amount", 0)
+
+    def choose_discards(self, engine: 'GameEngine', player: Player) -> List[int]:
+        if player.id not in self.discards:
+            raise ReplayMismatchError(f"brak zapisanej wymiany gracza {player.id}")
+        try:
+            return [player.hand.index(card) for card in self.discards[player.id]]
+        except ValueError:
+            raise ReplayMismatchError(f"gracz {player.id} odrzuca kartę, której nie ma w ręce")
+
+    def remaining(self) -> int:
+        return sum(1 for _ in self.actions)
+
+
+class _HandCapture:
+    def __init__(self):
+        self.history = None
+
+    def save_hand_history(self, history_data: dict) -> None:
+        self.history = history_data
+
+
+def _normalized(value):
+    if isinstance(value, dict):
+        return {str(k): _normalized(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalized(v) for v in value]
+    return value
+
+
+def resimulate_hand(history: dict) -> List[str]:
+    if "deck" not in history:
+        return ["brak zapisanej talii"]
+    players = [Player(id=p["id"], name=p["name"], stack=p["initial_stack"]) for p in history["players"]]
+    ids = [p.id for p in players]
+    blind_ids = [bet["player_id"] for bet in history.get("bets", []) if bet["stage"] == "blinds"]
+    # play_round przesuwa rozdającego o jedno miejsce przed wniesieniem blindów.
+    dealer_pos = (ids.index(blind_ids[0]) - 2) % len(ids) if blind_ids else -1
+
+    policy = ScriptedPolicy(history)
+    capture = _HandCapture()
+    game = GameEngine(
+        players=players,
+        history_logger=capture,
+        small_blind=history["blinds"]["small"],
+        big_blind=history["blinds"]["big"],
+        game_id=history.get("game_id"),
+        dealer_pos=dealer_pos,
+        seed=0,
+        default_policy=policy,
+        headless=True
+    )
+    game.deck = ScriptedDeck([card_from_str(card) for card in history["deck"]])
+    hand_id = history.get("hand_id", "")
+    number = hand_id.rsplit('_', 1)[-1]
+    game.round_counter = int(number) - 1 if number.isdigit() else 0
+
+    try:
+        game.play_round()
+    except (ReplayMismatchError, ValueError, IndexError) as e:
+        return [f"przerwana symulacja: {e}"]
+
+    errors = []
+    produced = _normalized(capture.history)
+    for field in _COMPARED_FIELDS:
+        if produced.get(field) != _normalized(history.get(field)):
+            errors.append(f"niezgodne pole '{field}'")
+    left = policy.remaining()
+    if left:
+        errors.append(f"silnik nie wykorzystał {left} zapisanych akcji")
+    return errors
+
+
+def resimulate_chunk(hands: List[dict]) -> List[dict]:
+    results = []
+    for history in hands:
+        errors = resimulate_hand(history)
+        results.append({"game_id": history.get("game_id"), "hand_id": history.get("hand_id"), "errors": errors})
+    return results
+
+
+def _chunks(hands: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    hands = iter(hands)
+    while True:
+        chunk = list(itertools.islice(hands, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def resimulate_corpus(hands: Iterable[dict], workers: int = None, chunk_size: int = 256, max_reported: int = 20) -> dict:
+    workers = workers or os.cpu_count() or 1
+    checked = 0
+    failed = 0
+    errors = []
+    start = time.perf_counter()
+
+    def collect(results: List[dict]) -> None:
+        nonlocal checked, failed
+        for result in results:
+            checked += 1
+            if result["errors"]:
+                failed += 1
+                if len(errors) < max_reported:
+                    errors.append(result)
+
+    chunks = _chunks(hands, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            collect(resimulate_chunk(chunk))
+    else:
+        # Pool.imap pobiera wejście bez ograniczeń, więc korpus jest podawany oknami,
+        # żeby w pamięci było naraz najwyżej kilka paczek na proces.
+        window = workers * 4
+        with Pool(processes=workers) as pool:
+            while True:
+                batch = list(itertools.islice(chunks, window))
+                if not batch:
+                    break
+                for results in pool.imap_unordered(resimulate_chunk, batch):
+                    collect(results)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "hands": checked,
+        "failed_hands": failed,
+        "errors": errors,
+        "workers": workers,
+        "seconds": elapsed,
+        "hands_per_second": checked / elapsed if elapsed > 0 else 0.0
+    }
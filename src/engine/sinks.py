@@ -0,0 +1,118 @@
+from typing import NamedTuple
+from src.logic.card import card_to_str
+from src.logic.hand_evaluator import score_to_rank
+from src.fileops.history_logger import HistoryLogger
+from src.utils.metrics import Metrics
+from src.engine.events import (
+    EventSink, HandStarted, BlindPosted, CardsDealt, TurnStarted, ActionTaken, ExchangeStarted,
+    CardsExchanged, ExchangeFinished, ShowdownStarted, ShowdownHand, ShowdownResult, HandFinished, HistorySaved
+)
+
+
+def _cards_to_str(cards) -> str:
+    return ' '.join(card_to_str(card) for card in cards)
+
+
+class ConsoleSink(EventSink):
+    interests = (HandStarted, BlindPosted, TurnStarted, ActionTaken, ExchangeStarted, CardsExchanged,
+                 ShowdownStarted, ShowdownHand, ShowdownResult, HistorySaved)
+
+    def handle(self, event: NamedTuple) -> None:
+        kind = type(event)
+        if kind is HandStarted:
+            print(f"\n" + "="*20 + f" Nowa Runda ({event.hand_id}) " + "="*20)
+        elif kind is BlindPosted:
+            blind = "małą" if event.blind == "small" else "dużą"
+            print(f"{event.name} wnosi {blind} w ciemno: {event.amount}.")
+        elif kind is TurnStarted:
+            print(f"\nPula: {event.pot} | Aktualna stawka: {event.current_bet}")
+            print(f"Tura: {event.name} (Stos: {event.stack})")
+            if event.cards is not None: print(f"Twoje karty: {_cards_to_str(event.cards)}")
+        elif kind is ActionTaken:
+            if event.action == 'fold':
+                print(f"{event.name} pasuje.")
+            elif event.action == 'call':
+                print(f"{event.name} wyrównuje o {event.amount}.")
+            elif event.action == 'raise':
+                print(f"{event.name} przebija do {event.bet_in_round}.")
+            elif event.action == 'check':
+                print(f"{event.name} czeka.")
+        elif kind is ExchangeStarted:
+            print("\n--- Faza Wymiany Kart ---")
+        elif kind is CardsExchanged:
+            print(f"{event.name} wymienia {len(event.discarded)} kart.")
+        elif kind is ShowdownStarted:
+            print("\n--- Wyłożenie Kart (Showdown) ---")
+        elif kind is ShowdownHand:
+            print(f"{event.name} ma: {_cards_to_str(event.cards)} (Układ: {score_to_rank(event.score)})")
+        elif kind is ShowdownResult:
+            if event.winner_id is not None:
+                print(f"\nZwycięzca: {event.name}, otrzymuje {event.pot} żetonów.")
+                for i, side_pot in enumerate(event.side_pots):
+                    label = "Pula główna" if i == 0 else f"Pula boczna {i}"
+                    print(f"{label}: {side_pot.amount} żetonów dla {side_pot.name}.")
+            else:
+                print("Brak zwycięzcy w tej rundzie.")
+        elif kind is HistorySaved:
+            print(f"Historia rozdania '{event.hand_id}' została zapisana.")
+
+
+class HistorySink(EventSink):
+    interests = (HandStarted, BlindPosted, CardsDealt, ActionTaken, ExchangeStarted, CardsExchanged,
+                 ExchangeFinished, ShowdownResult, HandFinished)
+
+    def __init__(self, history_logger: HistoryLogger):
+        self.history_logger = history_logger
+        self.hand_history = None
+
+    def handle(self, event: NamedTuple) -> None:
+        kind = type(event)
+        hand_history = self.hand_history
+        if kind is HandStarted:
+            self.hand_history = {
+                "game_id": event.game_id, "hand_id": event.hand_id, "timestamp": event.timestamp,
+                "players": [{"id": player_id, "name": name, "initial_stack": stack} for player_id, name, stack in event.players],
+                "bets": [], "blinds": {"small": event.small_blind, "big": event.big_blind},
+                "seed": event.seed, "deck": [card_to_str(card) for card in event.deck]
+            }
+        elif kind is BlindPosted:
+            hand_history['bets'].append({"stage": "blinds", "player_id": event.player_id, "action": "BLIND", "amount": event.amount})
+            hand_history['pot'] = hand_history.get('pot', 0) + event.amount
+        elif kind is CardsDealt:
+            hand_history['initial_hands'] = {player_id: [card_to_str(c) for c in cards] for player_id, cards in event.hands.items()}
+        elif kind is ActionTaken:
+            hand_history['bets'].append({"stage": event.stage, "player_id": event.player_id, "action": event.action, "amount": event.amount})
+        elif kind is ExchangeStarted:
+            hand_history['discards'] = {}
+        elif kind is CardsExchanged:
+            hand_history['discards'][str(event.player_id)] = [card_to_str(c) for c in event.discarded]
+        elif kind is ExchangeFinished:
+            hand_history['final_hands'] = {str(player_id): [card_to_str(c) for c in cards] for player_id, cards in event.final_hands.items()}
+        elif kind is ShowdownResult:
+            if event.winner_id is not None:
+                hand_history['winner'] = {"player_id": event.winner_id, "pot_won": event.pot}
+                if event.side_pots:
+                    hand_history['side_pots'] = [
+                        {"amount": side_pot.amount, "winner_id": side_pot.winner_id, "eligible": list(side_pot.eligible)}
+                        for side_pot in event.side_pots
+                    ]
+        elif kind is HandFinished:
+            hand_history['final_player_state'] = [
+                {"id": player_id, "name": name, "final_stack": stack} for player_id, name, stack in event.final_stacks
+            ]
+            self.hand_history = None
+            self.history_logger.save_hand_history(hand_history)
+
+
+class MetricsSink(EventSink):
+    interests = (ActionTaken, CardsExchanged)
+
+    def __init__(self, metrics: Metrics):
+        self.metrics = metrics
+
+    def handle(self, event: NamedTuple) -> None:
+        if type(event) is ActionTaken:
+            self.metrics.incr("actions")
+            self.metrics.incr(f"action_{event.action}")
+        else:
+            self.metrics.incr("cards_exchanged", len(event.discarded))
@@ -0,0 +1,169 @@
+import array
+import json
+import os
+import shutil
+from typing import Dict, Iterable, Tuple
+import numpy as np
+from src.fileops.history_archive import ACTIONS, ACTION_CODES, STAGES, STAGE_CODES
+from src.fileops.history_store import hand_winnings
+from src.logic.card import card_from_str
+from src.logic.hand_evaluator import evaluate
+
+
+# Kolumna -> (kod typu dla array, typ NumPy, szerokość wiersza).
+TABLES: Dict[str, Dict[str, Tuple[str, str, int]]] = {
+    "hands": {
+        "game": ('i', 'int32', 1),
+        "hand_number": ('i', 'int32', 1),
+        "num_players": ('b', 'int8', 1),
+        "pot": ('i', 'int32', 1),
+        "winner": ('i', 'int32', 1),
+        "showdown": ('b', 'int8', 1),
+    },
+    "seats": {
+        "hand": ('i', 'int32', 1),
+        "player": ('i', 'int32', 1),
+        "seat": ('b', 'int8', 1),
+        "initial_stack": ('i', 'int32', 1),
+        "final_stack": ('i', 'int32', 1),
+        "won": ('i', 'int32', 1),
+        "cards": ('b', 'int8', 5),
+    },
+    "actions": {
+        "hand": ('i', 'int32', 1),
+        "seq": ('h', 'int16', 1),
+        "stage": ('b', 'int8', 1),
+        "player": ('i', 'int32', 1),
+        "action": ('b', 'int8', 1),
+        "amount": ('i', 'int32', 1),
+    },
+    "showdowns": {
+        "hand": ('i', 'int32', 1),
+        "player": ('i', 'int32', 1),
+        "cards": ('b', 'int8', 5),
+        "score": ('h', 'int16', 1),
+        "won": ('b', 'int8', 1),
+    },
+}
+
+
+class _Column:
+    def __init__(self, path: str, typecode: str, dtype: str, width: int, buffer_rows: int):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.width = width
+        self.typecode = typecode
+        self.buffer = array.array(typecode)
+        self.buffer_limit = buffer_rows * width
+        self.rows = 0
+        self._raw = open(path + '.part', 'wb')
+
+    def append(self, value) -> None:
+        self.buffer.append(value)
+        if len(self.buffer) >= self.buffer_limit:
+            self.flush()
+
+    def extend(self, values) -> None:
+        self.buffer.extend(values)
+        if len(self.buffer) >= self.buffer_limit:
+            self.flush()
+
+    def flush(self) -> None:
+        self.rows += len(self.buffer) // self.width
+        self.buffer.tofile(self._raw)
+        self.buffer = array.array(self.typecode)
+
+    def finish(self) -> None:
+        self.flush()
+        self._raw.close()
+        shape = (self.rows,) if self.width == 1 else (self.rows, self.width)
+        # Surowe dane z array mają natywną kolejność bajtów, więc wystarczy dopisać nagłówek .npy.
+        with open(self.path, 'wb') as out, open(self.path + '.part', 'rb') as raw:
+            np.lib.format.write_array_header_1_0(out, {"descr": np.lib.format.dtype_to_descr(self.dtype), "fortran_order": False, "shape": shape})
+            shutil.copyfileobj(raw, out, 1 << 20)
+        os.remove(self.path + '.part')
+
+
+def _hand_number(hand_id: str) -> int:
+    number = str(hand_id).rsplit('_', 1)[-1]
+    return int(number) if number.isdigit() else -1
+
+
+def _cards(cards: Iterable[str]) -> list:
+    codes = [card_from_str(card) for card in cards]
+    return codes + [-1] * (5 - len(codes))
+
+
+def export_columns(hands: Iterable[dict], out_dir: str, buffer_rows: int = 1 << 16) -> dict:
+    columns = {}
+    for table, spec in TABLES.items():
+        os.makedirs(os.path.join(out_dir, table), exist_ok=True)
+        for name, (typecode, dtype, width) in spec.items():
+            columns[(table, name)] = _Column(os.path.join(out_dir, table, f"{name}.npy"), typecode, dtype, width, buffer_rows)
+    col = {key: column.append for key, column in columns.items()}
+    cards_col = {key: column.extend for key, column in columns.items() if column.width > 1}
+
+    player_codes: Dict[str, int] = {}
+    game_codes: Dict[str, int] = {}
+    hand_row = 0
+    action_row = 0
+    for history in hands:
+        game = game_codes.setdefault(history.get("game_id"), len(game_codes))
+        names = {p["id"]: p["name"] for p in history["players"]}
+        codes = {player_id: player_codes.setdefault(name, len(player_codes)) for player_id, name in names.items()}
+        winner = history.get("winner") or {}
+        winnings = hand_winnings(history)
+        final_hands = history.get("final_hands")
+        showdown = final_hands is not None and len(final_hands) > 1
+
+        col[("hands", "game")](game)
+        col[("hands", "hand_number")](_hand_number(history.get("hand_id")))
+        col[("hands", "num_players")](len(names))
+        col[("hands", "pot")](sum(winnings.values()))
+        col[("hands", "winner")](codes.get(winner.get("player_id"), -1))
+        col[("hands", "showdown")](1 if showdown else 0)
+
+        final_stacks = {p["id"]: p["final_stack"] for p in history.get("final_player_state", [])}
+        initial_hands = history.get("initial_hands", {})
+        for seat, p in enumerate(history["players"]):
+            col[("seats", "hand")](hand_row)
+            col[("seats", "player")](codes[p["id"]])
+            col[("seats", "seat")](seat)
+            col[("seats", "initial_stack")](p["initial_stack"])
+            col[("seats", "final_stack")](final_stacks.get(p["id"], p["initial_stack"]))
+            col[("seats", "won")](winnings.get(p["id"], 0))
+            cards_col[("seats", "cards")](_cards(initial_hands.get(str(p["id"]), initial_hands.get(p["id"], []))))
+
+        for seq, bet in enumerate(history.get("bets", [])):
+            col[("actions", "hand")](hand_row)
+            col[("actions", "seq")](seq)
+            col[("actions", "stage")](STAGE_CODES.get(bet["stage"], -1))
+            col[("actions", "player")](codes[bet["player_id"]])
+            col[("actions", "action")](ACTION_CODES.get(bet["action"], -1))
+            col[("actions", "amount")](bet.get("amount", 0))
+            action_row += 1
+
+        if showdown:
+            for player_id, cards in final_hands.items():
+                player_id = int(player_id)
+                hand = [card_from_str(card) for card in cards]
+                col[("showdowns", "hand")](hand_row)
+                col[("showdowns", "player")](codes[player_id])
+                cards_col[("showdowns", "cards")](hand)
+                col[("showdowns", "score")](evaluate(hand))
+                col[("showdowns", "won")](1 if player_id in winnings else 0)
+        hand_row += 1
+
+    for column in columns.values():
+        column.finish()
+    np.save(os.path.join(out_dir, "player_names.npy"), np.array(sorted(player_codes, key=player_codes.get), dtype=str))
+    np.save(os.path.join(out_dir, "game_ids.npy"), np.array(sorted(game_codes, key=game_codes.get), dtype=str))
+    meta = {"hands": hand_row, "actions": action_row, "players": len(player_codes), "games": len(game_codes),
+            "stages": list(STAGES), "action_codes": list(ACTIONS)}
+    with open(os.path.join(out_dir, "meta.json"), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2, ensure_ascii=False)
+    return meta
+
+
+def load_table(out_dir: str, table: str, mmap_mode: str = 'r') -> Dict[str, np.ndarray]:
+    return {name: np.load(os.path.join(out_dir, table, f"{name}.npy"), mmap_mode=mmap_mode) for name in TABLES[table]}
@@ -0,0 +1,513 @@
+import json
+import os
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+from src.logic.card import card_from_str, card_to_str
+
+ARCHIVE_MAGIC = b'P5HIST1\x00'
+ARCHIVE_EXTENSION = '.p5h'
+STAGES = ('blinds', 'pre-exchange', 'post-exchange')
+ACTIONS = ('BLIND', 'fold', 'check', 'call', 'raise')
+STAGE_CODES = {name: code for code, name in enumerate(STAGES)}
+ACTION_CODES = {name: code for code, name in enumerate(ACTIONS)}
+
+# Rozdanie w formacie kompaktowym albo, gdy nie pasuje do schematu, jako JSON.
+_COMPACT, _RAW_JSON = 0, 1
+# Kolejność pól jak w HistorySink; bity maski obecności pól opcjonalnych.
+_OPTIONAL_FIELDS = ('timestamp', 'blinds', 'seed', 'deck', 'pot', 'initial_hands', 'discards', 'final_hands',
+                    'winner', 'side_pots', 'final_player_state')
+_FIELD_ORDER = ('game_id', 'hand_id', 'timestamp', 'players', 'bets', 'blinds', 'seed', 'deck', 'pot',
+                'initial_hands', 'discards', 'final_hands', 'winner', 'side_pots', 'final_player_state')
+_KNOWN_FIELDS = frozenset(_FIELD_ORDER)
+_EPOCH = datetime(1970, 1, 1)
+_TRAILER_SIZE = 12
+
+
+class _NotCompact(Exception):
+    pass
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    if type(value) is not int or value < 0:
+        raise _NotCompact
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _write_str(out: bytearray, text: str) -> None:
+    if type(text) is not str:
+        raise _NotCompact
+    raw = text.encode('utf-8')
+    _write_varint(out, len(raw))
+    out += raw
+
+
+def _read_str(data: bytes, pos: int) -> Tuple[str, int]:
+    size, pos = _read_varint(data, pos)
+    return data[pos:pos + size].decode('utf-8'), pos + size
+
+
+def _write_cards(out: bytearray, cards: List[str]) -> None:
+    if type(cards) is not list:
+        raise _NotCompact
+    _write_varint(out, len(cards))
+    try:
+        out += bytes(card_from_str(card) for card in cards)
+    except (ValueError, TypeError):
+        raise _NotCompact
+
+
+def _read_cards(data: bytes, pos: int) -> Tuple[List[str], int]:
+    count, pos = _read_varint(data, pos)
+    return [card_to_str(code) for code in data[pos:pos + count]], pos + count
+
+
+class GameHeader:
+    # Nagłówek gry: identyfikator, blindy i lista graczy (id, nazwa), do której odwołują się rozdania.
+    def __init__(self, game_id: str, small_blind: int, big_blind: int, roster: List[Tuple[int, str]] = None):
+        self.game_id = game_id
+        self.small_blind = small_blind
+        self.big_blind = big_blind
+        self.roster: List[Tuple[int, str]] = list(roster or [])
+        self._roster_index = {entry: i for i, entry in enumerate(self.roster)}
+
+    def roster_index(self, player_id: int, name: str) -> int:
+        key = (player_id, name)
+        index = self._roster_index.get(key)
+        if index is None:
+            index = self._roster_index[key] = len(self.roster)
+            self.roster.append(key)
+        return index
+
+    def encode(self, out: bytearray) -> None:
+        _write_str(out, self.game_id)
+        _write_varint(out, self.small_blind)
+        _write_varint(out, self.big_blind)
+        _write_varint(out, len(self.roster))
+        for player_id, name in self.roster:
+            _write_varint(out, player_id)
+            _write_str(out, name)
+
+    @classmethod
+    def decode(cls, data: bytes, pos: int) -> Tuple['GameHeader', int]:
+        game_id, pos = _read_str(data, pos)
+        small_blind, pos = _read_varint(data, pos)
+        big_blind, pos = _read_varint(data, pos)
+        count, pos = _read_varint(data, pos)
+        roster = []
+        for _ in range(count):
+            player_id, pos = _read_varint(data, pos)
+            name, pos = _read_str(data, pos)
+            roster.append((player_id, name))
+        return cls(game_id, small_blind, big_blind, roster), pos
+
+
+def _seat_map(history: dict) -> Dict[str, int]:
+    return {str(p["id"]): seat for seat, p in enumerate(history["players"])}
+
+
+def _write_seat(out: bytearray, seats: Dict[str, int], player_id) -> None:
+    seat = seats.get(str(player_id))
+    if seat is None or (type(player_id) is not int and not isinstance(player_id, str)):
+        raise _NotCompact
+    out.append(seat)
+
+
+def _write_hands(out: bytearray, seats: Dict[str, int], hands: dict) -> None:
+    if type(hands) is not dict:
+        raise _NotCompact
+    _write_varint(out, len(hands))
+    for player_id, cards in hands.items():
+        _write_seat(out, seats, player_id)
+        _write_cards(out, cards)
+
+
+def _read_hands(data: bytes, pos: int, ids: List[int]) -> Tuple[dict, int]:
+    count, pos = _read_varint(data, pos)
+    hands = {}
+    for _ in range(count):
+        seat = data[pos]
+        cards, pos = _read_cards(data, pos + 1)
+        hands[str(ids[seat])] = cards
+    return hands, pos
+
+
+def _timestamp_micros(timestamp) -> Optional[int]:
+    try:
+        moment = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is not None or moment.isoformat() != timestamp or moment < _EPOCH:
+        return None
+    return (moment - _EPOCH) // timedelta(microseconds=1)
+
+
+def _encode_compact(history: dict, game: GameHeader) -> bytes:
+    if not _KNOWN_FIELDS.issuperset(history) or history.get("game_id") != game.game_id:
+        raise _NotCompact
+    players = history["players"]
+    if type(players) is not list or len(players) > 255:
+        raise _NotCompact
+    seats = _seat_map(history)
+    if len(seats) != len(players):
+        raise _NotCompact
+    out = bytearray()
+
+    mask = 0
+    for bit, field in enumerate(_OPTIONAL_FIELDS):
+        if field in history:
+            mask |= 1 << bit
+    blinds = history.get("blinds")
+    if blinds is not None and blinds == {"small": game.small_blind, "big": game.big_blind} and list(blinds) == ["small", "big"]:
+        # Blindy zgodne z nagłówkiem gry nie są zapisywane w rozdaniu.
+        mask |= 1 << len(_OPTIONAL_FIELDS)
+    timestamp_micros = _timestamp_micros(history["timestamp"]) if "timestamp" in history else None
+    if timestamp_micros is not None:
+        mask |= 1 << (len(_OPTIONAL_FIELDS) + 1)
+    _write_varint(out, mask)
+
+    hand_id = history["hand_id"]
+    prefix, _, number = hand_id.rpartition('_') if type(hand_id) is str else ('', '', '')
+    if prefix == 'round' and number.isdigit() and str(int(number)) == number:
+        _write_varint(out, int(number) * 2)
+    else:
+        _write_varint(out, 1)
+        _write_str(out, hand_id)
+
+    _write_varint(out, len(players))
+    for p in players:
+        if list(p) != ["id", "name", "initial_stack"]:
+            raise _NotCompact
+        _write_varint(out, game.roster_index(p["id"], p["name"]))
+        _write_varint(out, p["initial_stack"])
+
+    bets = history["bets"]
+    if type(bets) is not list:
+        raise _NotCompact
+    _write_varint(out, len(bets))
+    for bet in bets:
+        if list(bet) != ["stage", "player_id", "action", "amount"]:
+            raise _NotCompact
+        stage, action = STAGE_CODES.get(bet["stage"]), ACTION_CODES.get(bet["action"])
+        if stage is None or action is None:
+            raise _NotCompact
+        out.append(stage << 4 | action)
+        _write_seat(out, seats, bet["player_id"])
+        _write_varint(out, bet["amount"])
+
+    if timestamp_micros is not None:
+        _write_varint(out, timestamp_micros)
+    elif "timestamp" in history:
+        _write_str(out, history["timestamp"])
+    if blinds is not None and not mask >> len(_OPTIONAL_FIELDS) & 1:
+        if type(blinds) is not dict or list(blinds) != ["small", "big"]:
+            raise _NotCompact
+        _write_varint(out, blinds["small"])
+        _write_varint(out, blinds["big"])
+    if "seed" in history:
+        _write_varint(out, history["seed"])
+    if "deck" in history:
+        _write_cards(out, history["deck"])
+    if "pot" in history:
+        _write_varint(out, history["pot"])
+    for field in ("initial_hands", "discards", "final_hands"):
+        if field in history:
+            _write_hands(out, seats, history[field])
+    if "winner" in history:
+        winner = history["winner"]
+        if type(winner) is not dict or list(winner) != ["player_id", "pot_won"]:
+            raise _NotCompact
+        _write_seat(out, seats, winner["player_id"])
+        _write_varint(out, winner["pot_won"])
+    if "side_pots" in history:
+        _write_varint(out, len(history["side_pots"]))
+        for side_pot in history["side_pots"]:
+            if list(side_pot) != ["amount", "winner_id", "eligible"]:
+                raise _NotCompact
+            _write_varint(out, side_pot["amount"])
+            _write_seat(out, seats, side_pot["winner_id"])
+            _write_varint(out, len(side_pot["eligible"]))
+            for player_id in side_pot["eligible"]:
+                _write_seat(out, seats, player_id)
+    if "final_player_state" in history:
+        states = history["final_player_state"]
+        _write_varint(out, len(states))
+        for state in states:
+            if list(state) != ["id", "name", "final_stack"]:
+                raise _NotCompact
+            seat = seats.get(str(state["id"]))
+            if seat is None or players[seat]["name"] != state["name"] or players[seat]["id"] != state["id"]:
+                raise _NotCompact
+            out.append(seat)
+            _write_varint(out, state["final_stack"])
+    return bytes(out)
+
+
+def encode_hand(history: dict, game: GameHeader) -> bytes:
+    # Koduje rozdanie tak, aby decode_hand zwróciło json.loads(json.dumps(history)).
+    roster_size = len(game.roster)
+    try:
+        return bytes([_COMPACT]) + _encode_compact(history, game)
+    except (_NotCompact, KeyError, TypeError, AttributeError):
+        del game.roster[roster_size:]
+        game._roster_index = {entry: i for i, entry in enumerate(game.roster)}
+        return bytes([_RAW_JSON]) + json.dumps(history, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def decode_hand(data: bytes, game: GameHeader) -> dict:
+    if data[0] == _RAW_JSON:
+        return json.loads(data[1:].decode('utf-8'))
+    mask, pos = _read_varint(data, 1)
+    present = {field for bit, field in enumerate(_OPTIONAL_FIELDS) if mask >> bit & 1}
+
+    hand_number, pos = _read_varint(data, pos)
+    if hand_number & 1:
+        hand_id, pos = _read_str(data, pos)
+    else:
+        hand_id = f"round_{hand_number >> 1}"
+
+    count, pos = _read_varint(data, pos)
+    players = []
+    for _ in range(count):
+        index, pos = _read_varint(data, pos)
+        stack, pos = _read_varint(data, pos)
+        player_id, name = game.roster[index]
+        players.append({"id": player_id, "name": name, "initial_stack": stack})
+    ids = [p["id"] for p in players]
+
+    count, pos = _read_varint(data, pos)
+    bets = []
+    for _ in range(count):
+        code = data[pos]
+        seat = data[pos + 1]
+        amount, pos = _read_varint(data, pos + 2)
+        bets.append({"stage": STAGES[code >> 4], "player_id": ids[seat], "action": ACTIONS[code & 0x0F], "amount": amount})
+
+    fields = {"game_id": game.game_id, "hand_id": hand_id, "players": players, "bets": bets}
+    if "timestamp" in present:
+        if mask >> (len(_OPTIONAL_FIELDS) + 1) & 1:
+            micros, pos = _read_varint(data, pos)
+            fields["timestamp"] = (_EPOCH + timedelta(microseconds=micros)).isoformat()
+        else:
+            fields["timestamp"], pos = _read_str(data, pos)
+    if "blinds" in present:
+        if mask >> len(_OPTIONAL_FIELDS) & 1:
+            fields["blinds"] = {"small": game.small_blind, "big": game.big_blind}
+        else:
+            small_blind, pos = _read_varint(data, pos)
+            big_blind, pos = _read_varint(data, pos)
+            fields["blinds"] = {"small": small_blind, "big": big_blind}
+    if "seed" in present:
+        fields["seed"], pos = _read_varint(data, pos)
+    if "deck" in present:
+        fields["deck"], pos = _read_cards(data, pos)
+    if "pot" in present:
+        fields["pot"], pos = _read_varint(data, pos)
+    for field in ("initial_hands", "discards", "final_hands"):
+        if field in present:
+            fields[field], pos = _read_hands(data, pos, ids)
+    if "winner" in present:
+        pot_won, next_pos = _read_varint(data, pos + 1)
+        fields["winner"] = {"player_id": ids[data[pos]], "pot_won": pot_won}
+        pos = next_pos
+    if "side_pots" in present:
+        count, pos = _read_varint(data, pos)
+        side_pots = []
+        for _ in range(count):
+            amount, pos = _read_varint(data, pos)
+            winner_id = ids[data[pos]]
+            eligible_count, pos = _read_varint(data, pos + 1)
+            eligible = [ids[seat] for seat in data[pos:pos + eligible_count]]
+            pos += eligible_count
+            side_pots.append({"amount": amount, "winner_id": winner_id, "eligible": eligible})
+        fields["side_pots"] = side_pots
+    if "final_player_state" in present:
+        count, pos = _read_varint(data, pos)
+        states = []
+        for _ in range(count):
+            seat = data[pos]
+            stack, pos = _read_varint(data, pos + 1)
+            states.append({"id": players[seat]["id"], "name": players[seat]["name"], "final_stack": stack})
+        fields["final_player_state"] = states
+    return {field: fields[field] for field in _FIELD_ORDER if field in fields}
+
+
+class HistoryArchiveWriter:
+    # Plik: magic, segmenty zlib po segment_hands rozdań, stopka zlib (nagłówki gier, tabela segmentów,
+    # tabela rozdań z przesunięciami w segmencie) i na końcu przesunięcie oraz długość stopki.
+    def __init__(self, path: str, segment_hands: int = 256, level: int = 6):
+        self.path = path
+        self.segment_hands = segment_hands
+        self.level = level
+        self._tmp_path = path + '.tmp'
+        self._file = open(self._tmp_path, 'wb')
+        self._file.write(ARCHIVE_MAGIC)
+        self._games: Dict[str, int] = {}
+        self._game_order: List[GameHeader] = []
+        self._segments: List[Tuple[int, int, int]] = []
+        self._index: List[Tuple[int, str, int, int]] = []
+        self._pending = bytearray()
+        self._pending_count = 0
+
+    def __enter__(self) -> 'HistoryArchiveWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            os.remove(self._tmp_path)
+
+    def _game_for(self, history: dict) -> int:
+        game_id = history.get("game_id")
+        key = game_id if type(game_id) is str else ''
+        number = self._games.get(key)
+        if number is None:
+            blinds = history.get("blinds")
+            small_blind, big_blind = (blinds.get("small"), blinds.get("big")) if type(blinds) is dict else (0, 0)
+            if type(small_blind) is not int or type(big_blind) is not int or small_blind < 0 or big_blind < 0:
+                small_blind, big_blind = 0, 0
+            number = self._games[key] = len(self._game_order)
+            self._game_order.append(GameHeader(key, small_blind, big_blind))
+        return number
+
+    def add(self, history: dict) -> None:
+        game_number = self._game_for(history)
+        data = encode_hand(history, self._game_order[game_number])
+        hand_id = history.get("hand_id")
+        self._index.append((game_number, hand_id if type(hand_id) is str else '', len(self._segments), len(self._pending)))
+        _write_varint(self._pending, len(data))
+        self._pending += data
+        self._pending_count += 1
+        if self._pending_count >= self.segment_hands:
+            self._flush_segment()
+
+    def _flush_segment(self) -> None:
+        if not self._pending_count:
+            return
+        compressed = zlib.compress(bytes(self._pending), self.level)
+        self._segments.append((self._file.tell(), len(compressed), self._pending_count))
+        self._file.write(compressed)
+        self._pending = bytearray()
+        self._pending_count = 0
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._flush_segment()
+        footer = bytearray()
+        _write_varint(footer, len(self._game_order))
+        for game in self._game_order:
+            game.encode(footer)
+        _write_varint(footer, len(self._segments))
+        for offset, size, count in self._segments:
+            _write_varint(footer, offset)
+            _write_varint(footer, size)
+            _write_varint(footer, count)
+        _write_varint(footer, len(self._index))
+        for game_number, hand_id, segment, offset in self._index:
+            _write_varint(footer, game_number)
+            _write_str(footer, hand_id)
+            _write_varint(footer, segment)
+            _write_varint(footer, offset)
+        compressed = zlib.compress(bytes(footer), self.level)
+        footer_offset = self._file.tell()
+        self._file.write(compressed)
+        self._file.write(footer_offset.to_bytes(8, 'little') + len(compressed).to_bytes(4, 'little'))
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+
+class HistoryArchive:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        if self._file.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+            self._file.close()
+            raise ValueError(f"Plik {path} nie jest archiwum historii rozdań.")
+        self._file.seek(-_TRAILER_SIZE, os.SEEK_END)
+        trailer = self._file.read(_TRAILER_SIZE)
+        footer_offset, footer_size = int.from_bytes(trailer[:8], 'little'), int.from_bytes(trailer[8:], 'little')
+        self._file.seek(footer_offset)
+        footer = zlib.decompress(self._file.read(footer_size))
+
+        count, pos = _read_varint(footer, 0)
+        self.games: List[GameHeader] = []
+        for _ in range(count):
+            game, pos = GameHeader.decode(footer, pos)
+            self.games.append(game)
+        count, pos = _read_varint(footer, pos)
+        self.segments: List[Tuple[int, int, int]] = []
+        for _ in range(count):
+            offset, pos = _read_varint(footer, pos)
+            size, pos = _read_varint(footer, pos)
+            hands, pos = _read_varint(footer, pos)
+            self.segments.append((offset, size, hands))
+        count, pos = _read_varint(footer, pos)
+        self.index: List[Tuple[int, str, int, int]] = []
+        self._lookup: Dict[Tuple[str, str], int] = {}
+        for i in range(count):
+            game_number, pos = _read_varint(footer, pos)
+            hand_id, pos = _read_str(footer, pos)
+            segment, pos = _read_varint(footer, pos)
+            offset, pos = _read_varint(footer, pos)
+            self.index.append((game_number, hand_id, segment, offset))
+            self._lookup.setdefault((self.games[game_number].game_id, hand_id), i)
+        self._cached_segment = (None, b'')
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __enter__(self) -> 'HistoryArchive':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _segment(self, number: int) -> bytes:
+        cached_number, data = self._cached_segment
+        if cached_number != number:
+            offset, size, _ = self.segments[number]
+            self._file.seek(offset)
+            data = zlib.decompress(self._file.read(size))
+            self._cached_segment = (number, data)
+        return data
+
+    def _decode_at(self, entry: int) -> dict:
+        game_number, _, segment, offset = self.index[entry]
+        data = self._segment(segment)
+        size, pos = _read_varint(data, offset)
+        return decode_hand(data[pos:pos + size], self.games[game_number])
+
+    def load_hand(self, game_id: str, hand_id: str) -> Optional[dict]:
+        entry = self._lookup.get((game_id, hand_id))
+        return self._decode_at(entry) if entry is not None else None
+
+    def iter_hands(self, game_id: str = None) -> Iterator[dict]:
+        for entry, (game_number, _, _, _) in enumerate(self.index):
+            if game_id is None or self.games[game_number].game_id == game_id:
+                yield self._decode_at(entry)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read_archive(path: str) -> Iterator[dict]:
+    with HistoryArchive(path) as archive:
+        yield from archive.iter_hands()
@@ -1,22 +1,222 @@
+import atexit
+import glob
 import json
 import os
+import queue
+import sqlite3
+import threading
+import time
+import zlib
 from datetime import datetime
+from typing import Iterator, Optional
+from src.fileops.history_archive import ARCHIVE_EXTENSION, HistoryArchive, read_archive
+from src.fileops.history_store import HistoryStore
+from src.utils.metrics import Metrics
+
+MODES = ('json', 'jsonl', 'binary')
+_SEGMENT_EXTENSIONS = {'jsonl': '.jsonl', 'binary': '.bin'}
+_STOP = object()
+
 
 class HistoryLogger:
-    def __init__(self, data_dir: str = 'data'):
+    def __init__(self, data_dir: str = 'data', mode: str = 'jsonl', segment_size: int = 64 * 1024 * 1024,
+                 flush_every: int = 1, batch_size: int = 256, store: HistoryStore = None, metrics: Metrics = None):
+        if mode not in MODES:
+            raise ValueError(f"Nieznany tryb zapisu historii: {mode}")
         self.data_dir = data_dir
+        self.mode = mode
+        self.segment_size = segment_size
+        self.flush_every = flush_every
+        self.batch_size = batch_size
+        self.store = store
+        self.metrics = metrics
+        self.log_dir = os.path.join(self.data_dir, 'history_log')
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
 
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._file = None
+        self._segment_number = 0
+        self._unflushed = 0
+        self._prefix = f"hands_{datetime.now().strftime('%Y%m%d%H%M%S')}_{os.getpid()}_{id(self):x}"
+        if self.mode != 'json':
+            os.makedirs(self.log_dir, exist_ok=True)
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._writer_loop, name="history-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
     def save_hand_history(self, history_data: dict) -> None:
+        if self.mode == 'json':
+            self._save_json_file(history_data)
+            if self.store is not None:
+                self.store.add_hands([history_data])
+        elif self._queue is not None:
+            self._queue.put(history_data)
+
+    def flush(self) -> None:
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._queue is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._queue = None
+        # Zarejestrowana metoda trzyma referencję do loggera aż do końca procesu.
+        atexit.unregister(self.close)
+
+    def _save_json_file(self, history_data: dict) -> None:
         game_id = history_data.get("game_id", "unknown_game")
         hand_id = history_data.get("hand_id", "unknown_hand")
-        
+
         filename = f"history_{game_id}_{hand_id}.json"
         filepath = os.path.join(self.data_dir, filename)
-        
+
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(history_data, f, indent=2, ensure_ascii=False)
+                if self.metrics is not None:
+                    self.metrics.incr("history_bytes_written", f.tell())
         except IOError as e:
-            print(f"Błąd podczas zapisywania historii rozdania: {e}")
\ No newline at end of file
+            print(f"Błąd podczas zapisywania historii rozdania: {e}")
+
+    def _encode(self, history_data: dict) -> bytes:
+        data = json.dumps(history_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if self.mode == 'jsonl':
+            return data + b'\n'
+        compressed = zlib.compress(data)
+        return len(compressed).to_bytes(4, 'little') + compressed
+
+    def _open_segment(self) -> None:
+        self._segment_number += 1
+        filename = f"{self._prefix}_{self._segment_number:05d}{_SEGMENT_EXTENSIONS[self.mode]}"
+        self._file = open(os.path.join(self.log_dir, filename), 'ab')
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unflushed = 0
+
+    def _write_batch(self, batch: list) -> None:
+        if self._file is None or self._file.tell() >= self.segment_size:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+            self._open_segment()
+        data = b''.join(self._encode(history_data) for history_data in batch)
+        self._file.write(data)
+        if self.metrics is not None:
+            self.metrics.incr("history_bytes_written", len(data))
+        self._unflushed += len(batch)
+        if self.flush_every and self._unflushed >= self.flush_every:
+            self._sync()
+
+    def _writer_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = []
+            item = self._queue.get()
+            while True:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                if batch:
+                    start = time.perf_counter()
+                    self._write_batch(batch)
+                    if self.store is not None:
+                        self.store.add_hands(batch)
+                    if self.metrics is not None:
+                        self.metrics.add_time("history_write", time.perf_counter() - start)
+                if stopping and self._file is not None:
+                    self._sync()
+                    self._file.close()
+                    self._file = None
+            except (IOError, ValueError, TypeError, sqlite3.Error) as e:
+                print(f"Błąd podczas zapisywania historii rozdania: {e}")
+            finally:
+                for _ in range(len(batch) + (1 if stopping else 0)):
+                    self._queue.task_done()
+
+    def _segment_paths(self) -> list:
+        # Archiwa spakowane narzędziem tools/history_archive.py czytane są razem z segmentami.
+        return sorted(glob.glob(os.path.join(self.log_dir, 'hands_*.jsonl')) + glob.glob(os.path.join(self.log_dir, 'hands_*.bin'))
+                      + glob.glob(os.path.join(self.log_dir, f'hands_*{ARCHIVE_EXTENSION}')))
+
+    def iter_hands(self, game_id: str = None) -> Iterator[dict]:
+        self.flush()
+        # To samo rozdanie może leżeć w kilku źródłach: w trybie 'json' z bazą w pliku i w bazie, a po spakowaniu
+        # dziennika (tools/history_archive.py pack) w segmentach i w archiwum, więc zwracamy je tylko raz.
+        seen = set()
+        legacy_pattern = os.path.join(self.data_dir, f"history_{game_id if game_id is not None else '*'}_*.json")
+        for path in sorted(glob.glob(legacy_pattern), key=_legacy_sort_key):
+            with open(path, 'r', encoding='utf-8') as f:
+                history_data = json.load(f)
+            seen.add((history_data.get("game_id"), history_data.get("hand_id")))
+            yield history_data
+
+        if self.store is not None and game_id is not None:
+            sources = [self.store.iter_game(game_id)]
+        else:
+            sources = [read_segment(path) for path in self._segment_paths()]
+        for source in sources:
+            for history_data in source:
+                if game_id is not None and history_data.get("game_id") != game_id:
+                    continue
+                key = (history_data.get("game_id"), history_data.get("hand_id"))
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield history_data
+
+    def load_hand(self, game_id: str, hand_id: str) -> Optional[dict]:
+        filepath = os.path.join(self.data_dir, f"history_{game_id}_{hand_id}.json")
+        if os.path.exists(filepath):
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        self.flush()
+        if self.store is not None:
+            return self.store.load_hand(game_id, hand_id)
+        for path in glob.glob(os.path.join(self.log_dir, f'hands_*{ARCHIVE_EXTENSION}')):
+            with HistoryArchive(path) as archive:
+                history_data = archive.load_hand(game_id, hand_id)
+            if history_data is not None:
+                return history_data
+        for history_data in self.iter_hands(game_id):
+            if history_data.get("hand_id") == hand_id:
+                return history_data
+        return None
+
+
+def _legacy_sort_key(path: str) -> tuple:
+    stem = os.path.basename(path)[:-len('.json')]
+    prefix, _, number = stem.rpartition('_')
+    return (prefix, int(number)) if number.isdigit() else (stem, 0)
+
+
+def read_segment(path: str) -> Iterator[dict]:
+    if path.endswith(ARCHIVE_EXTENSION):
+        yield from read_archive(path)
+        return
+    with open(path, 'rb') as f:
+        if path.endswith('.jsonl'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        while True:
+            header = f.read(4)
+            if len(header) < 4:
+                return
+            size = int.from_bytes(header, 'little')
+            yield json.loads(zlib.decompress(f.read(size)))
@@ -0,0 +1,232 @@
+import glob
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_DB_PATH = os.path.join('data', 'history.sqlite3')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hands (
+    game_id TEXT NOT NULL,
+    hand_id TEXT NOT NULL,
+    hand_number INTEGER,
+    timestamp TEXT,
+    winner_id INTEGER,
+    pot_won INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (game_id, hand_id)
+);
+CREATE INDEX IF NOT EXISTS idx_hands_game_number ON hands (game_id, hand_number);
+
+CREATE TABLE IF NOT EXISTS hand_players (
+    game_id TEXT NOT NULL,
+    hand_id TEXT NOT NULL,
+    player_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    initial_stack INTEGER,
+    final_stack INTEGER,
+    won INTEGER NOT NULL,
+    PRIMARY KEY (game_id, hand_id, player_id)
+);
+CREATE INDEX IF NOT EXISTS idx_hand_players_name ON hand_players (name, game_id);
+
+CREATE TABLE IF NOT EXISTS actions (
+    game_id TEXT NOT NULL,
+    hand_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    player_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    action TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    PRIMARY KEY (game_id, hand_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_actions_name_action ON actions (name, action, stage);
+
+CREATE TABLE IF NOT EXISTS player_stats (
+    name TEXT PRIMARY KEY,
+    hands_played INTEGER NOT NULL DEFAULT 0,
+    hands_won INTEGER NOT NULL DEFAULT 0,
+    chips_won INTEGER NOT NULL DEFAULT 0,
+    profit INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS player_action_stats (
+    name TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    action TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    amount INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (name, stage, action)
+);
+"""
+
+
+def _hand_number(hand_id: str) -> Optional[int]:
+    try:
+        return int(hand_id.rsplit('_', 1)[-1])
+    except (AttributeError, ValueError):
+        return None
+
+
+def hand_winnings(history: dict) -> Dict[int, int]:
+    # Żetony wygrane przez każdego gracza; przy pulach bocznych "winner" opisuje tylko zwycięzcę puli głównej.
+    side_pots = history.get("side_pots")
+    if side_pots:
+        winnings: Dict[int, int] = {}
+        for side_pot in side_pots:
+            winnings[side_pot["winner_id"]] = winnings.get(side_pot["winner_id"], 0) + side_pot["amount"]
+        return winnings
+    winner = history.get("winner") or {}
+    if winner.get("player_id") is None:
+        return {}
+    return {winner["player_id"]: winner.get("pot_won", 0)}
+
+
+class HistoryStore:
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def add_hands(self, hands: Iterable[dict]) -> int:
+        player_rows, action_rows = [], []
+        player_stats: Dict[str, list] = {}
+        action_stats: Dict[tuple, list] = {}
+        inserted = 0
+
+        with self._lock, self._conn:
+            for history in hands:
+                game_id = history.get("game_id", "unknown_game")
+                hand_id = history.get("hand_id", "unknown_hand")
+                winner = history.get("winner") or {}
+                winner_id = winner.get("player_id")
+                pot_won = winner.get("pot_won", 0)
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO hands VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (game_id, hand_id, _hand_number(hand_id), history.get("timestamp"), winner_id, pot_won,
+                     json.dumps(history, ensure_ascii=False, separators=(',', ':')))
+                )
+                if cursor.rowcount == 0:
+                    continue
+                inserted += 1
+
+                names = {p["id"]: p["name"] for p in history.get("players", [])}
+                final_stacks = {p["id"]: p["final_stack"] for p in history.get("final_player_state", [])}
+                winnings = hand_winnings(history)
+                for p in history.get("players", []):
+                    won = 1 if p["id"] in winnings else 0
+                    final_stack = final_stacks.get(p["id"], p["initial_stack"])
+                    player_rows.append((game_id, hand_id, p["id"], p["name"], p["initial_stack"], final_stack, won))
+                    stats = player_stats.setdefault(p["name"], [0, 0, 0, 0])
+                    stats[0] += 1
+                    stats[1] += won
+                    stats[2] += winnings.get(p["id"], 0)
+                    stats[3] += final_stack - p["initial_stack"]
+
+                for seq, bet in enumerate(history.get("bets", [])):
+                    name = names.get(bet["player_id"], str(bet["player_id"]))
+                    amount = bet.get("amount", 0)
+                    action_rows.append((game_id, hand_id, seq, bet["stage"], bet["player_id"], name, bet["action"], amount))
+                    stats = action_stats.setdefault((name, bet["stage"], bet["action"]), [0, 0])
+                    stats[0] += 1
+                    stats[1] += amount
+
+            self._conn.executemany("INSERT INTO hand_players VALUES (?, ?, ?, ?, ?, ?, ?)", player_rows)
+            self._conn.executemany("INSERT INTO actions VALUES (?, ?, ?, ?, ?, ?, ?, ?)", action_rows)
+            self._conn.executemany(
+                "INSERT INTO player_stats VALUES (?, ?, ?, ?, ?) ON CONFLICT(name) DO UPDATE SET "
+                "hands_played = hands_played + excluded.hands_played, hands_won = hands_won + excluded.hands_won, "
+                "chips_won = chips_won + excluded.chips_won, profit = profit + excluded.profit",
+                [(name, *stats) for name, stats in player_stats.items()]
+            )
+            self._conn.executemany(
+                "INSERT INTO player_action_stats VALUES (?, ?, ?, ?, ?) ON CONFLICT(name, stage, action) DO UPDATE SET "
+                "count = count + excluded.count, amount = amount + excluded.amount",
+                [(*key, *stats) for key, stats in action_stats.items()]
+            )
+        return inserted
+
+    def load_hand(self, game_id: str, hand_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM hands WHERE game_id = ? AND hand_id = ?", (game_id, hand_id)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_game(self, game_id: str) -> Iterator[dict]:
+        last_number = -1
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT hand_number, data FROM hands WHERE game_id = ? AND hand_number > ? ORDER BY hand_number LIMIT 256",
+                    (game_id, last_number)
+                ).fetchall()
+            if not rows:
+                return
+            for hand_number, data in rows:
+                yield json.loads(data)
+            last_number = rows[-1][0]
+
+    def player_stats(self, name: str) -> dict:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hands_played, hands_won, chips_won, profit FROM player_stats WHERE name = ?", (name,)
+            ).fetchone()
+            action_rows = self._conn.execute(
+                "SELECT stage, action, count, amount FROM player_action_stats WHERE name = ?", (name,)
+            ).fetchall()
+        hands_played, hands_won, chips_won, profit = row if row else (0, 0, 0, 0)
+        actions = {f"{stage}:{action}": {"count": count, "amount": amount} for stage, action, count, amount in action_rows}
+        return {
+            "name": name,
+            "hands_played": hands_played,
+            "hands_won": hands_won,
+            "win_rate": hands_won / hands_played if hands_played else 0.0,
+            "chips_won": chips_won,
+            "profit": profit,
+            "folds_pre_exchange": actions.get("pre-exchange:fold", {}).get("count", 0),
+            "actions": actions
+        }
+
+    def count_actions(self, name: str, action: str, stage: str = None) -> int:
+        query = "SELECT COALESCE(SUM(count), 0) FROM player_action_stats WHERE name = ? AND action = ?"
+        params = [name, action]
+        if stage is not None:
+            query += " AND stage = ?"
+            params.append(stage)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def player_names(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT name FROM player_stats ORDER BY name")]
+
+    def import_json_files(self, pattern: str = os.path.join('data', 'history_*.json'), batch_size: int = 1000) -> int:
+        imported = 0
+        batch = []
+        for path in sorted(glob.glob(pattern)):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    batch.append(json.load(f))
+            except (IOError, json.JSONDecodeError) as e:
+                print(f"Pominięto plik {path}: {e}")
+                continue
+            if len(batch) >= batch_size:
+                imported += self.add_hands(batch)
+                batch = []
+        if batch:
+            imported += self.add_hands(batch)
+        return imported
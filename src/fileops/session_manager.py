@@ -1,33 +1,118 @@
+import copy
 import json
 import os
 from datetime import datetime
+from typing import Optional
+
+# Pola zmieniające się co rundę; dziennik zapisuje tylko je, resztę stanu bierze z migawki.
+_DELTA_FIELDS = ('round_counter', 'dealer_pos', 'players')
 
 class SessionManager:
-    def __init__(self, data_dir: str = 'data'):
+    def __init__(self, data_dir: str = 'data', snapshot_every: int = 10):
         self.data_dir = data_dir
+        self.snapshot_every = snapshot_every
+        # Ostatnia zapisana migawka każdej gry, względem której liczone są wpisy dziennika.
+        self._snapshots = {}
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
 
+    def _snapshot_path(self, game_id: str) -> str:
+        return os.path.join(self.data_dir, f"session_{game_id}.json")
+
+    def _journal_path(self, game_id: str) -> str:
+        return os.path.join(self.data_dir, f"session_{game_id}.journal.jsonl")
+
     def save_session(self, session_data: dict) -> None:
         game_id = session_data.get("game_id", f"game_{datetime.now().strftime('%Y%m%d%H%M%S')}")
-        filepath = os.path.join(self.data_dir, f"session_{game_id}.json")
-        
+        filepath = self._snapshot_path(game_id)
+        tmp_path = filepath + '.tmp'
+
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(session_data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+            self._snapshots[game_id] = copy.deepcopy(session_data)
         except IOError as e:
             print(f"Błąd podczas zapisywania sesji: {e}")
 
+    def save_checkpoint(self, session_data: dict) -> None:
+        game_id = session_data["game_id"]
+        round_counter = session_data.get("round_counter", 0)
+        snapshot = self._snapshots.get(game_id)
+        delta = _session_delta(snapshot, session_data) if snapshot is not None else None
+        if delta is None or round_counter % self.snapshot_every == 0:
+            self.save_session(session_data)
+            try:
+                # Wpisy dziennika sprzed migawki są już w niej zawarte.
+                open(self._journal_path(game_id), 'w').close()
+            except IOError as e:
+                print(f"Błąd podczas czyszczenia dziennika sesji: {e}")
+            return
+
+        try:
+            with open(self._journal_path(game_id), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(delta, ensure_ascii=False, separators=(',', ':')) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        except IOError as e:
+            print(f"Błąd podczas zapisywania dziennika sesji: {e}")
+
     def load_session(self, game_id: str) -> dict:
-        filepath = os.path.join(self.data_dir, f"session_{game_id}.json")
-        
+        filepath = self._snapshot_path(game_id)
+
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 print(f"Wczytywanie sesji z {filepath}...")
-                return json.load(f)
+                session_data = json.load(f)
         except FileNotFoundError:
             print(f"Błąd: Plik sesji nie został znaleziony w {filepath}")
             return {}
         except (IOError, json.JSONDecodeError) as e:
             print(f"Błąd podczas wczytywania sesji: {e}")
-            return {}
\ No newline at end of file
+            return {}
+
+        snapshot = session_data
+        try:
+            with open(self._journal_path(game_id), 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Niedokończony ostatni wpis po przerwanym zapisie.
+                        break
+                    if entry.get("round_counter", 0) > session_data.get("round_counter", 0):
+                        # Starsze dzienniki zawierają pełny stan sesji zamiast zmian względem migawki.
+                        session_data = _apply_delta(snapshot, entry) if "stacks" in entry else entry
+        except FileNotFoundError:
+            pass
+        except IOError as e:
+            print(f"Błąd podczas wczytywania dziennika sesji: {e}")
+        return session_data
+
+
+def _session_delta(snapshot: dict, session_data: dict) -> Optional[dict]:
+    # Zmiany względem migawki: numer rundy, pozycja rozdającego i stosy graczy pozostałych przy stole
+    # (w kolejności miejsc). Każda inna zmiana, np. nowy gracz albo inne blindy, wymaga nowej migawki.
+    if any(session_data.get(key) != snapshot.get(key) for key in session_data.keys() | snapshot.keys()
+           if key not in _DELTA_FIELDS):
+        return None
+    known = {player["id"]: player for player in snapshot.get("players", [])}
+    stacks = []
+    for player in session_data.get("players", []):
+        base = known.get(player.get("id"))
+        if base is None or player.keys() != base.keys() or any(player[key] != base[key] for key in player if key != "stack"):
+            return None
+        stacks.append([player["id"], player["stack"]])
+    return {"round_counter": session_data.get("round_counter", 0), "dealer_pos": session_data.get("dealer_pos", -1),
+            "stacks": stacks}
+
+
+def _apply_delta(snapshot: dict, delta: dict) -> dict:
+    session_data = dict(snapshot)
+    known = {player["id"]: player for player in snapshot.get("players", [])}
+    session_data["round_counter"] = delta["round_counter"]
+    session_data["dealer_pos"] = delta["dealer_pos"]
+    session_data["players"] = [dict(known[player_id], stack=stack) for player_id, stack in delta["stacks"]]
+    return session_data
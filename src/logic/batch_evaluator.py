@@ -0,0 +1,56 @@
+from itertools import combinations_with_replacement
+from math import comb
+import numpy as np
+from .card import CARD_SUITS, CARD_VALUES
+from .hand_evaluator import evaluate
+
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+_VALUE_OF = np.array([value - 2 for value in CARD_VALUES], dtype=np.int16)
+_SUIT_OF = np.array(CARD_SUITS, dtype=np.int8)
+# Posortowane rangi v0 <= ... <= v4 przechodzą w ściśle rosnące v_i + i, więc multizbiór rang
+# ma indeks kombinatoryczny (colex) z zakresu 0..C(17, 5) - 1.
+_BINOMIALS = np.array([[comb(n, k) for n in range(17)] for k in range(1, 6)], dtype=np.int32)
+_NUM_MULTISETS = comb(17, 5)
+_SORTING_NETWORK = ((0, 1), (3, 4), (2, 4), (2, 3), (0, 3), (0, 2), (1, 4), (1, 3), (1, 2))
+
+
+def _build_tables():
+    plain_scores = np.full(_NUM_MULTISETS, -1, dtype=np.int32)
+    flush_scores = np.full(_NUM_MULTISETS, -1, dtype=np.int32)
+    for values in combinations_with_replacement(range(13), 5):
+        index = sum(comb(v + i, i + 1) for i, v in enumerate(values))
+        if values.count(values[0]) < 5:
+            plain_scores[index] = evaluate([(i % 4) * 13 + v for i, v in enumerate(values)])
+        if len(set(values)) == 5:
+            flush_scores[index] = evaluate(list(values))
+    return plain_scores, flush_scores
+
+
+_PLAIN_SCORES, _FLUSH_SCORES = _build_tables()
+
+
+def evaluate_batch(hands, chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.ndarray:
+    hands = np.asarray(hands)
+    if hands.ndim != 2 or hands.shape[1] != 5:
+        raise ValueError("Tablica rąk musi mieć kształt (N, 5).")
+    if hands.size and (hands.min() < 0 or hands.max() > 51):
+        raise ValueError("Kody kart muszą mieścić się w zakresie 0-51.")
+
+    scores = np.empty(len(hands), dtype=np.int32)
+    for start in range(0, len(hands), chunk_size):
+        block = hands[start:start + chunk_size].T
+        values = [_VALUE_OF[column] for column in block]
+        suits = [_SUIT_OF[column] for column in block]
+
+        for a, b in _SORTING_NETWORK:
+            low = np.minimum(values[a], values[b])
+            values[b] = np.maximum(values[a], values[b])
+            values[a] = low
+        index = _BINOMIALS[0][values[0]]
+        for i in range(1, 5):
+            index = index + _BINOMIALS[i][values[i] + i]
+
+        is_flush = (suits[0] == suits[1]) & (suits[0] == suits[2]) & (suits[0] == suits[3]) & (suits[0] == suits[4])
+        scores[start:start + len(index)] = np.where(is_flush, _FLUSH_SCORES[index], _PLAIN_SCORES[index])
+    return scores
@@ -0,0 +1,105 @@
+import random
+import time
+from typing import NamedTuple, Optional
+import numpy as np
+from .batch_evaluator import evaluate_batch
+from .deck import Deck
+from .discard_table import TABLE_MAGIC, TABLE_PATH
+from .hand_index import BINOMIALS, NUM_HANDS
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+MAX_PLAYERS = 5
+
+_HAND_BINOMIALS = np.array(BINOMIALS[1:6], dtype=np.int32)
+_POSITIONS = np.arange(5, dtype=np.uint8)
+
+
+class BatchResult(NamedTuple):
+    scores: np.ndarray
+    final_hands: np.ndarray
+    winners: np.ndarray
+
+
+def load_hold_masks(path: str = TABLE_PATH) -> Optional[np.ndarray]:
+    try:
+        data = np.memmap(path, dtype=np.uint8, mode='r')
+    except (OSError, ValueError):
+        return None
+    if len(data) != len(TABLE_MAGIC) + NUM_HANDS or bytes(data[:len(TABLE_MAGIC)]) != TABLE_MAGIC:
+        return None
+    return data[len(TABLE_MAGIC):]
+
+
+def shuffle_decks(num_hands: int, rng: np.random.Generator) -> np.ndarray:
+    return rng.permuted(np.tile(np.arange(52, dtype=np.int8), (num_hands, 1)), axis=1)
+
+
+def engine_decks(seed: int, num_players: int, first_round: int, num_hands: int) -> np.ndarray:
+    # Te same talie co GameEngine.play_round: generator ustawiany z (seed, numer rundy) i częściowe tasowanie.
+    deck = Deck(random.Random())
+    decks = np.empty((num_hands, 52), dtype=np.int8)
+    for i in range(num_hands):
+        deck.rng.seed((seed << 32) + first_round + i)
+        deck.reset()
+        deck.shuffle(9 * num_players)
+        decks[i] = deck.cards
+    return decks
+
+
+def _exchange(hands: np.ndarray, decks: np.ndarray, offsets: np.ndarray, hold_masks: np.ndarray):
+    ordered = np.sort(hands, axis=1)
+    index = _HAND_BINOMIALS[0][ordered[:, 0]]
+    for i in range(1, 5):
+        index = index + _HAND_BINOMIALS[i][ordered[:, i]]
+    held = (np.asarray(hold_masks[index])[:, None] >> _POSITIONS & 1).astype(bool)
+    # Odrzucone karty zastępowane są kolejnymi kartami z talii, tak jak w _exchange_cards.
+    draw_rank = np.cumsum(~held, axis=1) - 1
+    positions = np.where(held, 0, offsets[:, None] + draw_rank)
+    drawn = np.take_along_axis(decks, positions, axis=1)
+    return np.where(held, ordered, drawn), 5 - held.sum(axis=1)
+
+
+def simulate_batch(decks: np.ndarray, num_players: int, hold_masks: np.ndarray = None) -> BatchResult:
+    if not 2 <= num_players <= MAX_PLAYERS:
+        raise ValueError(f"Liczba graczy musi mieścić się w zakresie 2-{MAX_PLAYERS}.")
+    num_hands = len(decks)
+    # Deck.deal rozdaje po jednej karcie kolejno każdemu graczowi: karta j gracza p to talia[j * P + p].
+    dealt = decks[:, :5 * num_players].reshape(num_hands, 5, num_players)
+    offsets = np.full(num_hands, 5 * num_players, dtype=np.int64)
+    scores = np.empty((num_hands, num_players), dtype=np.int32)
+    final_hands = np.empty((num_hands, num_players, 5), dtype=np.int8)
+    for seat in range(num_players):
+        hands = dealt[:, :, seat]
+        if hold_masks is not None:
+            hands, drawn = _exchange(hands, decks, offsets, hold_masks)
+            offsets += drawn
+        final_hands[:, seat] = hands
+        scores[:, seat] = evaluate_batch(hands)
+    # argmax zwraca pierwsze maksimum, czyli remis wygrywa gracz wcześniej w kolejności, jak w _showdown.
+    return BatchResult(scores, final_hands, scores.argmax(axis=1))
+
+
+def simulate(num_hands: int, num_players: int, seed: int, hold_masks: np.ndarray = None,
+             chunk_size: int = DEFAULT_CHUNK_SIZE, engine_rng: bool = False) -> dict:
+    rng = np.random.default_rng(seed)
+    wins = np.zeros(num_players, dtype=np.int64)
+    ties = 0
+    start = time.perf_counter()
+    for first in range(0, num_hands, chunk_size):
+        count = min(chunk_size, num_hands - first)
+        decks = engine_decks(seed, num_players, first + 1, count) if engine_rng else shuffle_decks(count, rng)
+        result = simulate_batch(decks, num_players, hold_masks)
+        wins += np.bincount(result.winners, minlength=num_players)
+        ties += int(((result.scores == result.scores.max(axis=1, keepdims=True)).sum(axis=1) > 1).sum())
+    elapsed = time.perf_counter() - start
+    return {
+        "hands": num_hands,
+        "players": num_players,
+        "seed": seed,
+        "draw": hold_masks is not None,
+        "wins": wins.tolist(),
+        "win_rate": (wins / num_hands if num_hands else wins.astype(float)).tolist(),
+        "ties": ties,
+        "seconds": elapsed,
+        "hands_per_second": num_hands / elapsed if elapsed > 0 else 0.0
+    }
@@ -1,22 +1,72 @@
+from typing import Dict, Tuple
+
+
 class Card:
+    __slots__ = ('rank', 'suit', 'value', 'code')
+
     unicode_dict = {'s': '\u2660', 'h': '\u2665', 'd': '\u2666', 'c': '\u2663'}
     rank_values = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, 'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
+    _interned: Dict[Tuple[str, str], 'Card'] = {}
+
+    def __new__(cls, rank: str, suit: str):
+        card = cls._interned.get((rank, suit))
+        if card is None:
+            if rank not in cls.rank_values:
+                raise ValueError(f"Nieprawidłowa ranga: {rank}")
+            if suit not in cls.unicode_dict:
+                raise ValueError(f"Nieprawidłowy kolor: {suit}")
+            card = super().__new__(cls)
+            card.rank = rank
+            card.suit = suit
+            card.value = cls.rank_values[rank]
+            card.code = list(cls.unicode_dict).index(suit) * 13 + card.value - 2
+            cls._interned[(rank, suit)] = card
+        return card
 
-    def __init__(self, rank: str, suit: str):
-        if rank not in self.rank_values:
-            raise ValueError(f"Nieprawidłowa ranga: {rank}")
-        if suit not in self.unicode_dict:
-            raise ValueError(f"Nieprawidłowy kolor: {suit}")
-            
-        self.rank = rank
-        self.suit = suit
-        self.value = self.rank_values[rank]
+    @staticmethod
+    def from_code(code: int) -> 'Card':
+        return CARDS[code]
 
     def get_value(self) -> tuple[int, str]:
         return (self.value, self.suit)
 
+    def __index__(self) -> int:
+        return self.code
+
+    def __int__(self) -> int:
+        return self.code
+
+    def __reduce__(self):
+        return (Card, (self.rank, self.suit))
+
+    def __copy__(self) -> 'Card':
+        return self
+
+    def __deepcopy__(self, memo) -> 'Card':
+        return self
+
     def __str__(self) -> str:
         return f"{self.rank}{self.unicode_dict[self.suit]}"
         
     def __repr__(self) -> str:
-        return f"Card('{self.rank}', '{self.suit}')"
\ No newline at end of file
+        return f"Card('{self.rank}', '{self.suit}')"
+
+
+RANKS = tuple(Card.rank_values)
+SUITS = tuple(Card.unicode_dict)
+CARDS = tuple(Card(rank, suit) for suit in SUITS for rank in RANKS)
+CARD_VALUES = tuple(card.value for card in CARDS)
+CARD_SUITS = tuple(card.code // 13 for card in CARDS)
+_CARD_STRS = tuple(str(card) for card in CARDS)
+_CODES_BY_STR = {text: code for code, text in enumerate(_CARD_STRS)}
+
+
+def card_to_str(code: int) -> str:
+    return _CARD_STRS[code]
+
+
+def card_from_str(text: str) -> int:
+    try:
+        return _CODES_BY_STR[text]
+    except KeyError:
+        raise ValueError(f"Nieprawidłowa karta: {text}") from None
@@ -0,0 +1,179 @@
+import os
+import time
+from itertools import combinations
+from multiprocessing import Pool
+from typing import NamedTuple, Optional
+import numpy as np
+from .batch_evaluator import evaluate_batch
+from .batch_simulator import load_hold_masks, shuffle_decks, simulate_batch
+from .hand_evaluator import NUM_SCORES
+from .hand_index import NUM_HANDS
+from .strategy_table import CALLED, CALL_RAISED, INFOSET_ACTIONS, MAX_ACTIONS, RAISED, ROOT, write_strategy_table
+
+CHECKPOINT_VERSION = 1
+DEFAULT_BUCKETS = 16
+DEFAULT_BATCH_SIZE = 1 << 14
+
+_VALID_ACTIONS = np.array([[i < len(actions) for i in range(MAX_ACTIONS)] for actions in INFOSET_ACTIONS])
+
+_hold_masks = None
+_bucket_of_score = None
+
+
+class CFRState(NamedTuple):
+    regrets: np.ndarray
+    strategy_sums: np.ndarray
+    iteration: int
+
+
+def bucket_of_score_table(num_buckets: int) -> np.ndarray:
+    # Koszyk ręki to percentyl jej siły przed wymianą wśród wszystkich C(52,5) układów.
+    hands = np.fromiter(combinations(range(52), 5), dtype=np.dtype((np.int8, 5)), count=NUM_HANDS)
+    counts = np.bincount(evaluate_batch(hands), minlength=NUM_SCORES)
+    percentile = (np.cumsum(counts) - counts / 2) / NUM_HANDS
+    return np.minimum((percentile * num_buckets).astype(np.int64), num_buckets - 1).astype(np.uint8)
+
+
+def regret_matching(regrets: np.ndarray) -> np.ndarray:
+    positive = np.maximum(regrets, 0.0) * _VALID_ACTIONS[:, None, :]
+    totals = positive.sum(axis=2, keepdims=True)
+    uniform = np.broadcast_to(_VALID_ACTIONS[:, None, :] / _VALID_ACTIONS.sum(axis=1)[:, None, None], regrets.shape)
+    return np.where(totals > 0, positive / np.where(totals > 0, totals, 1.0), uniform)
+
+
+def sample_deals(rng: np.random.Generator, count: int, hold_masks: np.ndarray, bucket_of_score: np.ndarray):
+    # Rozdanie heads-up z wymianą według tablicy; wynik z perspektywy małego blinda: 1 wygrana, 0.5 remis, 0 przegrana.
+    decks = shuffle_decks(count, rng)
+    result = simulate_batch(decks, 2, hold_masks)
+    dealt = decks[:, :10].reshape(count, 5, 2).transpose(0, 2, 1).reshape(-1, 5)
+    buckets = bucket_of_score[evaluate_batch(dealt)].reshape(count, 2)
+    outcome = np.sign(result.scores[:, 0] - result.scores[:, 1]) * 0.5 + 0.5
+    return buckets[:, 0], buckets[:, 1], outcome
+
+
+def regret_deltas(strategy: np.ndarray, first: np.ndarray, second: np.ndarray, outcome: np.ndarray,
+                  small_blind: int, big_blind: int):
+    num_buckets = strategy.shape[1]
+    s_root, s_called = strategy[ROOT, first], strategy[CALLED, second]
+    s_call_raised, s_raised = strategy[CALL_RAISED, first], strategy[RAISED, second]
+    # Wartość showdownu dla małego blinda, gdy każdy z graczy włożył do puli duży blind albo jego dwukrotność.
+    showdown = 2.0 * outcome - 1.0
+    limped, raised = showdown * big_blind, showdown * 2 * big_blind
+    zeros = np.zeros_like(outcome)
+
+    v_call_raised = s_call_raised[:, 0] * -big_blind + s_call_raised[:, 1] * raised
+    v_called = s_called[:, 0] * limped + s_called[:, 1] * v_call_raised
+    v_raised = s_raised[:, 0] * big_blind + s_raised[:, 1] * raised
+
+    deltas = np.zeros((len(INFOSET_ACTIONS), num_buckets, MAX_ACTIONS))
+    sums = np.zeros_like(deltas)
+
+    def accumulate(infoset, buckets, values, strategy_rows, reach):
+        expected = (strategy_rows * values).sum(axis=1, keepdims=True)
+        np.add.at(deltas[infoset], buckets, (values - expected) * _VALID_ACTIONS[infoset])
+        np.add.at(sums[infoset], buckets, reach[:, None] * strategy_rows)
+
+    ones = np.ones_like(outcome)
+    accumulate(ROOT, first, np.stack([zeros - small_blind, v_called, v_raised], axis=1), s_root, ones)
+    accumulate(CALL_RAISED, first, np.stack([zeros - big_blind, raised, zeros], axis=1) * s_called[:, 1:2],
+               s_call_raised, s_root[:, 1])
+    accumulate(CALLED, second, -np.stack([limped, v_call_raised, zeros], axis=1) * s_root[:, 1:2], s_called, ones)
+    accumulate(RAISED, second, -np.stack([zeros + big_blind, raised, zeros], axis=1) * s_root[:, 2:3], s_raised, ones)
+    return deltas, sums
+
+
+def _init_worker(hold_masks_path: Optional[str], bucket_of_score: np.ndarray) -> None:
+    global _hold_masks, _bucket_of_score
+    _hold_masks = load_hold_masks(hold_masks_path) if hold_masks_path else None
+    _bucket_of_score = bucket_of_score
+
+
+def train_batch(task: tuple):
+    strategy, seed, count, small_blind, big_blind = task
+    rng = np.random.default_rng(seed)
+    first, second, outcome = sample_deals(rng, count, _hold_masks, _bucket_of_score)
+    # Każde rozdanie liczone jest dwukrotnie, z zamienionymi pozycjami graczy.
+    deltas, sums = regret_deltas(strategy, first, second, outcome, small_blind, big_blind)
+    swapped_deltas, swapped_sums = regret_deltas(strategy, second, first, 1.0 - outcome, small_blind, big_blind)
+    return deltas + swapped_deltas, sums + swapped_sums, 2 * count
+
+
+class CFRTrainer:
+    def __init__(self, small_blind: int, big_blind: int, num_buckets: int = DEFAULT_BUCKETS,
+                 batch_size: int = DEFAULT_BATCH_SIZE, workers: int = None, seed: int = 0,
+                 hold_masks_path: Optional[str] = None):
+        if not 2 <= num_buckets <= 256:
+            raise ValueError("Liczba koszyków musi mieścić się w zakresie 2-256.")
+        self.small_blind = small_blind
+        self.big_blind = big_blind
+        self.num_buckets = num_buckets
+        self.batch_size = batch_size
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.hold_masks_path = hold_masks_path
+        self.bucket_of_score = bucket_of_score_table(num_buckets)
+        shape = (len(INFOSET_ACTIONS), num_buckets, MAX_ACTIONS)
+        self.state = CFRState(np.zeros(shape), np.zeros(shape), 0)
+
+    def _params(self) -> np.ndarray:
+        return np.array([CHECKPOINT_VERSION, self.small_blind, self.big_blind, self.num_buckets, self.seed], dtype=np.int64)
+
+    def save_checkpoint(self, path: str) -> None:
+        tmp_path = path + '.tmp.npz'
+        np.savez(tmp_path, params=self._params(), regrets=self.state.regrets,
+                 strategy_sums=self.state.strategy_sums, iteration=np.int64(self.state.iteration))
+        os.replace(tmp_path, path)
+
+    def load_checkpoint(self, path: str) -> None:
+        with np.load(path) as data:
+            if not np.array_equal(data['params'], self._params()):
+                raise ValueError(f"Punkt kontrolny {path} pochodzi z treningu o innych parametrach.")
+            self.state = CFRState(data['regrets'], data['strategy_sums'], int(data['iteration']))
+
+    def strategy(self) -> np.ndarray:
+        return regret_matching(self.state.regrets)
+
+    def average_strategy(self) -> np.ndarray:
+        sums = self.state.strategy_sums
+        totals = sums.sum(axis=2, keepdims=True)
+        return np.where(totals > 0, sums / np.where(totals > 0, totals, 1.0), regret_matching(np.zeros_like(sums)))
+
+    def train(self, iterations: int, checkpoint_path: str = None, checkpoint_every: int = 50,
+              progress=None) -> dict:
+        start = time.perf_counter()
+        deals = 0
+        first_iteration = self.state.iteration
+        with Pool(self.workers, initializer=_init_worker, initargs=(self.hold_masks_path, self.bucket_of_score)) as pool:
+            for iteration in range(first_iteration + 1, first_iteration + iterations + 1):
+                strategy = self.strategy()
+                # Ziarno zależy od numeru iteracji i workera, więc wznowiony trening (przy tej samej liczbie workerów) daje te same wyniki.
+                tasks = [(strategy, (self.seed, iteration, worker), self.batch_size, self.small_blind, self.big_blind)
+                         for worker in range(self.workers)]
+                deltas = np.zeros_like(self.state.regrets)
+                sums = np.zeros_like(self.state.strategy_sums)
+                samples = 0
+                for batch_deltas, batch_sums, count in pool.imap(train_batch, tasks):
+                    deltas += batch_deltas
+                    sums += batch_sums
+                    samples += count
+                deals += samples
+                # CFR+: ujemne żale są obcinane, a średnia strategia ważona numerem iteracji.
+                regrets = np.maximum(self.state.regrets + deltas / samples, 0.0)
+                self.state = CFRState(regrets, self.state.strategy_sums + iteration * sums / samples, iteration)
+                if checkpoint_path and iteration % checkpoint_every == 0:
+                    self.save_checkpoint(checkpoint_path)
+                if progress is not None:
+                    progress(iteration)
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path)
+        elapsed = time.perf_counter() - start
+        return {
+            "iterations": self.state.iteration,
+            "new_iterations": iterations,
+            "deals": deals,
+            "seconds": elapsed,
+            "deals_per_second": deals / elapsed if elapsed > 0 else 0.0
+        }
+
+    def write_strategy(self, path: str) -> None:
+        write_strategy_table(path, self.average_strategy(), self.bucket_of_score, self.small_blind, self.big_blind)
@@ -1,33 +1,60 @@
 import random
 from typing import List
-from .card import Card
+from .card import CARDS, card_to_str
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .player import Player
 
+_FULL_DECK = tuple(range(len(CARDS)))
+
 class Deck:
-    def __init__(self):
-        ranks = list(Card.rank_values.keys())
-        suits = list(Card.unicode_dict.keys())
-        self.cards = [Card(rank, suit) for suit in suits for rank in ranks]
-        self.discards = []
+    def __init__(self, rng: random.Random = None):
+        self.cards: List[int] = list(_FULL_DECK)
+        self.position = 0
+        self.discards: List[int] = []
+        self.rng = rng if rng is not None else random.Random()
 
     def __str__(self) -> str:
-        return f"Talia z {len(self.cards)} kartami."
+        return f"Talia z {len(self)} kartami."
+
+    def __len__(self) -> int:
+        return len(self.cards) - self.position
 
-    def shuffle(self) -> None:
-        random.shuffle(self.cards)
+    def reset(self) -> None:
+        self.cards[:] = _FULL_DECK
+        self.position = 0
+        self.discards.clear()
+
+    def shuffle(self, num_cards: int = None) -> None:
+        # Częściowy Fisher-Yates: losowane są tylko pozycje, które zostaną rozdane lub dobrane.
+        cards = self.cards
+        n = len(cards)
+        stop = n - 1 if num_cards is None else min(self.position + num_cards, n - 1)
+        rand = self.rng.random
+        for i in range(self.position, stop):
+            j = i + int(rand() * (n - i))
+            cards[i], cards[j] = cards[j], cards[i]
 
     def deal(self, players: List['Player'], num_cards: int):
+        cards = self.cards
+        pos = self.position
+        n = len(cards)
         for _ in range(num_cards):
             for player in players:
-                if self.cards:
-                    player.take_card(self.cards.pop(0))
+                if pos < n:
+                    player.take_card(cards[pos])
+                    pos += 1
+        self.position = pos
 
-    def draw(self) -> Card:
-        if not self.cards:
+    def draw(self) -> int:
+        if self.position >= len(self.cards):
             raise ValueError("Nie można dobrać karty z pustej talii.")
-        return self.cards.pop(0)
+        card = self.cards[self.position]
+        self.position += 1
+        return card
+
+    def discard_to_bottom(self, card: int) -> None:
+        self.discards.append(card)
 
-    def discard_to_bottom(self, card: Card) -> None:
-        self.discards.append(card)
\ No newline at end of file
+    def cards_to_str(self) -> List[str]:
+        return [card_to_str(c) for c in self.cards[self.position:]]
@@ -0,0 +1,40 @@
+import mmap
+import os
+from typing import List, Optional
+from .hand_index import NUM_HANDS, hand_index
+
+TABLE_PATH = os.path.join('data', 'discard_table.bin')
+TABLE_MAGIC = b'P5DRAW1\x00'
+
+
+class DiscardTable:
+    def __init__(self, path: str = TABLE_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._data[:len(TABLE_MAGIC)] != TABLE_MAGIC or len(self._data) != len(TABLE_MAGIC) + NUM_HANDS:
+            self._data.close()
+            raise ValueError(f"Plik {path} nie jest poprawną tablicą wymiany kart.")
+
+    def hold_mask(self, hand: List[int]) -> int:
+        return self._data[len(TABLE_MAGIC) + hand_index(hand)]
+
+    def best_discards(self, hand: List[int]) -> List[int]:
+        mask = self._data[len(TABLE_MAGIC) + hand_index(hand)]
+        order = sorted(range(5), key=hand.__getitem__)
+        return sorted(order[i] for i in range(5) if not mask >> i & 1)
+
+    def close(self) -> None:
+        self._data.close()
+
+
+_loaded_tables = {}
+
+
+def load_discard_table(path: str = TABLE_PATH) -> Optional[DiscardTable]:
+    if path not in _loaded_tables:
+        try:
+            _loaded_tables[path] = DiscardTable(path)
+        except (OSError, ValueError):
+            _loaded_tables[path] = None
+    return _loaded_tables[path]
@@ -0,0 +1,103 @@
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+from typing import Iterable, List, NamedTuple, Tuple
+from .card import CARD_SUITS, CARD_VALUES
+from .equity import canonical_key
+from .hand_evaluator import CATEGORIES, FLUSH_SCORES, PRIMES, PRODUCT_SCORES
+
+CATEGORY_NAMES = ('Wysoka karta', 'Para', 'Dwie pary', 'Trójka', 'Strit', 'Kolor', 'Full', 'Kareta', 'Poker',
+                  'Poker królewski')
+NUM_CATEGORIES = len(CATEGORY_NAMES)
+CACHE_SIZE = 65536
+
+_PRODUCT_CATEGORIES = {product: CATEGORIES[score] for product, score in PRODUCT_SCORES.items()}
+
+
+class DrawOutcome(NamedTuple):
+    counts: Tuple[int, ...]
+    total: int
+
+    def probabilities(self) -> Tuple[float, ...]:
+        return tuple(count / self.total for count in self.counts)
+
+    def at_least(self, category: int) -> float:
+        return sum(self.counts[category:]) / self.total
+
+
+def _rank_counts(start: int, drawn: int, product: int, weight: int, available: List[int], counts: List[int]) -> None:
+    # Ręce bez koloru zależą tylko od rang, więc zamiast kombinacji kart przechodzimy multizbiory rang
+    # z wagą równą liczbie sposobów wyboru kart z dostępnych kolorów; iloczyn liczb pierwszych rośnie przyrostowo.
+    if drawn == 0:
+        counts[_PRODUCT_CATEGORIES[product]] += weight
+        return
+    for rank in range(start, 13):
+        prime = PRIMES[rank]
+        left = available[rank]
+        for taken in range(1, min(left, drawn) + 1):
+            _rank_counts(rank + 1, drawn - taken, product * prime ** taken, weight * comb(left, taken), available, counts)
+
+
+def _count_outcomes(held: Tuple[int, ...], unavailable: frozenset) -> DrawOutcome:
+    drawn = 5 - len(held)
+    pool = [card for card in range(52) if card not in unavailable and card not in held]
+    if len(pool) < drawn:
+        raise ValueError(f"Za mało kart w talii ({len(pool)}) na wymianę {drawn} kart.")
+    counts = [0] * NUM_CATEGORIES
+    available = [0] * 13
+    for card in pool:
+        available[CARD_VALUES[card] - 2] += 1
+    product = 1
+    for card in held:
+        product *= PRIMES[CARD_VALUES[card] - 2]
+    _rank_counts(0, drawn, product, 1, available, counts)
+
+    # Poprawka na kolory: dobranie samych kart koloru trzymanych kart zamienia układ bez koloru na kolor lub poker.
+    held_suits = {CARD_SUITS[card] for card in held}
+    if len(held_suits) <= 1:
+        held_mask = 0
+        for card in held:
+            held_mask |= 1 << (CARD_VALUES[card] - 2)
+        for suit in held_suits or range(4):
+            ranks = [CARD_VALUES[card] - 2 for card in pool if CARD_SUITS[card] == suit]
+            for combo in combinations(ranks, drawn):
+                mask = held_mask
+                product = 1
+                for rank in combo:
+                    mask |= 1 << rank
+                for rank in range(13):
+                    if mask >> rank & 1:
+                        product *= PRIMES[rank]
+                counts[_PRODUCT_CATEGORIES[product]] -= 1
+                counts[CATEGORIES[FLUSH_SCORES[mask]]] += 1
+    return DrawOutcome(tuple(counts), comb(len(pool), drawn))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _canonical_outcome(key: tuple) -> DrawOutcome:
+    # Każdy klucz kanoniczny odpowiada układowi z kolorami przypisanymi według kolejności w kluczu.
+    held = []
+    unavailable = set()
+    for suit, (held_mask, dead_mask) in enumerate(key):
+        for value in range(2, 15):
+            if held_mask >> value & 1:
+                held.append(suit * 13 + value - 2)
+            if dead_mask >> value & 1:
+                unavailable.add(suit * 13 + value - 2)
+    return _count_outcomes(tuple(held), frozenset(unavailable))
+
+
+def draw_outcomes(hand: List[int], discards: Iterable[int], dead_cards: Iterable[int] = ()) -> DrawOutcome:
+    # Dokładny rozkład kategorii układów po wymianie kart o indeksach discards; karty z ręki i dead_cards
+    # nie mogą zostać dobrane. dead_cards to tylko karty znane graczowi, nigdy zakryte karty wymienione przez rywali.
+    discards = set(discards)
+    if len(hand) != 5 or not discards <= set(range(5)):
+        raise ValueError("Ręka musi mieć 5 kart, a indeksy wymiany muszą być z zakresu 0-4.")
+    held = [card for i, card in enumerate(hand) if i not in discards]
+    unavailable = {hand[i] for i in discards}
+    unavailable.update(card for card in dead_cards if card not in held)
+    return _canonical_outcome(canonical_key(held, unavailable))
+
+
+def clear_cache() -> None:
+    _canonical_outcome.cache_clear()
@@ -0,0 +1,160 @@
+import math
+import random
+import time
+from collections import OrderedDict
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+from .card import CARD_SUITS, CARD_VALUES
+from .discard_table import DiscardTable, load_discard_table
+from .hand_evaluator import evaluate
+
+_Z_95 = 1.96
+
+
+class EquityEstimate(NamedTuple):
+    equity: float
+    low: float
+    high: float
+    trials: int
+
+
+def simple_discards(hand: List[int]) -> List[int]:
+    values = [CARD_VALUES[card] for card in hand]
+    paired = [i for i, value in enumerate(values) if values.count(value) > 1]
+    if paired:
+        return [i for i in range(5) if i not in paired]
+    highest = max(range(5), key=values.__getitem__)
+    return [i for i in range(5) if i != highest]
+
+
+def canonical_key(hand: Iterable[int], dead_cards: Iterable[int]) -> Tuple[tuple, tuple]:
+    hand_masks = [0, 0, 0, 0]
+    dead_masks = [0, 0, 0, 0]
+    for card in hand:
+        hand_masks[CARD_SUITS[card]] |= 1 << CARD_VALUES[card]
+    for card in dead_cards:
+        dead_masks[CARD_SUITS[card]] |= 1 << CARD_VALUES[card]
+    return tuple(sorted(zip(hand_masks, dead_masks), reverse=True))
+
+
+def _canonical_cards(key: tuple) -> Tuple[List[int], tuple]:
+    hand = []
+    dead_cards = []
+    for suit, (hand_mask, dead_mask) in enumerate(key):
+        for value in range(2, 15):
+            if hand_mask >> value & 1:
+                hand.append(suit * 13 + value - 2)
+            if dead_mask >> value & 1:
+                dead_cards.append(suit * 13 + value - 2)
+    return hand, tuple(dead_cards)
+
+
+class EquityEngine:
+    def __init__(self, cache_size: int = 65536, discard_table: DiscardTable = None, seed: int = None,
+                 target_half_width: float = 0.02, batch_size: int = 16):
+        self.cache_size = cache_size
+        self.discard_table = discard_table if discard_table is not None else load_discard_table()
+        self.rng = random.Random(seed)
+        self.target_half_width = target_half_width
+        self.batch_size = batch_size
+        self._cache: OrderedDict = OrderedDict()
+
+    def estimate(self, hand: List[int], num_opponents: int, budget_ms: Optional[float] = 2.0,
+                 dead_cards: Iterable[int] = (), draw: bool = True, max_trials: int = 20000,
+                 seed: Union[int, str] = None) -> EquityEstimate:
+        if num_opponents < 1:
+            return EquityEstimate(1.0, 1.0, 1.0, 0)
+        key = (canonical_key(hand, dead_cards), num_opponents, draw)
+        if seed is None:
+            entry = self._cached_entry(key, self.rng)
+        else:
+            # Każdy klucz ma własny strumień prób wyprowadzony z ziarna, więc wynik po n próbach zależy tylko
+            # od ziarna i klucza, a nie od kolejności wywołań ani od tego, kto wcześniej wypełnił wpis.
+            entry = self._cached_entry(key + (seed,), None)
+            if entry[2] is None:
+                entry[2] = random.Random(f"{seed}:{key}")
+
+        deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000.0
+        if entry[1] < max_trials and not self._precise_enough(entry):
+            # Próby liczone są dla reprezentanta klucza kanonicznego, wspólnego dla wszystkich permutacji kolorów.
+            hand, dead_cards = _canonical_cards(key[0])
+        while entry[1] < max_trials and not self._precise_enough(entry):
+            count = min(self.batch_size, max_trials - entry[1])
+            entry[0] += self._run_trials(hand, dead_cards, num_opponents, draw, count, entry[2])
+            entry[1] += count
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return self._to_estimate(entry)
+
+    def _cached_entry(self, key: tuple, rng: Optional[random.Random]) -> list:
+        entry = self._cache.get(key)
+        if entry is None:
+            entry = [0.0, 0, rng]
+            self._cache[key] = entry
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return entry
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _precise_enough(self, entry: list) -> bool:
+        wins, trials, _ = entry
+        if trials < 2 * self.batch_size:
+            return False
+        p = wins / trials
+        return _Z_95 * math.sqrt(max(p * (1.0 - p), 1.0 / trials) / trials) <= self.target_half_width
+
+    def _to_estimate(self, entry: list) -> EquityEstimate:
+        wins, trials, _ = entry
+        if trials == 0:
+            return EquityEstimate(0.0, 0.0, 1.0, 0)
+        p = wins / trials
+        half_width = _Z_95 * math.sqrt(p * (1.0 - p) / trials)
+        return EquityEstimate(p, max(0.0, p - half_width), min(1.0, p + half_width), trials)
+
+    def _draw(self, hand: List[int], cards: List[int], pos: int) -> Tuple[List[int], int]:
+        discards = self.discard_table.best_discards(hand) if self.discard_table is not None else simple_discards(hand)
+        if not discards:
+            return hand, pos
+        end = pos + len(discards)
+        if end > len(cards):
+            # Przy wielu rywalach talii nie starcza na wszystkie wymiany; ręka zostaje bez wymiany.
+            return hand, pos
+        kept = [card for i, card in enumerate(hand) if i not in discards]
+        return kept + cards[pos:end], end
+
+    def _run_trials(self, hand: List[int], dead_cards: tuple, num_opponents: int, draw: bool, count: int,
+                    rng: random.Random) -> float:
+        known = set(hand)
+        known.update(dead_cards)
+        live = [card for card in range(52) if card not in known]
+        num_opponents = min(num_opponents, len(live) // 5)
+        needed = 5 * num_opponents + (4 * (num_opponents + 1) if draw else 0)
+        needed = min(needed, len(live))
+        sample = rng.sample
+        wins = 0.0
+
+        for _ in range(count):
+            cards = sample(live, needed)
+            pos = 5 * num_opponents
+            hero = hand
+            if draw:
+                hero, pos = self._draw(hand, cards, pos)
+            hero_score = evaluate(hero)
+            best = hero_score
+            ties = 1
+            for i in range(num_opponents):
+                opponent = cards[5 * i:5 * i + 5]
+                if draw:
+                    opponent, pos = self._draw(opponent, cards, pos)
+                score = evaluate(opponent)
+                if score > best:
+                    best = score
+                    break
+                if score == best:
+                    ties += 1
+            if best == hero_score:
+                wins += 1.0 / ties
+        return wins
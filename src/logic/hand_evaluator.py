@@ -0,0 +1,66 @@
+from itertools import combinations, combinations_with_replacement
+from typing import List
+from .card import CARDS
+from .hand_ranker import hand_rank
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_PRIME = tuple(PRIMES[card.value - 2] for card in CARDS)
+_BIT = tuple(1 << (card.value - 2) for card in CARDS)
+_SUIT = tuple(card.code // 13 for card in CARDS)
+
+
+def _build_tables():
+    flush_masks = {}
+    products = {}
+
+    for combo in combinations(range(13), 5):
+        hand = list(combo)
+        mask = 0
+        for card in hand:
+            mask |= _BIT[card]
+        flush_masks[mask] = hand_rank(hand)
+
+    for combo in combinations_with_replacement(range(13), 5):
+        if combo.count(combo[0]) == 5:
+            continue
+        # Kolejne pozycje dostają różne kolory, więc powtórzone rangi nigdy nie mają tego samego koloru,
+        # a pięć pozycji (s, h, d, c, s) nigdy nie tworzy koloru.
+        hand = [(i % 4) * 13 + rank for i, rank in enumerate(combo)]
+        product = 1
+        for card in hand:
+            product *= _PRIME[card]
+        products[product] = hand_rank(hand)
+
+    rank_tuples = sorted(set(flush_masks.values()) | set(products.values()))
+    scores = {rank: score for score, rank in enumerate(rank_tuples)}
+
+    flush_scores = [-1] * (1 << 13)
+    for mask, rank in flush_masks.items():
+        flush_scores[mask] = scores[rank]
+    product_scores = {product: scores[rank] for product, rank in products.items()}
+    return flush_scores, product_scores, rank_tuples
+
+
+# Tablice są częścią interfejsu modułu: draw_outcomes liczy na nich kategorie układów bez składania rąk.
+FLUSH_SCORES, PRODUCT_SCORES, _RANK_TUPLES = _build_tables()
+CATEGORIES = tuple(rank[0] for rank in _RANK_TUPLES)
+NUM_SCORES = len(_RANK_TUPLES)
+
+
+def evaluate(hand: List[int]) -> int:
+    c0, c1, c2, c3, c4 = hand
+    if _SUIT[c0] == _SUIT[c1] == _SUIT[c2] == _SUIT[c3] == _SUIT[c4]:
+        return FLUSH_SCORES[_BIT[c0] | _BIT[c1] | _BIT[c2] | _BIT[c3] | _BIT[c4]]
+    return PRODUCT_SCORES[_PRIME[c0] * _PRIME[c1] * _PRIME[c2] * _PRIME[c3] * _PRIME[c4]]
+
+
+def score_to_rank(score: int) -> tuple:
+    return _RANK_TUPLES[score]
+
+
+def score_category(score: int) -> int:
+    return CATEGORIES[score]
+
+
+def hand_rank_fast(hand: List[int]) -> tuple:
+    return _RANK_TUPLES[evaluate(hand)]
@@ -0,0 +1,28 @@
+from math import comb
+from typing import List
+
+NUM_HANDS = comb(52, 5)
+BINOMIALS = tuple(tuple(comb(n, k) for n in range(53)) for k in range(6))
+_B1, _B2, _B3, _B4, _B5 = BINOMIALS[1:]
+
+
+def hand_index(hand: List[int]) -> int:
+    c0, c1, c2, c3, c4 = sorted(hand)
+    return _B1[c0] + _B2[c1] + _B3[c2] + _B4[c3] + _B5[c4]
+
+
+def subset_index(cards: List[int]) -> int:
+    return sum(BINOMIALS[i + 1][card] for i, card in enumerate(sorted(cards)))
+
+
+def hand_from_index(index: int, size: int = 5) -> List[int]:
+    if not 0 <= index < comb(52, size):
+        raise ValueError(f"Indeks ręki poza zakresem: {index}")
+    cards = []
+    for k in range(size, 0, -1):
+        card = k - 1
+        while BINOMIALS[k][card + 1] <= index:
+            card += 1
+        index -= BINOMIALS[k][card]
+        cards.append(card)
+    return cards[::-1]
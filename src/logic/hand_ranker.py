@@ -1,13 +1,13 @@
 from collections import Counter
 from typing import List
-from .card import Card
+from .card import CARD_SUITS, CARD_VALUES
 
-def hand_rank(hand: List[Card]) -> tuple:
+def hand_rank(hand: List[int]) -> tuple:
     if not isinstance(hand, list) or len(hand) != 5:
-        raise ValueError("Ręka musi być listą 5 obiektów Card.")
+        raise ValueError("Ręka musi być listą 5 kart.")
 
-    values = sorted([card.value for card in hand], reverse=True)
-    suits = [card.suit for card in hand]
+    values = sorted([CARD_VALUES[card] for card in hand], reverse=True)
+    suits = [CARD_SUITS[card] for card in hand]
     
     is_flush = len(set(suits)) == 1
     is_straight = (values[0] - values[4] == 4) and len(set(values)) == 5
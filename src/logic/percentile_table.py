@@ -0,0 +1,47 @@
+import mmap
+import os
+from typing import List, Optional
+from .hand_index import NUM_HANDS, hand_index
+
+PERCENTILE_PATH = os.path.join('data', 'percentile_table.bin')
+PERCENTILE_MAGIC = b'P5PCTL1\x00'
+PERCENTILE_SCALE = 255
+
+
+class PercentileTable:
+    # Bajt na rękę (indeks colex): odsetek słabszych układów przeskalowany do 0-255.
+    # Opcjonalna druga płaszczyzna to oczekiwany percentyl po optymalnej wymianie kart.
+    def __init__(self, path: str = PERCENTILE_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        planes, rest = divmod(len(self._data) - len(PERCENTILE_MAGIC), NUM_HANDS)
+        if self._data[:len(PERCENTILE_MAGIC)] != PERCENTILE_MAGIC or rest or planes not in (1, 2):
+            self._data.close()
+            raise ValueError(f"Plik {path} nie jest poprawną tablicą percentyli.")
+        self.has_draw = planes == 2
+
+    def percentile(self, hand: List[int]) -> float:
+        return self._data[len(PERCENTILE_MAGIC) + hand_index(hand)] / PERCENTILE_SCALE
+
+    def draw_percentile(self, hand: List[int]) -> float:
+        # Bez płaszczyzny wymiany najlepszym przybliżeniem jest siła ręki przed wymianą.
+        offset = len(PERCENTILE_MAGIC) + hand_index(hand)
+        if self.has_draw:
+            offset += NUM_HANDS
+        return self._data[offset] / PERCENTILE_SCALE
+
+    def close(self) -> None:
+        self._data.close()
+
+
+_loaded_tables = {}
+
+
+def load_percentile_table(path: str = PERCENTILE_PATH) -> Optional[PercentileTable]:
+    if path not in _loaded_tables:
+        try:
+            _loaded_tables[path] = PercentileTable(path)
+        except (OSError, ValueError):
+            _loaded_tables[path] = None
+    return _loaded_tables[path]
@@ -1,12 +1,12 @@
 from typing import List, Tuple
-from .card import Card
+from .card import card_to_str
 
 class Player:
     def __init__(self, id: int, name: str, stack: int, is_human: bool = False):
         self.id = id
         self._stack = stack
         self.name = name
-        self.hand: List[Card] = []
+        self.hand: List[int] = []
         self.is_human = is_human
         self.is_active = True
         self.bet_in_round = 0
@@ -21,10 +21,10 @@ class Player:
             raise ValueError("Stos nie może być ujemny.")
         self._stack = value
 
-    def take_card(self, card: Card) -> None:
+    def take_card(self, card: int) -> None:
         self.hand.append(card)
 
-    def change_card(self, new_card: Card, idx: int) -> Card:
+    def change_card(self, new_card: int, idx: int) -> int:
         if not 0 <= idx < len(self.hand):
             raise IndexError("Indeks karty jest poza zakresem.")
         
@@ -32,15 +32,14 @@ class Player:
         self.hand[idx] = new_card
         return old_card
 
-    def get_player_hand(self) -> Tuple[Card, ...]:
+    def get_player_hand(self) -> Tuple[int, ...]:
         return tuple(self.hand)
 
     def cards_to_str(self) -> str:
-        return ' '.join(str(card) for card in self.hand)
+        return ' '.join(card_to_str(card) for card in self.hand)
 
     def fold(self):
         self.is_active = False
-        print(f"{self.name} pasuje.")
 
     @classmethod
     def create_players(cls, player_specs: List[dict]) -> List['Player']:
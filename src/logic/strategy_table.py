@@ -0,0 +1,70 @@
+import mmap
+import os
+import struct
+from typing import List, Optional
+from .hand_evaluator import NUM_SCORES, evaluate
+
+STRATEGY_PATH = os.path.join('data', 'cfr_strategy.bin')
+STRATEGY_MAGIC = b'P5CFR1\x00\x00'
+_HEADER = struct.Struct('<HHII')
+_DATA_OFFSET = len(STRATEGY_MAGIC) + _HEADER.size
+MAX_ACTIONS = 3
+
+# Zbiory informacyjne abstrakcyjnej licytacji przed wymianą (pierwszy działa mały blind):
+# ROOT - pierwsza decyzja wobec dużego blinda, CALLED - opcja po wyrównaniu,
+# CALL_RAISED - odpowiedź na przebicie po własnym wyrównaniu, RAISED - odpowiedź na przebicie z pierwszej pozycji.
+ROOT, CALLED, CALL_RAISED, RAISED = range(4)
+INFOSET_ACTIONS = (('fold', 'call', 'raise'), ('check', 'raise'), ('fold', 'call'), ('fold', 'call'))
+
+
+def write_strategy_table(path: str, probabilities, bucket_of_score, small_blind: int, big_blind: int) -> None:
+    num_infosets, num_buckets = len(probabilities), len(probabilities[0])
+    data = bytearray()
+    data += STRATEGY_MAGIC
+    data += _HEADER.pack(num_buckets, num_infosets, small_blind, big_blind)
+    data += bytes(int(bucket) for bucket in bucket_of_score)
+    for infoset in probabilities:
+        for row in infoset:
+            quantized = [round(255 * float(p)) for p in row] + [0] * (MAX_ACTIONS - len(row))
+            data += bytes(quantized)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class StrategyTable:
+    def __init__(self, path: str = STRATEGY_PATH):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._data[:len(STRATEGY_MAGIC)] != STRATEGY_MAGIC:
+            self._data.close()
+            raise ValueError(f"Plik {path} nie jest tablicą strategii.")
+        self.num_buckets, self.num_infosets, self.small_blind, self.big_blind = _HEADER.unpack_from(self._data, len(STRATEGY_MAGIC))
+        self._strategy_offset = _DATA_OFFSET + NUM_SCORES
+        if len(self._data) != self._strategy_offset + self.num_infosets * self.num_buckets * MAX_ACTIONS:
+            self._data.close()
+            raise ValueError(f"Plik {path} ma nieprawidłowy rozmiar.")
+
+    def bucket(self, hand: List[int]) -> int:
+        return self._data[_DATA_OFFSET + evaluate(hand)]
+
+    def probabilities(self, infoset: int, bucket: int) -> bytes:
+        start = self._strategy_offset + (infoset * self.num_buckets + bucket) * MAX_ACTIONS
+        return self._data[start:start + len(INFOSET_ACTIONS[infoset])]
+
+    def close(self) -> None:
+        self._data.close()
+
+
+_loaded_tables = {}
+
+
+def load_strategy_table(path: str = STRATEGY_PATH) -> Optional[StrategyTable]:
+    if path not in _loaded_tables:
+        try:
+            _loaded_tables[path] = StrategyTable(path)
+        except (OSError, ValueError):
+            _loaded_tables[path] = None
+    return _loaded_tables[path]
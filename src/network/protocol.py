@@ -0,0 +1,52 @@
+import json
+from typing import NamedTuple, Optional
+from src.logic.card import card_to_str
+from src.engine.events import (
+    HandStarted, BlindPosted, CardsDealt, ActionTaken, CardsExchanged, ShowdownHand, ShowdownResult, HandFinished
+)
+
+MAX_LINE = 64 * 1024
+
+
+def encode(message: dict) -> bytes:
+    return json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def decode(line: bytes) -> Optional[dict]:
+    try:
+        message = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return message if isinstance(message, dict) else None
+
+
+def event_message(event: NamedTuple) -> Optional[dict]:
+    kind = type(event)
+    if kind is HandStarted:
+        # Talia i ziarno generatora zdradziłyby karty przeciwników.
+        return {"type": "hand_started", "hand_id": event.hand_id,
+                "players": [{"id": player_id, "name": name, "stack": stack} for player_id, name, stack in event.players],
+                "small_blind": event.small_blind, "big_blind": event.big_blind}
+    if kind is BlindPosted:
+        return {"type": "blind", "player_id": event.player_id, "blind": event.blind, "amount": event.amount}
+    if kind is ActionTaken:
+        return {"type": "action_taken", "stage": event.stage, "player_id": event.player_id, "action": event.action,
+                "amount": event.amount, "bet_in_round": event.bet_in_round}
+    if kind is CardsExchanged:
+        return {"type": "cards_exchanged", "player_id": event.player_id, "count": len(event.discarded)}
+    if kind is ShowdownHand:
+        return {"type": "showdown_hand", "player_id": event.player_id, "cards": [card_to_str(c) for c in event.cards],
+                "score": event.score}
+    if kind is ShowdownResult:
+        message = {"type": "showdown_result", "winner_id": event.winner_id, "pot": event.pot}
+        if event.side_pots:
+            message["side_pots"] = [{"amount": side_pot.amount, "winner_id": side_pot.winner_id} for side_pot in event.side_pots]
+        return message
+    if kind is HandFinished:
+        return {"type": "hand_finished", "hand_id": event.hand_id,
+                "stacks": [{"id": player_id, "stack": stack} for player_id, _, stack in event.final_stacks]}
+    return None
+
+
+def private_hand_message(event: CardsDealt, player_id: int) -> dict:
+    return {"type": "cards_dealt", "cards": [card_to_str(c) for c in event.hands[player_id]]}
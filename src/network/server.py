@@ -0,0 +1,336 @@
+import asyncio
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, NamedTuple, Optional
+from src.logic.card import card_to_str
+from src.logic.player import Player
+from src.engine.game_engine import GameEngine
+from src.engine.events import EventSink, HandStarted, BlindPosted, CardsDealt, ActionTaken, CardsExchanged, \
+    ExchangeFinished, ShowdownHand, ShowdownResult, HandFinished
+from src.engine.policies import Policy, RandomBotPolicy, EquityBotPolicy, CheckDownPolicy, CFRBotPolicy, PercentileBotPolicy
+from src.fileops.history_logger import HistoryLogger
+from src.network.protocol import MAX_LINE, decode, encode, event_message, private_hand_message
+
+# Zapas ponad czas na decyzję, po którym wątek stołu przestaje czekać na pętlę zdarzeń.
+ASK_GRACE = 1.0
+
+BOT_POLICIES: Dict[str, Callable[[], Policy]] = {'equity': EquityBotPolicy, 'random': RandomBotPolicy, 'checkdown': CheckDownPolicy, 'cfr': CFRBotPolicy, 'percentile': PercentileBotPolicy}
+
+
+class ClientSession:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, loop: asyncio.AbstractEventLoop):
+        self.reader = reader
+        self.writer = writer
+        self.loop = loop
+        self.name: Optional[str] = None
+        self.player_id: Optional[int] = None
+        self.table: Optional['Table'] = None
+        self.connected = True
+        self._pending: Optional[tuple] = None
+
+    def send(self, message: dict) -> None:
+        if self.connected and not self.writer.is_closing():
+            self.writer.write(encode(message))
+
+    def send_threadsafe(self, message: dict) -> None:
+        self.loop.call_soon_threadsafe(self.send, message)
+
+    async def request(self, message: dict, reply_type: str, timeout: float) -> Optional[dict]:
+        if not self.connected:
+            return None
+        future = self.loop.create_future()
+        self._pending = (reply_type, future)
+        self.send(message)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._pending = None
+
+    def dispatch(self, message: dict) -> bool:
+        pending = self._pending
+        if pending is not None and message.get("type") == pending[0] and not pending[1].done():
+            pending[1].set_result(message)
+            return True
+        return False
+
+    def disconnect(self) -> None:
+        self.connected = False
+        if self._pending is not None and not self._pending[1].done():
+            self._pending[1].set_result(None)
+        if not self.writer.is_closing():
+            self.writer.close()
+
+
+def parse_action(reply: dict, player: Player, current_bet: int, big_blind: int):
+    to_call = current_bet - player.bet_in_round
+    action = str(reply.get("action", "")).lower()
+    if action == 'fold':
+        return ('fold', 0), None
+    if action == 'check' and to_call == 0:
+        return ('check', 0), None
+    if action == 'call' and to_call > 0:
+        return ('call', min(to_call, player.stack)), None
+    if action == 'raise' and player.stack > to_call:
+        # Jak w ConsolePolicy klient podaje całkowitą kwotę zakładu w tej rundzie.
+        min_raise = current_bet + to_call if current_bet > 0 else big_blind
+        max_raise = player.stack + player.bet_in_round
+        amount = reply.get("amount")
+        if not isinstance(amount, int) or not min_raise <= amount <= max_raise:
+            return None, f"Kwota musi być pomiędzy {min_raise} a {max_raise}."
+        return ('raise', amount - player.bet_in_round), None
+    return None, "Nieprawidłowa akcja."
+
+
+class RemotePolicy(Policy):
+    def __init__(self, session: ClientSession, timeout: float):
+        self.session = session
+        self.timeout = timeout
+
+    def _ask(self, message: dict, reply_type: str, deadline: float) -> Optional[dict]:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not self.session.connected:
+            return None
+        future = asyncio.run_coroutine_threadsafe(self.session.request(message, reply_type, remaining), self.session.loop)
+        # request sama kończy się po remaining sekundach, ale jeśli pętla zdarzeń stoi (np. przy zamykaniu serwera),
+        # wątek stołu nie może czekać w nieskończoność; brak odpowiedzi oznacza pas.
+        try:
+            return future.result(remaining + ASK_GRACE)
+        except FutureTimeoutError:
+            future.cancel()
+            return None
+
+    def choose_action(self, engine: GameEngine, player: Player, current_bet: int) -> tuple[str, int]:
+        to_call = current_bet - player.bet_in_round
+        message = {"type": "action_request", "pot": engine.pot, "current_bet": current_bet, "to_call": to_call,
+                   "stack": player.stack, "cards": [card_to_str(c) for c in player.hand], "timeout": self.timeout}
+        deadline = time.monotonic() + self.timeout
+        while True:
+            reply = self._ask(message, "action", deadline)
+            if reply is None:
+                self.session.send_threadsafe({"type": "timeout", "action": "fold"})
+                return 'fold', 0
+            result, error = parse_action(reply, player, current_bet, engine.big_blind)
+            if result is not None:
+                return result
+            self.session.send_threadsafe({"type": "error", "message": error})
+
+    def choose_discards(self, engine: GameEngine, player: Player) -> List[int]:
+        message = {"type": "discard_request", "cards": [card_to_str(c) for c in player.hand], "timeout": self.timeout}
+        deadline = time.monotonic() + self.timeout
+        while True:
+            reply = self._ask(message, "discard", deadline)
+            if reply is None:
+                return []
+            indices = reply.get("indices")
+            if isinstance(indices, list) and len(indices) <= 4 and len(set(indices)) == len(indices) \
+                    and all(isinstance(i, int) and 0 <= i < 5 for i in indices):
+                return indices
+            self.session.send_threadsafe({"type": "error", "message": "Można wymienić maks. 4 karty o indeksach 0-4."})
+
+
+class NetworkSink(EventSink):
+    interests = (HandStarted, BlindPosted, CardsDealt, ActionTaken, CardsExchanged, ExchangeFinished,
+                 ShowdownHand, ShowdownResult, HandFinished)
+
+    def __init__(self, sessions: List[ClientSession]):
+        self.sessions = sessions
+
+    def handle(self, event: NamedTuple) -> None:
+        kind = type(event)
+        for session in self.sessions:
+            if not session.connected:
+                continue
+            if kind is CardsDealt:
+                if session.player_id in event.hands:
+                    session.send_threadsafe(private_hand_message(event, session.player_id))
+            elif kind is ExchangeFinished:
+                if session.player_id in event.final_hands:
+                    session.send_threadsafe({"type": "final_hand", "cards": [card_to_str(c) for c in event.final_hands[session.player_id]]})
+            else:
+                session.send_threadsafe(event_message(event))
+
+
+class TableStats(NamedTuple):
+    table_id: int
+    humans: int
+    hands: int
+    running: bool
+
+
+class Table:
+    def __init__(self, table_id: int, server: 'GameServer', sessions: List[ClientSession]):
+        self.table_id = table_id
+        self.server = server
+        self.sessions = sessions
+        self.hands = 0
+        self.running = True
+        config = server.config
+        specs = [{"name": s.name, "stack": config['initial_stack'], "is_human": True} for s in sessions]
+        specs += [{"name": f"Bot {i + 1}", "stack": config['initial_stack'], "is_human": False}
+                  for i in range(server.seats_per_table - len(sessions))]
+        players = Player.create_players(specs)
+        policies = {}
+        for session, player in zip(sessions, players):
+            session.player_id = player.id
+            session.table = self
+            policies[player.id] = RemotePolicy(session, server.action_timeout)
+        self.engine = GameEngine(
+            players=players,
+            history_logger=server.history_logger,
+            small_blind=config['small_blind'],
+            big_blind=config['big_blind'],
+            game_id=f"table_{table_id}_{int(time.time())}",
+            policies=policies,
+            default_policy=BOT_POLICIES[server.bot](),
+            headless=True,
+            sinks=[NetworkSink(sessions)] if sessions else None
+        )
+        self.initial_stack = config['initial_stack']
+        self.all_players = list(players)
+
+    def stats(self) -> TableStats:
+        return TableStats(self.table_id, sum(1 for s in self.sessions if s.connected), self.hands, self.running)
+
+    async def run(self) -> None:
+        for session in self.sessions:
+            session.send({"type": "seated", "table_id": self.table_id, "player_id": session.player_id,
+                          "players": [{"id": p.id, "name": p.name} for p in self.engine.players]})
+        try:
+            if self.sessions:
+                await self._run_human_table()
+            else:
+                await self._run_bot_table()
+        finally:
+            self.running = False
+            for session in self.sessions:
+                session.send({"type": "table_closed", "table_id": self.table_id, "hands": self.hands})
+            self.server.tables.pop(self.table_id, None)
+
+    async def _run_human_table(self) -> None:
+        loop = asyncio.get_running_loop()
+        engine = self.engine
+        players_by_id = {p.id: p for p in self.all_players}
+        while not self.server.stopping and any(s.connected and players_by_id[s.player_id].stack > 0 for s in self.sessions):
+            engine.players = [p for p in engine.players if p.stack > 0]
+            if len(engine.players) < 2 or (self.server.max_hands and self.hands >= self.server.max_hands):
+                break
+            # Rozdanie blokuje się na odpowiedziach graczy, więc wykonuje się w osobnym wątku.
+            await loop.run_in_executor(self.server.executor, engine.play_round)
+            self.hands += 1
+            self.server.hands_played += 1
+
+    async def _run_bot_table(self) -> None:
+        loop = asyncio.get_running_loop()
+        engine = self.engine
+        while not self.server.stopping:
+            engine.players = [p for p in engine.players if p.stack > 0]
+            if len(engine.players) < 2:
+                # Stoły botów służą jako stałe obciążenie, więc po końcu gry zaczynają od nowa.
+                engine.players = list(self.all_players)
+                for player in engine.players:
+                    player.stack = self.initial_stack
+            # Rozdanie botów (polityki, zapis historii) też nie może blokować pętli zdarzeń innych stołów.
+            await loop.run_in_executor(self.server.executor, engine.play_round)
+            self.hands += 1
+            self.server.hands_played += 1
+
+
+class GameServer:
+    def __init__(self, config: dict, host: str = '127.0.0.1', port: int = 7777, unix_path: str = None,
+                 seats_per_table: int = 4, humans_per_table: int = 1, action_timeout: float = 15.0,
+                 bot: str = 'random', bot_tables: int = 0, max_hands: int = 0, history_logger: HistoryLogger = None,
+                 max_threads: int = 256):
+        if not 1 <= humans_per_table <= seats_per_table or seats_per_table < 2:
+            raise ValueError("Nieprawidłowa liczba miejsc przy stole.")
+        self.config = config
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.seats_per_table = seats_per_table
+        self.humans_per_table = humans_per_table
+        self.action_timeout = action_timeout
+        self.bot = bot
+        self.bot_tables = bot_tables
+        self.max_hands = max_hands
+        self.history_logger = history_logger
+        # Każde trwające rozdanie zajmuje jeden wątek (stół z ludźmi także na czas oczekiwania na decyzję, najwyżej
+        # action_timeout), więc max_threads to limit stołów grających jednocześnie; rozdania kolejnych czekają w kolejce.
+        self.executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="table")
+        self.tables: Dict[int, Table] = {}
+        self.lobby: List[ClientSession] = []
+        self.hands_played = 0
+        self.stopping = False
+        self._table_ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        if self.unix_path:
+            self._server = await asyncio.start_unix_server(self._handle_client, path=self.unix_path, limit=MAX_LINE)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, self.host, self.port, limit=MAX_LINE)
+            self.port = self._server.sockets[0].getsockname()[1]
+        for _ in range(self.bot_tables):
+            self._open_table([])
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        self.stopping = True
+        if self._server is not None:
+            self._server.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        tables = [t.stats() for t in list(self.tables.values())]
+        return {"type": "stats", "tables": len(tables), "human_tables": sum(1 for t in tables if t.humans),
+                "bot_tables": sum(1 for t in tables if not t.humans), "waiting": len(self.lobby),
+                "hands_played": self.hands_played}
+
+    def _open_table(self, sessions: List[ClientSession]) -> Table:
+        table = Table(next(self._table_ids), self, sessions)
+        self.tables[table.table_id] = table
+        asyncio.get_running_loop().create_task(table.run())
+        return table
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        session = ClientSession(reader, writer, asyncio.get_running_loop())
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break
+                if not line:
+                    break
+                message = decode(line)
+                if message is None:
+                    session.send({"type": "error", "message": "Nieprawidłowa wiadomość."})
+                    continue
+                if session.dispatch(message):
+                    continue
+                kind = message.get("type")
+                if kind == "join" and session.name is None:
+                    session.name = str(message.get("name") or f"Gracz {id(session) % 10000}")[:32]
+                    self.lobby.append(session)
+                    session.send({"type": "welcome", "name": session.name})
+                    if len(self.lobby) >= self.humans_per_table:
+                        seated, self.lobby = self.lobby[:self.humans_per_table], self.lobby[self.humans_per_table:]
+                        self._open_table(seated)
+                elif kind == "stats":
+                    session.send(self.stats())
+                elif kind in ("action", "discard"):
+                    session.send({"type": "error", "message": "Teraz nie jest Twoja kolej."})
+                else:
+                    session.send({"type": "error", "message": f"Nieznany typ wiadomości: {kind}"})
+        finally:
+            if session in self.lobby:
+                self.lobby.remove(session)
+            session.disconnect()
@@ -2,4 +2,7 @@ class InvalidActionError(Exception):
     pass
 
 class InsufficientFundsError(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class ReplayMismatchError(Exception):
+    pass
@@ -0,0 +1,70 @@
+import bisect
+import json
+import os
+import time
+from typing import Dict, List
+
+HAND_DURATION_BOUNDS_US = (50, 100, 200, 500, 1000, 2000, 5000, 10_000, 20_000, 50_000, 100_000, 1_000_000)
+
+
+class Metrics:
+    def __init__(self, dump_path: str = None, dump_interval: float = 10.0):
+        self.dump_path = dump_path
+        self.dump_interval = dump_interval
+        self.timers: Dict[str, List[float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.hand_durations = [0] * (len(HAND_DURATION_BOUNDS_US) + 1)
+        self.started = time.time()
+        self._last_dump = time.perf_counter()
+        if dump_path:
+            directory = os.path.dirname(dump_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        timer = self.timers.get(phase)
+        if timer is None:
+            self.timers[phase] = [1, seconds, seconds]
+            return
+        timer[0] += 1
+        timer[1] += seconds
+        if seconds > timer[2]:
+            timer[2] = seconds
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe_hand(self, seconds: float) -> None:
+        self.hand_durations[bisect.bisect_left(HAND_DURATION_BOUNDS_US, seconds * 1e6)] += 1
+        self.add_time("hand", seconds)
+        if self.dump_path and time.perf_counter() - self._last_dump >= self.dump_interval:
+            self.dump()
+
+    def snapshot(self) -> dict:
+        timers = {
+            phase: {"count": count, "total_seconds": total, "mean_us": total / count * 1e6, "max_us": longest * 1e6}
+            for phase, (count, total, longest) in list(self.timers.items())
+        }
+        buckets = [f"<={bound}us" for bound in HAND_DURATION_BOUNDS_US] + [f">{HAND_DURATION_BOUNDS_US[-1]}us"]
+        return {
+            "timestamp": time.time(),
+            "uptime_seconds": time.time() - self.started,
+            "timers": timers,
+            "counters": dict(self.counters),
+            "hand_duration_histogram": dict(zip(buckets, self.hand_durations))
+        }
+
+    def dump(self) -> None:
+        self._last_dump = time.perf_counter()
+        if not self.dump_path:
+            return
+        try:
+            with open(self.dump_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.snapshot(), separators=(',', ':')) + '\n')
+        except IOError as e:
+            print(f"Błąd podczas zapisywania metryk: {e}")
+
+    def reset(self) -> None:
+        self.timers.clear()
+        self.counters.clear()
+        self.hand_durations = [0] * (len(HAND_DURATION_BOUNDS_US) + 1)
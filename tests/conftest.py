@@ -0,0 +1,38 @@
+from typing import List
+from src.engine.game_engine import GameEngine
+from src.engine.policies import Policy
+from src.logic.player import Player
+
+
+class Collector:
+    def __init__(self):
+        self.histories: List[dict] = []
+
+    def save_hand_history(self, history_data: dict) -> None:
+        self.histories.append(history_data)
+
+
+class ShoveOrCallPolicy(Policy):
+    # Każdy gracz przebija całym stosem albo sprawdza, więc rozdania z krótkimi stosami kończą się pulami bocznymi.
+    def choose_action(self, engine: GameEngine, player: Player, current_bet: int) -> tuple[str, int]:
+        to_call = current_bet - player.bet_in_round
+        if to_call >= player.stack:
+            return 'call', player.stack
+        if player.id % 2 == 0:
+            return 'raise', player.stack
+        return ('call', to_call) if to_call > 0 else ('check', 0)
+
+    def choose_discards(self, engine: GameEngine, player: Player) -> List[int]:
+        return [4]
+
+
+def play_hands(stacks: List[int], count: int, policy: Policy, seed: int = 1) -> List[dict]:
+    collector = Collector()
+    players = Player.create_players([{"name": f"Bot {i}", "stack": stack, "is_human": False}
+                                     for i, stack in enumerate(stacks)])
+    game = GameEngine(players, collector, seed=seed, default_policy=policy, headless=True)
+    for _ in range(count):
+        for player, stack in zip(players, stacks):
+            player.stack = stack
+        game.play_round()
+    return collector.histories
@@ -0,0 +1,51 @@
+from typing import List
+from src.engine.game_engine import GameEngine
+from src.engine.policies import CFRBotPolicy
+from src.logic.player import Player
+from src.logic.strategy_table import CALLED, CALL_RAISED, RAISED, ROOT
+
+
+class _ScriptedCFR(CFRBotPolicy):
+    # Zapisuje zbiór informacyjny każdej decyzji przed wymianą i gra akcje ze skryptu.
+    def __init__(self, script: List[str]):
+        super().__init__()
+        self.script = list(script)
+        self.infosets = []
+
+    def choose_action(self, engine: GameEngine, player: Player, current_bet: int) -> tuple[str, int]:
+        to_call = current_bet - player.bet_in_round
+        if not self.script:
+            return ('call', to_call) if to_call > 0 else ('check', 0)
+        self.infosets.append((player.id, self._infoset(engine, player, current_bet)))
+        action = self.script.pop(0)
+        if action == 'raise':
+            return 'raise', engine.big_blind * 2 - player.bet_in_round
+        if action == 'call':
+            return 'call', to_call
+        return action, 0
+
+    def choose_discards(self, engine: GameEngine, player: Player) -> List[int]:
+        return []
+
+
+def _play_heads_up(script: List[str]) -> list:
+    players = Player.create_players([{"name": "Dealer", "stack": 1000, "is_human": False},
+                                     {"name": "SB", "stack": 1000, "is_human": False}])
+    policy = _ScriptedCFR(script)
+    game = GameEngine(players, None, seed=1, default_policy=policy, headless=True)
+    game.play_round()
+    # Heads-up rozdający jest dużym blindem, a mały blind działa pierwszy.
+    assert game.dealer_pos == 0
+    return policy.infosets
+
+
+def test_small_blind_raise_then_big_blind_faces_raise():
+    assert _play_heads_up(['raise', 'call']) == [(1, ROOT), (0, RAISED)]
+
+
+def test_limp_then_big_blind_raise_then_small_blind_faces_raise():
+    assert _play_heads_up(['call', 'raise', 'call']) == [(1, ROOT), (0, CALLED), (1, CALL_RAISED)]
+
+
+def test_limp_and_check():
+    assert _play_heads_up(['call', 'check']) == [(1, ROOT), (0, CALLED)]
@@ -0,0 +1,51 @@
+import random
+from itertools import combinations
+import pytest
+from src.logic.draw_outcomes import NUM_CATEGORIES, clear_cache, draw_outcomes
+from src.logic.hand_evaluator import evaluate, score_category
+
+
+def _brute_force(hand, discards, dead_cards):
+    held = [card for i, card in enumerate(hand) if i not in discards]
+    pool = [card for card in range(52) if card not in hand and card not in dead_cards]
+    counts = [0] * NUM_CATEGORIES
+    for drawn in combinations(pool, 5 - len(held)):
+        counts[score_category(evaluate(held + list(drawn)))] += 1
+    return tuple(counts)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_matches_brute_force(seed):
+    clear_cache()
+    rng = random.Random(seed)
+    for case in range(30):
+        # Co trzecia ręka w jednym kolorze, żeby sprawdzić poprawkę na kolor i pokera.
+        hand = rng.sample(range(13), 5) if case % 3 == 0 else rng.sample(range(52), 5)
+        discards = rng.sample(range(5), rng.choice((0, 1, 2, 3, 3)))
+        dead_cards = rng.sample([card for card in range(52) if card not in hand], rng.choice((0, 3, 10)))
+        outcome = draw_outcomes(hand, discards, dead_cards)
+        assert outcome.counts == _brute_force(hand, discards, dead_cards)
+        assert sum(outcome.counts) == outcome.total
+
+
+def test_full_redraw_matches_brute_force():
+    hand = [0, 13, 26, 39, 12]
+    dead_cards = list(range(1, 12))
+    outcome = draw_outcomes(hand, range(5), dead_cards)
+    assert outcome.counts == _brute_force(hand, range(5), dead_cards)
+
+
+def test_suit_permutations_share_cached_result():
+    clear_cache()
+    spades = draw_outcomes([0, 1, 2, 3, 30], [4])
+    hearts = draw_outcomes([13, 14, 15, 16, 4], [4])
+    assert spades is hearts
+    # Otwarty strit w kolorze po odrzuceniu szóstki: 2 karty na pokera (A i 6), 7 na kolor
+    # i 5 na strit (3 asy i 2 pozostałe szóstki) spośród 47.
+    assert spades.counts[8] == 2 and spades.counts[5] == 7 and spades.counts[4] == 5
+    assert spades.at_least(4) == pytest.approx(14 / 47)
+
+
+def test_rejects_invalid_indices():
+    with pytest.raises(ValueError):
+        draw_outcomes([0, 1, 2, 3, 4], [5])
@@ -0,0 +1,31 @@
+from src.logic.equity import EquityEngine
+
+HAND = [0, 13, 27, 40, 11]
+# Ta sama ręka z zamienionymi kolorami pik <-> kier i karo <-> trefl.
+PERMUTED = [13, 0, 40, 27, 24]
+
+
+def test_seeded_estimate_does_not_depend_on_call_order():
+    first = EquityEngine(discard_table=None)
+    expected = first.estimate(HAND, 2, None, max_trials=64, seed=7)
+
+    second = EquityEngine(discard_table=None)
+    for hand in ([1, 2, 3, 4, 5], [20, 21, 35, 36, 50]):
+        second.estimate(hand, 2, None, max_trials=64, seed=7)
+    assert second.estimate(PERMUTED, 2, None, max_trials=64, seed=7) == expected
+    assert expected.trials == 64
+
+
+def test_cached_entry_is_reused_and_grows_up_to_max_trials():
+    engine = EquityEngine(discard_table=None)
+    engine.estimate(HAND, 3, None, max_trials=32, seed=1)
+    assert engine.estimate(PERMUTED, 3, None, max_trials=32, seed=1).trials == 32
+    assert engine.estimate(PERMUTED, 3, None, max_trials=96, seed=1).trials == 96
+    assert len(engine._cache) == 1
+    engine.estimate(HAND, 3, None, max_trials=32, seed=2)
+    assert len(engine._cache) == 2
+
+
+def test_many_opponents():
+    estimate = EquityEngine(discard_table=None).estimate(HAND, 6, None, max_trials=64, seed=3)
+    assert estimate.trials == 64 and 0.0 <= estimate.equity <= 1.0
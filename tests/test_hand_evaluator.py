@@ -0,0 +1,36 @@
+import random
+from itertools import combinations
+from src.logic.hand_evaluator import NUM_SCORES, evaluate, score_category, score_to_rank
+from src.logic.hand_ranker import hand_rank
+
+
+def test_evaluate_matches_hand_rank_on_random_hands():
+    rng = random.Random(2025)
+    for _ in range(20_000):
+        hand = rng.sample(range(52), 5)
+        assert score_to_rank(evaluate(hand)) == hand_rank(hand)
+
+
+def test_evaluate_orders_hands_like_hand_rank():
+    rng = random.Random(7)
+    for _ in range(5_000):
+        first, second = rng.sample(range(52), 5), rng.sample(range(52), 5)
+        assert (evaluate(first) < evaluate(second)) == (hand_rank(first) < hand_rank(second))
+        assert (evaluate(first) == evaluate(second)) == (hand_rank(first) == hand_rank(second))
+
+
+def test_every_flush_and_rank_pattern_of_one_suit():
+    # Wszystkie ręce w jednym kolorze oraz wszystkie układy rang z kart dwóch kolorów.
+    for hand in combinations(range(13), 5):
+        assert score_to_rank(evaluate(list(hand))) == hand_rank(list(hand))
+    for hand in combinations(range(0, 26, 2), 5):
+        assert score_to_rank(evaluate(list(hand))) == hand_rank(list(hand))
+
+
+def test_score_range_and_categories():
+    assert NUM_SCORES == 7462
+    royal = [8, 9, 10, 11, 12]
+    assert evaluate(royal) == NUM_SCORES - 1
+    assert score_category(evaluate(royal)) == 9
+    assert score_category(evaluate([0, 1, 2, 3, 18])) == 0
+    assert score_category(evaluate([0, 13, 1, 14, 28])) == 2
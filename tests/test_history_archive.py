@@ -0,0 +1,71 @@
+import json
+import os
+from src.engine.policies import RandomBotPolicy
+from src.fileops.history_archive import ARCHIVE_EXTENSION, HistoryArchive, HistoryArchiveWriter, read_archive
+from src.fileops.history_logger import HistoryLogger
+from conftest import ShoveOrCallPolicy, play_hands
+
+
+def _pack(path: str, histories: list, segment_hands: int = 16) -> None:
+    with HistoryArchiveWriter(path, segment_hands) as writer:
+        for history in histories:
+            writer.add(history)
+
+
+def _as_json(history: dict) -> str:
+    return json.dumps(history, ensure_ascii=False)
+
+
+def test_round_trip_is_lossless(tmp_path):
+    histories = play_hands([1000] * 4, 100, RandomBotPolicy(None, None), seed=3)
+    histories += play_hands([40, 1000, 300, 1000], 40, ShoveOrCallPolicy(), seed=4)
+    # Ręcznie zmienione rozdania nie pasują do formatu kompaktowego i trafiają do archiwum jako JSON.
+    odd = json.loads(json.dumps(histories[0]))
+    odd["hand_id"] = "custom"
+    odd["note"] = "dopisane ręcznie"
+    odd["bets"].append({"stage": "river", "player_id": 9, "action": "bet", "amount": 1.5})
+    histories.append(odd)
+    path = os.path.join(tmp_path, "hands.p5h")
+    _pack(path, histories)
+
+    restored = list(read_archive(path))
+    assert [_as_json(h) for h in restored] == [_as_json(json.loads(json.dumps(h))) for h in histories]
+
+
+def test_index_lookup_and_game_filter(tmp_path):
+    first = play_hands([1000] * 3, 30, RandomBotPolicy(None, None), seed=5)
+    second = play_hands([1000] * 3, 30, RandomBotPolicy(None, None), seed=6)
+    path = os.path.join(tmp_path, "hands.p5h")
+    _pack(path, first + second, segment_hands=7)
+
+    with HistoryArchive(path) as archive:
+        assert len(archive) == 60
+        target = second[17]
+        assert _as_json(archive.load_hand(target["game_id"], target["hand_id"])) == _as_json(json.loads(json.dumps(target)))
+        assert archive.load_hand(target["game_id"], "round_999") is None
+        assert [h["hand_id"] for h in archive.iter_hands(first[0]["game_id"])] == [h["hand_id"] for h in first]
+
+
+def test_failed_write_leaves_no_archive(tmp_path):
+    path = os.path.join(tmp_path, "hands.p5h")
+    try:
+        with HistoryArchiveWriter(path) as writer:
+            writer.add(play_hands([1000] * 2, 1, RandomBotPolicy(None, None))[0])
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert os.listdir(tmp_path) == []
+
+
+def test_packed_log_is_not_counted_twice(tmp_path):
+    histories = play_hands([1000] * 3, 50, RandomBotPolicy(None, None), seed=8)
+    logger = HistoryLogger(data_dir=str(tmp_path), mode='jsonl')
+    for history in histories:
+        logger.save_hand_history(history)
+    logger.flush()
+    # Tak jak tools/history_archive.py pack: archiwum trafia do katalogu dziennika obok segmentów źródłowych.
+    _pack(os.path.join(logger.log_dir, f"hands_archive{ARCHIVE_EXTENSION}"), list(logger.iter_hands()))
+
+    assert [h["hand_id"] for h in logger.iter_hands()] == [h["hand_id"] for h in histories]
+    assert logger.load_hand(histories[10]["game_id"], "round_11")["hand_id"] == "round_11"
+    logger.close()
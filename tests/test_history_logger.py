@@ -0,0 +1,20 @@
+import gc
+import weakref
+from src.fileops.history_logger import HistoryLogger
+
+
+def test_closed_logger_is_released(tmp_path):
+    logger = HistoryLogger(data_dir=str(tmp_path), mode='jsonl')
+    reference = weakref.ref(logger)
+    logger.close()
+    del logger
+    gc.collect()
+    assert reference() is None
+
+
+def test_close_is_idempotent(tmp_path):
+    logger = HistoryLogger(data_dir=str(tmp_path), mode='binary')
+    logger.save_hand_history({"game_id": "g", "hand_id": "round_1"})
+    logger.close()
+    logger.close()
+    assert [h["hand_id"] for h in logger.iter_hands()] == ["round_1"]
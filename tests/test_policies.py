@@ -0,0 +1,24 @@
+from typing import List
+import pytest
+from src.engine.events import EventSink
+from src.engine.policies import Policy
+
+
+def test_policy_must_implement_both_decisions():
+    class ActionOnly(Policy):
+        def choose_action(self, engine, player, current_bet: int) -> tuple[str, int]:
+            return 'check', 0
+
+    with pytest.raises(TypeError):
+        ActionOnly()
+
+    class Complete(ActionOnly):
+        def choose_discards(self, engine, player) -> List[int]:
+            return []
+
+    assert Complete().choose_discards(None, None) == []
+
+
+def test_event_sink_requires_handle():
+    with pytest.raises(TypeError):
+        EventSink()
@@ -0,0 +1,27 @@
+import asyncio
+import time
+import pytest
+from src.logic.player import Player
+from src.network import server
+from src.network.server import ClientSession, RemotePolicy
+
+
+class _Engine:
+    pot = 75
+    big_blind = 50
+
+
+@pytest.mark.filterwarnings("ignore:coroutine .* was never awaited")
+def test_stalled_event_loop_folds_instead_of_blocking(monkeypatch):
+    monkeypatch.setattr(server, "ASK_GRACE", 0.1)
+    loop = asyncio.new_event_loop()
+    try:
+        # Pętla nie jest uruchomiona, więc prośba o decyzję nigdy nie zostanie wysłana ani rozstrzygnięta.
+        session = ClientSession(None, None, loop)
+        policy = RemotePolicy(session, timeout=0.2)
+        player = Player(0, "Gracz", 1000, is_human=True)
+        start = time.monotonic()
+        assert policy.choose_action(_Engine(), player, 50) == ('fold', 0)
+        assert time.monotonic() - start < 2.0
+    finally:
+        loop.close()
@@ -0,0 +1,69 @@
+import json
+import os
+from src.engine.game_engine import GameEngine
+from src.fileops.session_manager import SessionManager
+from src.logic.player import Player
+from src.engine.policies import RandomBotPolicy
+
+
+def _game() -> GameEngine:
+    # Krótki stos odpada po kilku rundach, więc dziennik obejmuje też zmianę składu stołu.
+    players = Player.create_players([{"name": f"Bot {i}", "stack": stack, "is_human": False}
+                                     for i, stack in enumerate((60, 1000, 1000, 1000))])
+    return GameEngine(players, None, seed=11, default_policy=RandomBotPolicy(), headless=True)
+
+
+def _play(game: GameEngine, manager: SessionManager, rounds: int) -> dict:
+    for _ in range(rounds):
+        # Jak w main.play_game: gracze bez żetonów odchodzą od stołu przed kolejnym rozdaniem.
+        game.players = [p for p in game.players if p.stack > 0]
+        game.play_round()
+        manager.save_checkpoint(game.get_session_data())
+    return game.get_session_data()
+
+
+def test_journal_restores_state_between_snapshots(tmp_path):
+    manager = SessionManager(data_dir=str(tmp_path), snapshot_every=100)
+    game = _game()
+    expected = _play(game, manager, 10)
+    assert len(expected["players"]) < 4
+
+    restored = SessionManager(data_dir=str(tmp_path)).load_session(game.game_id)
+    assert restored == expected
+    with open(os.path.join(tmp_path, f"session_{game.game_id}.journal.jsonl"), encoding='utf-8') as f:
+        entries = [json.loads(line) for line in f]
+    # Po migawce z pierwszej rundy dziennik zawiera tylko zmiany.
+    assert len(entries) == expected["round_counter"] - 1
+    assert all(set(entry) == {"round_counter", "dealer_pos", "stacks"} for entry in entries)
+
+
+def test_resumed_game_continues_from_journal(tmp_path):
+    manager = SessionManager(data_dir=str(tmp_path), snapshot_every=4)
+    game = _game()
+    _play(game, manager, 6)
+
+    resumed = GameEngine.from_session_data(SessionManager(data_dir=str(tmp_path)).load_session(game.game_id), None,
+                                           default_policy=RandomBotPolicy(), headless=True)
+    expected = _play(game, manager, 5)
+    resumed_manager = SessionManager(data_dir=str(tmp_path), snapshot_every=4)
+    assert _play(resumed, resumed_manager, 5) == expected
+    assert resumed_manager.load_session(game.game_id) == expected
+
+
+def test_changed_blinds_force_a_snapshot(tmp_path):
+    manager = SessionManager(data_dir=str(tmp_path), snapshot_every=100)
+    game = _game()
+    _play(game, manager, 2)
+    game.big_blind = 100
+    expected = _play(game, manager, 1)
+    assert SessionManager(data_dir=str(tmp_path)).load_session(game.game_id) == expected
+
+
+def test_reads_full_state_journal_entries(tmp_path):
+    manager = SessionManager(data_dir=str(tmp_path))
+    game = _game()
+    manager.save_session(game.get_session_data())
+    game.play_round()
+    with open(os.path.join(tmp_path, f"session_{game.game_id}.journal.jsonl"), 'w', encoding='utf-8') as f:
+        f.write(json.dumps(game.get_session_data()) + '\n')
+    assert manager.load_session(game.game_id) == game.get_session_data()
@@ -0,0 +1,39 @@
+from src.engine.pots import side_pots
+from src.fileops.history_store import hand_winnings
+from conftest import ShoveOrCallPolicy, play_hands
+
+
+def test_single_pot_without_all_in():
+    assert side_pots([100, 100, 100], [True, True, True]) == [(300, [0, 1, 2])]
+
+
+def test_short_stack_caps_main_pot():
+    assert side_pots([100, 50, 100], [True, True, True]) == [(150, [0, 1, 2]), (100, [0, 2])]
+
+
+def test_folded_chips_go_to_pots_up_to_their_level():
+    pots = side_pots([200, 50, 100], [False, True, True])
+    assert pots == [(150, [1, 2]), (200, [2])]
+    assert sum(amount for amount, _ in pots) == 350
+
+
+def test_everyone_folded_contributions():
+    assert side_pots([0, 0], [False, True]) == [(0, [1])]
+
+
+def test_engine_awards_side_pots_and_conserves_chips():
+    stacks = [40, 1000, 300, 1000]
+    histories = play_hands(stacks, 60, ShoveOrCallPolicy())
+    with_side_pots = 0
+    for history in histories:
+        final = {state["id"]: state["final_stack"] for state in history["final_player_state"]}
+        assert sum(final.values()) == sum(stacks)
+        winnings = hand_winnings(history)
+        # Pole "pot" zawiera tylko ciemne, więc pulę liczymy ze wszystkich wpłat.
+        assert sum(winnings.values()) == sum(bet["amount"] for bet in history["bets"])
+        for side_pot in history.get("side_pots") or ():
+            with_side_pots += 1
+            assert side_pot["winner_id"] in side_pot["eligible"]
+        # Najkrótszy stos może wygrać co najwyżej swój wkład od każdego z rywali.
+        assert winnings.get(0, 0) <= stacks[0] * len(stacks)
+    assert with_side_pots > 0
@@ -0,0 +1,76 @@
+import argparse
+import json
+import sys
+import time
+import numpy as np
+from src.logic.batch_simulator import MAX_PLAYERS, engine_decks, load_hold_masks, simulate, simulate_batch
+from src.logic.discard_table import TABLE_PATH, DiscardTable
+from src.logic.player import Player
+from src.engine.game_engine import GameEngine
+from src.engine.policies import CheckDownPolicy
+
+
+class _WinnerCollector:
+    def __init__(self):
+        self.winners = []
+
+    def save_hand_history(self, history_data: dict) -> None:
+        self.winners.append(history_data["winner"]["player_id"])
+
+
+def compare_with_engine(num_hands: int, num_players: int, seed: int, hold_masks: np.ndarray, table_path: str) -> int:
+    discard_table = DiscardTable(table_path) if hold_masks is not None else None
+    collector = _WinnerCollector()
+    players = Player.create_players([{"name": f"Bot {i}", "stack": 10 ** 12, "is_human": False} for i in range(num_players)])
+    policy = CheckDownPolicy(discard_table, draw=hold_masks is not None)
+    game = GameEngine(players, collector, seed=seed, default_policy=policy, headless=True)
+
+    start = time.perf_counter()
+    for _ in range(num_hands):
+        game.play_round()
+    engine_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = simulate_batch(engine_decks(seed, num_players, 1, num_hands), num_players, hold_masks)
+    batch_seconds = time.perf_counter() - start
+
+    seat_of = {p.id: seat for seat, p in enumerate(players)}
+    mismatches = int((np.array([seat_of[w] for w in collector.winners]) != result.winners).sum())
+    print(f"Porównanie z GameEngine: {num_hands} rozdań, niezgodnych zwycięzców: {mismatches}.")
+    print(f"GameEngine: {num_hands / engine_seconds:,.0f} rozdań/s, symulator wsadowy (z talią silnika): {num_hands / batch_seconds:,.0f} rozdań/s.")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wektorowa symulacja rozdań pokera dobieranego ze stałą polityką wymiany.")
+    parser.add_argument("--hands", type=int, default=1_000_000)
+    parser.add_argument("--players", type=int, default=4, choices=range(2, MAX_PLAYERS + 1))
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--chunk-size", type=int, default=1 << 16)
+    parser.add_argument("--table", default=TABLE_PATH, help="tablica wymiany kart")
+    parser.add_argument("--no-draw", action="store_true", help="pomiń wymianę kart")
+    parser.add_argument("--engine-rng", action="store_true", help="tasuj talie tak jak GameEngine (wolniej, wyniki porównywalne)")
+    parser.add_argument("--verify-engine", type=int, default=0, metavar="N", help="porównaj N rozdań z GameEngine")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    hold_masks = None if args.no_draw else load_hold_masks(args.table)
+    if hold_masks is None and not args.no_draw:
+        print(f"Brak tablicy wymiany {args.table}; symulacja bez wymiany kart. Zbuduj ją: python -m tools.build_discard_table")
+
+    mismatches = 0
+    if args.verify_engine:
+        mismatches = compare_with_engine(args.verify_engine, args.players, args.seed, hold_masks, args.table)
+
+    summary = simulate(args.hands, args.players, args.seed, hold_masks, args.chunk_size, args.engine_rng)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"Rozdania: {summary['hands']} w {summary['seconds']:.2f} s ({summary['hands_per_second']:,.0f} rozdań/s), remisy: {summary['ties']}")
+        for seat, (wins, rate) in enumerate(zip(summary['wins'], summary['win_rate'])):
+            print(f"Miejsce {seat}: wygrane {wins} ({rate:.2%})")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import sys
+import time
+from itertools import combinations
+import numpy as np
+from src.logic.batch_evaluator import evaluate_batch
+from src.logic.hand_evaluator import evaluate
+from src.logic.hand_ranker import hand_rank
+
+
+def random_hands(num_hands: int, seed: int, chunk_size: int = 100_000) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    hands = np.empty((num_hands, 5), dtype=np.int8)
+    for start in range(0, num_hands, chunk_size):
+        stop = min(start + chunk_size, num_hands)
+        hands[start:stop] = rng.random((stop - start, 52)).argpartition(5, axis=1)[:, :5]
+    return hands
+
+
+def verify_all_hands() -> int:
+    hands = np.array(list(combinations(range(52), 5)), dtype=np.int8)
+    batch_scores = evaluate_batch(hands)
+    scalar_scores = np.fromiter((evaluate(hand) for hand in hands.tolist()), dtype=np.int32, count=len(hands))
+    mismatches = int((batch_scores != scalar_scores).sum())
+    print(f"Sprawdzono {len(hands)} rąk, niezgodności z evaluate: {mismatches}.")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Porównanie wektorowej oceny rąk z oceną skalarną.")
+    parser.add_argument("--hands", type=int, default=1_000_000)
+    parser.add_argument("--scalar-hands", type=int, default=200_000, help="liczba rąk dla ścieżek skalarnych")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--exhaustive", action="store_true", help="porównaj wszystkie 2 598 960 rąk z evaluate")
+    args = parser.parse_args()
+
+    exhaustive_mismatches = verify_all_hands() if args.exhaustive else 0
+
+    hands = random_hands(args.hands, args.seed)
+
+    evaluate_batch(hands[:1000])
+    start = time.perf_counter()
+    batch_scores = evaluate_batch(hands)
+    batch_time = time.perf_counter() - start
+
+    sample = hands[:args.scalar_hands].tolist()
+    start = time.perf_counter()
+    scalar_scores = [evaluate(hand) for hand in sample]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = [hand_rank(hand) for hand in sample]
+    reference_time = time.perf_counter() - start
+
+    mismatches = int((batch_scores[:len(sample)] != np.array(scalar_scores)).sum())
+    order = sorted(range(len(sample)), key=lambda i: reference[i])
+    ordered = batch_scores[:len(sample)][order]
+    misordered = int((np.diff(ordered) < 0).sum())
+
+    print(f"evaluate_batch: {args.hands / batch_time:,.0f} rąk/s")
+    print(f"evaluate:       {len(sample) / scalar_time:,.0f} rąk/s")
+    print(f"hand_rank:      {len(sample) / reference_time:,.0f} rąk/s")
+    print(f"Niezgodności z evaluate: {mismatches}, błędy kolejności względem hand_rank: {misordered}")
+    sys.exit(1 if mismatches or misordered or exhaustive_mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+import argparse
+import os
+import random
+import sys
+import time
+from array import array
+from itertools import combinations, combinations_with_replacement, permutations, product
+from math import comb
+from multiprocessing import Pool
+from src.logic.discard_table import TABLE_MAGIC, TABLE_PATH, DiscardTable
+from src.logic.hand_evaluator import NUM_SCORES, evaluate
+from src.logic.hand_index import BINOMIALS, NUM_HANDS, hand_index, subset_index
+
+CLASSES_PER_PART = 4096
+_POPCOUNT = tuple(bin(mask).count('1') for mask in range(32))
+# Zasady pozwalają wymienić najwyżej 4 karty, więc maska 0 (wymiana całej ręki) odpada.
+# Najpierw układy trzymające więcej kart, więc przy równej wartości oczekiwanej bot wymienia mniej.
+_HOLD_ORDER = tuple(sorted(range(1, 32), key=lambda mask: -_POPCOUNT[mask]))
+_DRAW_COUNTS = tuple(comb(47, drawn) for drawn in range(6))
+_SUIT_PARTITIONS = ((5,), (4, 1), (3, 2), (3, 1, 1), (2, 2, 1), (2, 1, 1, 1))
+
+# _SUMS[k][i] - suma wartości wszystkich rąk zawierających k-elementowy podzbiór kart o indeksie colex i.
+_SUMS = None
+
+
+def build_hand_values():
+    scores = array('h', bytes(2 * NUM_HANDS))
+    counts = [0] * NUM_SCORES
+    i = 0
+    for c4 in range(4, 52):
+        for c3 in range(3, c4):
+            for c2 in range(2, c3):
+                for c1 in range(1, c2):
+                    for c0 in range(c1):
+                        score = evaluate((c0, c1, c2, c3, c4))
+                        scores[i] = score
+                        counts[score] += 1
+                        i += 1
+
+    hands_below = [0] * NUM_SCORES
+    for score in range(1, NUM_SCORES):
+        hands_below[score] = hands_below[score - 1] + counts[score - 1]
+    values = array('q', (hands_below[score] for score in scores))
+    return values, hands_below
+
+
+def build_subset_sums(values: array) -> list:
+    b1, b2, b3, b4 = BINOMIALS[1:5]
+    sums4 = array('q', bytes(8 * comb(52, 4)))
+    i = 0
+    for c4 in range(4, 52):
+        for c3 in range(3, c4):
+            for c2 in range(2, c3):
+                for c1 in range(1, c2):
+                    high = b3[c3] + b4[c4]
+                    for c0 in range(c1):
+                        v = values[i]
+                        sums4[b1[c1] + b2[c2] + high] += v
+                        sums4[b1[c0] + b2[c2] + high] += v
+                        sums4[b1[c0] + b2[c1] + high] += v
+                        sums4[b1[c0] + b2[c1] + b3[c2] + b4[c4]] += v
+                        sums4[b1[c0] + b2[c1] + b3[c2] + b4[c3]] += v
+                        i += 1
+
+    sums = [None, None, None, None, sums4, values]
+    for size in range(3, -1, -1):
+        upper = sums[size + 1]
+        level = [0] * comb(52, size)
+        for cards in combinations(range(52), size + 1):
+            v = upper[subset_index(cards)]
+            for j in range(size + 1):
+                level[subset_index(cards[:j] + cards[j + 1:])] += v
+        # Każda ręka zawierająca podzbiór rozmiaru `size` jest liczona raz dla każdej z (5 - size) dróg przez poziom wyżej.
+        sums[size] = array('q', (total // (5 - size) for total in level))
+    return sums
+
+
+def _init_worker():
+    global _SUMS
+    if _SUMS is None:
+        values, _ = build_hand_values()
+        _SUMS = build_subset_sums(values)
+
+
+def hold_totals(hand: tuple, sums: list) -> list:
+    subset_indices = [0] * 32
+    for mask in range(1, 32):
+        size = 0
+        index = 0
+        for j in range(5):
+            if mask >> j & 1:
+                size += 1
+                index += BINOMIALS[size][hand[j]]
+        subset_indices[mask] = index
+
+    totals = [0] * 32
+    for hold in range(32):
+        dead = 31 ^ hold
+        total = 0
+        sub = dead
+        # Włączanie-wyłączanie: ręce zawierające trzymane karty i żadnej z odrzuconych.
+        while True:
+            mask = hold | sub
+            value = sums[_POPCOUNT[mask]][subset_indices[mask]]
+            total += -value if _POPCOUNT[sub] & 1 else value
+            if sub == 0:
+                break
+            sub = (sub - 1) & dead
+        totals[hold] = total
+    return totals
+
+
+def best_hold(hand: tuple, sums: list) -> int:
+    return best_hold_from_totals(hold_totals(hand, sums))
+
+
+def best_hold_from_totals(totals: list) -> int:
+    best = _HOLD_ORDER[0]
+    for hold in _HOLD_ORDER[1:]:
+        if totals[hold] * _DRAW_COUNTS[5 - _POPCOUNT[best]] > totals[best] * _DRAW_COUNTS[5 - _POPCOUNT[hold]]:
+            best = hold
+    return best
+
+
+def suit_classes() -> list:
+    masks_by_size = {size: [sum(1 << v for v in values) for values in combinations(range(13), size)] for size in range(1, 6)}
+    classes = set()
+    for sizes in _SUIT_PARTITIONS:
+        # Kolory o tej samej liczbie kart są wymienne, więc ich maski wybieramy jako multizbiór.
+        choices = [combinations_with_replacement(masks_by_size[size], sizes.count(size)) for size in sorted(set(sizes), reverse=True)]
+        for groups in product(*choices):
+            masks = tuple(mask for group in groups for mask in group)
+            classes.add(tuple(sorted(masks + (0,) * (4 - len(masks)), reverse=True)))
+    return sorted(classes)
+
+
+def class_hand(suit_masks: tuple) -> tuple:
+    return tuple(sorted(slot * 13 + v for slot, mask in enumerate(suit_masks) for v in range(13) if mask >> v & 1))
+
+
+def solve_part(part: tuple) -> tuple:
+    part_id, classes, parts_dir = part
+    indices = array('I')
+    masks = bytearray()
+    for suit_masks in classes:
+        hand = class_hand(suit_masks)
+        hold = best_hold(hand, _SUMS)
+        held = {hand[j] for j in range(5) if hold >> j & 1}
+        seen = set()
+        for suits in permutations(range(4)):
+            member = sorted((suits[card // 13] * 13 + card % 13, card in held) for card in hand)
+            index = hand_index([card for card, _ in member])
+            if index in seen:
+                continue
+            seen.add(index)
+            indices.append(index)
+            masks.append(sum(1 << j for j, (_, is_held) in enumerate(member) if is_held))
+
+    path = os.path.join(parts_dir, f"part_{part_id:04d}.bin")
+    with open(path + '.tmp', 'wb') as f:
+        f.write(len(indices).to_bytes(4, 'little'))
+        indices.tofile(f)
+        f.write(masks)
+    os.replace(path + '.tmp', path)
+    return part_id, len(indices)
+
+
+def build_table(path: str, workers: int = None) -> None:
+    parts_dir = path + '.parts'
+    os.makedirs(parts_dir, exist_ok=True)
+    classes = suit_classes()
+    parts = [
+        (part_id, classes[start:start + CLASSES_PER_PART], parts_dir)
+        for part_id, start in enumerate(range(0, len(classes), CLASSES_PER_PART))
+    ]
+    pending = [part for part in parts if not os.path.exists(os.path.join(parts_dir, f"part_{part[0]:04d}.bin"))]
+    print(f"Klasy izomorficzne: {len(classes)}, części: {len(parts)}, do policzenia: {len(pending)}.")
+
+    if pending:
+        start = time.perf_counter()
+        _init_worker()
+        print(f"Sumy podzbiorów policzone w {time.perf_counter() - start:.1f} s.")
+        with Pool(processes=workers, initializer=_init_worker) as pool:
+            for done, (part_id, count) in enumerate(pool.imap_unordered(solve_part, pending), start=1):
+                print(f"Część {part_id} gotowa ({count} rąk), {done}/{len(pending)}.")
+
+    table = bytearray([0xFF]) * NUM_HANDS
+    for part_id, _, _ in parts:
+        with open(os.path.join(parts_dir, f"part_{part_id:04d}.bin"), 'rb') as f:
+            count = int.from_bytes(f.read(4), 'little')
+            indices = array('I')
+            indices.fromfile(f, count)
+            masks = f.read(count)
+        for index, mask in zip(indices, masks):
+            table[index] = mask
+    missing = table.count(0xFF)
+    if missing:
+        raise RuntimeError(f"Brak wyników dla {missing} rąk.")
+
+    with open(path + '.tmp', 'wb') as f:
+        f.write(TABLE_MAGIC)
+        f.write(table)
+    os.replace(path + '.tmp', path)
+    for part_id, _, _ in parts:
+        os.remove(os.path.join(parts_dir, f"part_{part_id:04d}.bin"))
+    os.rmdir(parts_dir)
+    print(f"Zapisano tablicę wymiany kart do {path}.")
+
+
+def brute_force_totals(hand: tuple, hands_below: list) -> list:
+    deck = [card for card in range(52) if card not in hand]
+    totals = [0] * 32
+    for hold in _HOLD_ORDER:
+        held = [hand[j] for j in range(5) if hold >> j & 1]
+        totals[hold] = sum(hands_below[evaluate(held + list(draw))] for draw in combinations(deck, 5 - len(held)))
+    return totals
+
+
+def verify_table(path: str, samples: int, seed: int) -> int:
+    table = DiscardTable(path)
+    values, hands_below = build_hand_values()
+    sums = build_subset_sums(values)
+    rng = random.Random(seed)
+    failures = 0
+    for _ in range(samples):
+        hand = tuple(sorted(rng.sample(range(52), 5)))
+        hold = table.hold_mask(list(hand))
+        exact = brute_force_totals(hand, hands_below)
+        fast = hold_totals(hand, sums)
+        best_ev = max(exact[mask] / _DRAW_COUNTS[5 - _POPCOUNT[mask]] for mask in _HOLD_ORDER)
+        table_ev = exact[hold] / _DRAW_COUNTS[5 - _POPCOUNT[hold]]
+        if any(exact[mask] != fast[mask] for mask in _HOLD_ORDER) or table_ev < best_ev:
+            failures += 1
+            print(f"Błąd dla ręki {hand}: trzymane {hold:05b}, EV {table_ev:.1f} < {best_ev:.1f}")
+    print(f"Sprawdzono {samples} rąk, błędy: {failures}.")
+    table.close()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Budowa i weryfikacja tablicy optymalnej wymiany kart.")
+    parser.add_argument("--path", default=TABLE_PATH)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--verify", type=int, default=0, metavar="N", help="sprawdź N losowych rąk pełnym przeliczeniem")
+    parser.add_argument("--seed", type=int, default=2025)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        build_table(args.path, args.workers)
+    failures = verify_table(args.path, args.verify, args.seed) if args.verify else 0
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import argparse
+import os
+import random
+import sys
+import time
+from array import array
+from itertools import permutations
+from multiprocessing import Pool
+import tools.build_discard_table as discard_builder
+from tools.build_discard_table import (_DRAW_COUNTS, _HOLD_ORDER, _POPCOUNT, brute_force_totals, best_hold_from_totals,
+                                       build_hand_values, class_hand, hold_totals, suit_classes)
+from src.logic.hand_evaluator import evaluate
+from src.logic.hand_index import NUM_HANDS, hand_index
+from src.logic.percentile_table import PERCENTILE_MAGIC, PERCENTILE_PATH, PERCENTILE_SCALE, PercentileTable
+
+CLASSES_PER_CHUNK = 2048
+
+
+def to_byte(hands_below: float) -> int:
+    return min(PERCENTILE_SCALE, int(hands_below * PERCENTILE_SCALE / NUM_HANDS + 0.5))
+
+
+def solve_chunk(classes: list) -> tuple:
+    indices = array('I')
+    percentiles = bytearray()
+    for suit_masks in classes:
+        hand = class_hand(suit_masks)
+        totals = hold_totals(hand, discard_builder._SUMS)
+        hold = best_hold_from_totals(totals)
+        # Wartość oczekiwana po wymianie jest taka sama dla wszystkich permutacji kolorów klasy.
+        value = to_byte(totals[hold] / _DRAW_COUNTS[5 - _POPCOUNT[hold]])
+        members = {hand_index([suits[card // 13] * 13 + card % 13 for card in hand]) for suits in permutations(range(4))}
+        indices.extend(members)
+        percentiles += bytes([value]) * len(members)
+    return indices, percentiles
+
+
+def build_table(path: str, with_draw: bool, workers: int = None) -> None:
+    start = time.perf_counter()
+    values, _ = build_hand_values()
+    current = bytes(to_byte(v) for v in values)
+    print(f"Percentyle przed wymianą policzone w {time.perf_counter() - start:.1f} s.")
+
+    draw = None
+    if with_draw:
+        start = time.perf_counter()
+        classes = suit_classes()
+        chunks = [classes[i:i + CLASSES_PER_CHUNK] for i in range(0, len(classes), CLASSES_PER_CHUNK)]
+        draw = bytearray([0xFF]) * NUM_HANDS
+        filled = 0
+        with Pool(processes=workers, initializer=discard_builder._init_worker) as pool:
+            for indices, percentiles in pool.imap_unordered(solve_chunk, chunks):
+                for index, value in zip(indices, percentiles):
+                    draw[index] = value
+                filled += len(indices)
+        if filled != NUM_HANDS:
+            raise RuntimeError(f"Policzono {filled} z {NUM_HANDS} rąk.")
+        print(f"Percentyle po wymianie ({len(classes)} klas izomorficznych) policzone w {time.perf_counter() - start:.1f} s.")
+
+    with open(path + '.tmp', 'wb') as f:
+        f.write(PERCENTILE_MAGIC)
+        f.write(current)
+        if draw is not None:
+            f.write(draw)
+    os.replace(path + '.tmp', path)
+    print(f"Zapisano tablicę percentyli do {path}.")
+
+
+def verify_table(path: str, samples: int, seed: int) -> int:
+    table = PercentileTable(path)
+    _, hands_below = build_hand_values()
+    rng = random.Random(seed)
+    failures = 0
+    for _ in range(samples):
+        hand = tuple(sorted(rng.sample(range(52), 5)))
+        expected = to_byte(hands_below[evaluate(hand)])
+        if table.has_draw:
+            exact = brute_force_totals(hand, hands_below)
+            expected_draw = to_byte(max(exact[mask] / _DRAW_COUNTS[5 - _POPCOUNT[mask]] for mask in _HOLD_ORDER))
+        else:
+            expected_draw = expected
+        stored = round(table.percentile(list(hand)) * PERCENTILE_SCALE)
+        stored_draw = round(table.draw_percentile(list(hand)) * PERCENTILE_SCALE)
+        if stored != expected or stored_draw != expected_draw:
+            failures += 1
+            print(f"Błąd dla ręki {hand}: {stored}/{stored_draw}, oczekiwano {expected}/{expected_draw}")
+    print(f"Sprawdzono {samples} rąk, błędy: {failures}.")
+    table.close()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Budowa i weryfikacja tablicy percentyli siły rąk.")
+    parser.add_argument("--path", default=PERCENTILE_PATH)
+    parser.add_argument("--no-draw", action="store_true", help="bez płaszczyzny oczekiwanego percentyla po wymianie")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--verify", type=int, default=0, metavar="N", help="sprawdź N losowych rąk pełnym przeliczeniem")
+    parser.add_argument("--seed", type=int, default=2025)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        build_table(args.path, not args.no_draw, args.workers)
+    failures = verify_table(args.path, args.verify, args.seed) if args.verify else 0
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import argparse
+import json
+import time
+from src.analytics.player_stats import compute_player_stats, stats_to_records
+from src.fileops.columnar_export import export_columns
+from src.fileops.history_logger import HistoryLogger
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Eksport historii rozdań do kolumn NumPy i statystyki graczy.")
+    parser.add_argument("--data-dir", default='data', help="katalog z plikami history_*.json i dziennikiem history_log")
+    parser.add_argument("--out", default='data/columns', help="katalog docelowy plików .npy")
+    parser.add_argument("--skip-export", action="store_true", help="licz statystyki z istniejącego eksportu")
+    parser.add_argument("--json", action="store_true", help="statystyki w formacie JSON")
+    args = parser.parse_args()
+
+    if not args.skip_export:
+        start = time.perf_counter()
+        meta = export_columns(HistoryLogger(data_dir=args.data_dir, mode='json').iter_hands(), args.out)
+        elapsed = time.perf_counter() - start
+        print(f"Wyeksportowano {meta['hands']} rozdań i {meta['actions']} akcji do {args.out} w {elapsed:.2f} s.")
+
+    start = time.perf_counter()
+    records = stats_to_records(compute_player_stats(args.out))
+    elapsed = time.perf_counter() - start
+    if args.json:
+        print(json.dumps(records, indent=2, ensure_ascii=False))
+        return
+    print(f"Statystyki policzone w {elapsed * 1000:.1f} ms.")
+    for r in sorted(records, key=lambda r: r["profit"], reverse=True):
+        print(f"{r['name']}: rozdania {r['hands_played']}, VPIP {r['vpip']:.1%}, AF {r['aggression_factor']:.2f}, "
+              f"wygrane showdowny {r['showdown_win_rate']:.1%}, zysk {r['profit']} ({r['profit_per_hand']:.2f}/rozdanie)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+import sys
+from src.network.protocol import decode, encode
+
+
+async def _input(prompt: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
+
+async def play(host: str, port: int, unix_path: str, name: str) -> None:
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    writer.write(encode({"type": "join", "name": name}))
+    names = {}
+    while True:
+        line = await reader.readline()
+        if not line:
+            print("Połączenie zamknięte przez serwer.")
+            return
+        message = decode(line)
+        kind = message.get("type")
+        if kind == "seated":
+            names = {p["id"]: p["name"] for p in message["players"]}
+            print(f"Stół {message['table_id']}: {', '.join(names.values())}")
+        elif kind == "hand_started":
+            print(f"\n=== {message['hand_id']} ===")
+        elif kind == "cards_dealt":
+            print(f"Twoje karty: {' '.join(message['cards'])}")
+        elif kind == "action_taken":
+            print(f"{names.get(message['player_id'])}: {message['action']} {message['amount'] or ''}")
+        elif kind == "showdown_hand":
+            print(f"{names.get(message['player_id'])} ma: {' '.join(message['cards'])}")
+        elif kind == "showdown_result":
+            print(f"Zwycięzca: {names.get(message['winner_id'])}, pula {message['pot']}")
+            for side_pot in message.get("side_pots", [])[1:]:
+                print(f"Pula boczna {side_pot['amount']}: {names.get(side_pot['winner_id'])}")
+        elif kind == "action_request":
+            print(f"Pula: {message['pot']} | do wyrównania: {message['to_call']} | stos: {message['stack']} | karty: {' '.join(message['cards'])}")
+            parts = (await _input("Akcja [fold, check, call, raise <kwota>]: ")).split()
+            reply = {"type": "action", "action": parts[0] if parts else ""}
+            if len(parts) > 1 and parts[1].isdigit():
+                reply["amount"] = int(parts[1])
+            writer.write(encode(reply))
+        elif kind == "discard_request":
+            text = await _input(f"Karty: {' '.join(message['cards'])}. Indeksy do wymiany (0-4): ")
+            indices = [int(i) for i in text.split() if i.isdigit()]
+            writer.write(encode({"type": "discard", "indices": indices}))
+        elif kind in ("error", "timeout"):
+            print(f"Serwer: {message.get('message', 'przekroczono czas, pasujesz')}")
+        elif kind == "table_closed":
+            print(f"Stół zamknięty po {message['hands']} rozdaniach.")
+            return
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Konsolowy klient serwera pokera.")
+    parser.add_argument("--host", default='127.0.0.1')
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", default=None)
+    parser.add_argument("--name", default="Gracz")
+    args = parser.parse_args()
+    try:
+        asyncio.run(play(args.host, args.port, args.unix, args.name))
+    except (KeyboardInterrupt, EOFError, ConnectionError) as e:
+        print(f"\nKoniec gry ({e.__class__.__name__}).")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
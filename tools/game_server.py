@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+from main import load_config
+from src.fileops.history_logger import HistoryLogger
+from src.network.server import BOT_POLICIES, GameServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serwer wielu stołów pokera dobieranego (JSON w liniach przez TCP lub gniazdo Unix).")
+    parser.add_argument("--host", default='127.0.0.1')
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", default=None, help="ścieżka gniazda Unix zamiast TCP")
+    parser.add_argument("--seats", type=int, default=4, help="liczba miejsc przy stole")
+    parser.add_argument("--humans", type=int, default=1, help="liczba ludzi potrzebna do otwarcia stołu")
+    parser.add_argument("--timeout", type=float, default=15.0, help="czas na decyzję w sekundach; po nim gracz pasuje")
+    parser.add_argument("--bot", choices=sorted(BOT_POLICIES), default='random')
+    parser.add_argument("--bot-tables", type=int, default=0, help="liczba stołów grających wyłącznie botami")
+    parser.add_argument("--max-hands", type=int, default=0, help="limit rozdań na stół z ludźmi (0 = bez limitu)")
+    parser.add_argument("--history", action="store_true", help="zapisuj historię rozdań")
+    parser.add_argument("--max-threads", type=int, default=256,
+                        help="limit stołów grających jednocześnie (każde rozdanie zajmuje jeden wątek)")
+    args = parser.parse_args()
+
+    history_logger = HistoryLogger() if args.history else None
+    server = GameServer(load_config(), args.host, args.port, args.unix, args.seats, args.humans, args.timeout,
+                        args.bot, args.bot_tables, args.max_hands, history_logger, args.max_threads)
+    address = args.unix or f"{args.host}:{args.port}"
+    print(f"Serwer nasłuchuje na {address}. Przerwij przez Ctrl+C.")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print(f"\nZatrzymano serwer. Rozegrano {server.hands_played} rozdań.")
+    finally:
+        if history_logger is not None:
+            history_logger.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+from src.fileops.history_archive import ARCHIVE_EXTENSION, HistoryArchive, HistoryArchiveWriter
+from src.fileops.history_logger import HistoryLogger
+
+
+def pack(hands, path: str, segment_hands: int) -> int:
+    count = 0
+    with HistoryArchiveWriter(path, segment_hands) as writer:
+        for history_data in hands:
+            writer.add(history_data)
+            count += 1
+    return count
+
+
+def unpack(path: str, out_dir: str) -> int:
+    os.makedirs(out_dir, exist_ok=True)
+    count = 0
+    with HistoryArchive(path) as archive:
+        for history_data in archive.iter_hands():
+            filepath = os.path.join(out_dir, f"history_{history_data.get('game_id')}_{history_data.get('hand_id')}.json")
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(history_data, f, indent=2, ensure_ascii=False)
+            count += 1
+    return count
+
+
+def verify(hands: list, path: str) -> int:
+    failures = 0
+    with HistoryArchive(path) as archive:
+        decoded = list(archive.iter_hands())
+        if len(decoded) != len(hands):
+            print(f"Archiwum zawiera {len(decoded)} rozdań, oczekiwano {len(hands)}.")
+            return max(1, abs(len(decoded) - len(hands)))
+        for original, restored in zip(hands, decoded):
+            # Porównanie tekstowe sprawdza też kolejność kluczy.
+            if json.dumps(original, ensure_ascii=False) != json.dumps(restored, ensure_ascii=False):
+                failures += 1
+                print(f"Różnica w rozdaniu {original.get('game_id')}/{original.get('hand_id')}")
+        for original in hands[::max(1, len(hands) // 100)]:
+            if archive.load_hand(original.get("game_id"), original.get("hand_id")) is None:
+                failures += 1
+                print(f"Brak rozdania {original.get('game_id')}/{original.get('hand_id')} w indeksie.")
+    return failures
+
+
+def report(hands: list, path: str, segment_hands: int) -> None:
+    indented = sum(len(json.dumps(h, indent=2, ensure_ascii=False).encode('utf-8')) for h in hands)
+    jsonl = b''.join(json.dumps(h, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n' for h in hands)
+    binary = sum(4 + len(zlib.compress(json.dumps(h, ensure_ascii=False, separators=(',', ':')).encode('utf-8')))
+                 for h in hands)
+
+    start = time.perf_counter()
+    pack(hands, path, segment_hands)
+    encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    with HistoryArchive(path) as archive:
+        decoded = sum(1 for _ in archive.iter_hands())
+    decode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    parsed = sum(1 for line in jsonl.splitlines() if json.loads(line))
+    jsonl_time = time.perf_counter() - start
+    archive_size = os.path.getsize(path)
+
+    print(f"Rozdania: {len(hands)}")
+    for label, size in (("JSON (pliki z wcięciami)", indented), ("JSONL", len(jsonl)),
+                        ("binarny dziennik (zlib per rozdanie)", binary), ("archiwum", archive_size)):
+        print(f"  {label}: {size / 1024:.1f} KiB, {size / len(hands):.1f} B/rozdanie, "
+              f"{indented / size:.1f}x mniej niż JSON")
+    print(f"Kodowanie: {len(hands) / encode_time:.0f} rozdań/s ({len(jsonl) / encode_time / 2 ** 20:.1f} MB/s JSONL)")
+    print(f"Dekodowanie: {decoded / decode_time:.0f} rozdań/s ({len(jsonl) / decode_time / 2 ** 20:.1f} MB/s JSONL), "
+          f"json.loads JSONL: {parsed / jsonl_time:.0f} rozdań/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kompaktowe archiwum historii rozdań: pakowanie, rozpakowanie i raport.")
+    parser.add_argument("command", choices=('pack', 'unpack', 'report'))
+    parser.add_argument("--data-dir", default='data', help="katalog z plikami history_*.json i dziennikiem history_log")
+    parser.add_argument("--archive", default=os.path.join('data', 'history_log', f'hands_archive{ARCHIVE_EXTENSION}'))
+    parser.add_argument("--out", default=os.path.join('data', 'unpacked'), help="katalog plików JSON przy rozpakowaniu")
+    parser.add_argument("--segment-hands", type=int, default=256, help="liczba rozdań w jednym segmencie zlib")
+    parser.add_argument("--input", help="plik JSONL z rozdaniami zamiast historii z --data-dir")
+    args = parser.parse_args()
+
+    if args.command == 'pack' and os.path.exists(args.archive):
+        # Archiwum w history_log jest jednym ze źródeł historii, więc nie nadpisujemy go przy ponownym pakowaniu.
+        print(f"Archiwum {args.archive} już istnieje.")
+        sys.exit(1)
+    if args.command == 'unpack':
+        start = time.perf_counter()
+        count = unpack(args.archive, args.out)
+        print(f"Rozpakowano {count} rozdań do {args.out} w {time.perf_counter() - start:.2f} s.")
+        return
+
+    if args.input:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            hands = [json.loads(line) for line in f if line.strip()]
+    else:
+        hands = list(HistoryLogger(data_dir=args.data_dir, mode='json').iter_hands())
+    if not hands:
+        print("Brak rozdań do spakowania.")
+        sys.exit(1)
+
+    if args.command == 'pack':
+        start = time.perf_counter()
+        count = pack(hands, args.archive, args.segment_hands)
+        print(f"Spakowano {count} rozdań do {args.archive} ({os.path.getsize(args.archive) / 1024:.1f} KiB) "
+              f"w {time.perf_counter() - start:.2f} s.")
+        failures = verify(hands, args.archive)
+    else:
+        path = args.archive + '.report'
+        report(hands, path, args.segment_hands)
+        failures = verify(hands, path)
+        os.remove(path)
+    print(f"Sprawdzono {len(hands)} rozdań, błędy: {failures}.")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import glob
+import os
+import time
+from src.fileops.history_archive import ARCHIVE_EXTENSION
+from src.fileops.history_logger import read_segment
+from src.fileops.history_store import DEFAULT_DB_PATH, HistoryStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import istniejących historii rozdań do bazy SQLite.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    parser.add_argument("--pattern", default=os.path.join('data', 'history_*.json'), help="pliki JSON z pojedynczymi rozdaniami")
+    parser.add_argument("--log-dir", default=os.path.join('data', 'history_log'), help="katalog segmentów dziennika historii")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    store = HistoryStore(args.db)
+    start = time.perf_counter()
+    imported = store.import_json_files(args.pattern, args.batch_size)
+
+    segments = sorted(glob.glob(os.path.join(args.log_dir, 'hands_*.jsonl')) + glob.glob(os.path.join(args.log_dir, 'hands_*.bin'))
+                      + glob.glob(os.path.join(args.log_dir, f'hands_*{ARCHIVE_EXTENSION}')))
+    for path in segments:
+        batch = []
+        for history_data in read_segment(path):
+            batch.append(history_data)
+            if len(batch) >= args.batch_size:
+                imported += store.add_hands(batch)
+                batch = []
+        if batch:
+            imported += store.add_hands(batch)
+
+    store.close()
+    print(f"Zaimportowano {imported} rozdań do {args.db} w {time.perf_counter() - start:.2f} s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from typing import List
+from src.network.protocol import decode, encode
+
+
+class LoadClient:
+    def __init__(self, index: int, rng: random.Random, think_ms: float, fold_rate: float):
+        self.index = index
+        self.rng = rng
+        self.think_ms = think_ms
+        self.fold_rate = fold_rate
+        self.player_id = None
+        self.table_id = None
+        self.sent_at = None
+        self.latencies: List[float] = []
+        self.timeouts = 0
+
+    def choose(self, request: dict) -> dict:
+        if request["to_call"] > 0:
+            return {"type": "action", "action": "fold" if self.rng.random() < self.fold_rate else "call"}
+        return {"type": "action", "action": "check"}
+
+    async def run(self, host: str, port: int, unix_path: str, deadline: float) -> None:
+        if unix_path:
+            reader, writer = await asyncio.open_unix_connection(unix_path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        writer.write(encode({"type": "join", "name": f"load_{self.index}"}))
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), deadline - time.perf_counter())
+                except asyncio.TimeoutError:
+                    break
+                if not line:
+                    break
+                message = decode(line)
+                kind = message.get("type")
+                if kind == "seated":
+                    self.player_id = message["player_id"]
+                    self.table_id = message["table_id"]
+                elif kind == "action_request":
+                    if self.think_ms:
+                        await asyncio.sleep(self.rng.random() * self.think_ms / 1000.0)
+                    self.sent_at = time.perf_counter()
+                    writer.write(encode(self.choose(message)))
+                elif kind == "discard_request":
+                    writer.write(encode({"type": "discard", "indices": []}))
+                elif kind == "action_taken" and message["player_id"] == self.player_id and self.sent_at is not None:
+                    # Opóźnienie akcji: od wysłania decyzji do potwierdzenia jej przez stół.
+                    self.latencies.append(time.perf_counter() - self.sent_at)
+                    self.sent_at = None
+                elif kind == "timeout":
+                    self.timeouts += 1
+                elif kind == "table_closed":
+                    break
+        finally:
+            writer.close()
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_step(host: str, port: int, unix_path: str, connections: int, duration: float, think_ms: float,
+                   fold_rate: float, seed: int) -> dict:
+    rng = random.Random(seed)
+    clients = [LoadClient(i, random.Random(rng.getrandbits(64)), think_ms, fold_rate) for i in range(connections)]
+    start = time.perf_counter()
+    deadline = start + duration
+    results = await asyncio.gather(*(c.run(host, port, unix_path, deadline) for c in clients), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    latencies = [latency for c in clients for latency in c.latencies]
+    return {
+        "connections": connections,
+        "failed_connections": sum(1 for r in results if isinstance(r, Exception)),
+        "tables": len({c.table_id for c in clients if c.table_id is not None}),
+        "actions": len(latencies),
+        "actions_per_second": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "timeouts": sum(c.timeouts for c in clients),
+        "latency_ms": {
+            "mean": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+            "p50": _percentile(latencies, 0.50) * 1000,
+            "p95": _percentile(latencies, 0.95) * 1000,
+            "p99": _percentile(latencies, 0.99) * 1000,
+            "max": max(latencies) * 1000 if latencies else 0.0
+        }
+    }
+
+
+async def run_ramp(args) -> List[dict]:
+    steps = []
+    for connections in args.connections:
+        step = await run_step(args.host, args.port, args.unix, connections, args.duration, args.think_ms,
+                              args.fold_rate, args.seed)
+        step["saturated"] = step["latency_ms"]["p95"] > args.slo_ms
+        steps.append(step)
+        if not args.json:
+            latency = step["latency_ms"]
+            print(f"połączenia {connections:5d} | stoły {step['tables']:4d} | akcje/s {step['actions_per_second']:9,.0f} | "
+                  f"p50 {latency['p50']:7.2f} ms | p95 {latency['p95']:7.2f} ms | p99 {latency['p99']:7.2f} ms"
+                  + (" | NASYCENIE" if step["saturated"] else ""))
+        if step["saturated"] and args.stop_at_saturation:
+            break
+        # Serwer potrzebuje chwili na zamknięcie stołów po rozłączeniu klientów.
+        await asyncio.sleep(0.5)
+    return steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test obciążeniowy serwera pokera: wiele symulowanych połączeń.")
+    parser.add_argument("--host", default='127.0.0.1')
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", default=None)
+    parser.add_argument("--connections", type=int, nargs='+', default=[50, 100, 200, 400], help="kolejne poziomy liczby połączeń")
+    parser.add_argument("--duration", type=float, default=10.0, help="czas trwania jednego poziomu w sekundach")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="maksymalny losowy czas namysłu klienta")
+    parser.add_argument("--fold-rate", type=float, default=0.1)
+    parser.add_argument("--slo-ms", type=float, default=50.0, help="próg p95 opóźnienia uznawany za nasycenie")
+    parser.add_argument("--stop-at-saturation", action="store_true")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    steps = asyncio.run(run_ramp(args))
+    if args.json:
+        print(json.dumps(steps, indent=2))
+
+
+if __name__ == "__main__":
+    main()
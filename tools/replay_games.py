@@ -0,0 +1,47 @@
+import argparse
+import json
+from src.engine.replay import GameReplayer, verify_corpus
+from src.fileops.history_logger import HistoryLogger
+from src.fileops.history_store import DEFAULT_DB_PATH, HistoryStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Odtwarzanie i weryfikacja zapisanych gier.")
+    parser.add_argument("--data-dir", default='data')
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="baza SQLite z historią ('' wyłącza bazę)")
+    parser.add_argument("--game-id", help="gra do odtworzenia; bez tej opcji weryfikowany jest cały zbiór historii")
+    parser.add_argument("--show", action="store_true", help="wypisz stosy graczy po każdym rozdaniu")
+    parser.add_argument("--json", action="store_true", help="raport w formacie JSON")
+    args = parser.parse_args()
+
+    store = HistoryStore(args.db) if args.db else None
+    history_logger = HistoryLogger(data_dir=args.data_dir, mode='json', store=store)
+
+    if args.game_id is None:
+        report = verify_corpus(history_logger.iter_hands())
+    elif args.show:
+        replayer = GameReplayer(history_logger, args.game_id)
+        checked = failed = 0
+        for step in replayer.replay():
+            checked += 1
+            failed += 1 if step.errors else 0
+            stacks = ", ".join(f"{player_id}: {stack}" for player_id, stack in step.stacks.items())
+            print(f"{step.history['hand_id']}: {stacks}" + (f"  BŁĘDY: {'; '.join(step.errors)}" if step.errors else ""))
+        report = {"hands": checked, "failed_hands": failed}
+    else:
+        report = GameReplayer(history_logger, args.game_id).verify()
+
+    if store is not None:
+        store.close()
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+    print(f"Sprawdzono {report['hands']} rozdań, niezgodnych: {report['failed_hands']}.")
+    for entry in report.get("errors", []):
+        print(f"{entry['game_id']} {entry['hand_id']}: {'; '.join(entry['errors'])}")
+    if "hands_per_second" in report:
+        print(f"Czas: {report['seconds']:.3f} s ({report['hands_per_second']:,.0f} rozdań/s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import argparse
+import json
+import sys
+from src.engine.resimulation import resimulate_corpus
+from src.fileops.history_logger import HistoryLogger
+from src.fileops.history_store import DEFAULT_DB_PATH, HistoryStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ponowna symulacja zapisanych rozdań i porównanie z historią.")
+    parser.add_argument("--data-dir", default='data')
+    parser.add_argument("--db", default='', help=f"baza SQLite z historią, np. {DEFAULT_DB_PATH} (domyślnie pliki i segmenty)")
+    parser.add_argument("--game-id", help="ogranicz sprawdzanie do jednej gry")
+    parser.add_argument("--workers", type=int, default=None, help="liczba procesów (domyślnie liczba rdzeni)")
+    parser.add_argument("--chunk-size", type=int, default=256, help="liczba rozdań w jednym zadaniu")
+    parser.add_argument("--json", action="store_true", help="raport w formacie JSON")
+    args = parser.parse_args()
+
+    store = HistoryStore(args.db) if args.db else None
+    history_logger = HistoryLogger(data_dir=args.data_dir, mode='json', store=store)
+    report = resimulate_corpus(history_logger.iter_hands(args.game_id), args.workers, args.chunk_size)
+    if store is not None:
+        store.close()
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"Sprawdzono {report['hands']} rozdań, niezgodnych: {report['failed_hands']}.")
+        for entry in report["errors"]:
+            print(f"{entry['game_id']} {entry['hand_id']}: {'; '.join(entry['errors'])}")
+        print(f"Procesy: {report['workers']}, czas: {report['seconds']:.3f} s ({report['hands_per_second']:,.0f} rozdań/s).")
+    sys.exit(1 if report['failed_hands'] else 0)
+
+
+if __name__ == "__main__":
+    main()
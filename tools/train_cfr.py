@@ -0,0 +1,63 @@
+import argparse
+import json
+import os
+import sys
+from src.logic.batch_simulator import load_hold_masks
+from src.logic.cfr import DEFAULT_BATCH_SIZE, DEFAULT_BUCKETS, CFRTrainer
+from src.logic.discard_table import TABLE_PATH
+from src.logic.strategy_table import INFOSET_ACTIONS, STRATEGY_PATH
+
+_INFOSET_NAMES = ("pierwsza decyzja", "po wyrównaniu", "przebicie po wyrównaniu", "przebicie")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trening strategii licytacji botów (CFR+) na abstrakcji rozdania heads-up.")
+    parser.add_argument("--config", default='config.json', help="plik z wysokością blindów")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--buckets", type=int, default=DEFAULT_BUCKETS, help="liczba koszyków siły ręki")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="rozdania na workera w jednej iteracji")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--checkpoint", default=os.path.join('data', 'cfr_checkpoint.npz'))
+    parser.add_argument("--checkpoint-every", type=int, default=50)
+    parser.add_argument("--resume", action="store_true", help="kontynuuj trening z punktu kontrolnego")
+    parser.add_argument("--table", default=TABLE_PATH, help="tablica wymiany kart używana w symulowanych rozdaniach")
+    parser.add_argument("--no-draw", action="store_true", help="rozdania bez wymiany kart")
+    parser.add_argument("--out", default=STRATEGY_PATH)
+    args = parser.parse_args()
+
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    hold_masks_path = None
+    if not args.no_draw:
+        if load_hold_masks(args.table) is None:
+            print(f"Brak tablicy wymiany kart {args.table}. Zbuduj ją (tools/build_discard_table.py) albo użyj --no-draw.")
+            sys.exit(1)
+        hold_masks_path = args.table
+
+    trainer = CFRTrainer(config['small_blind'], config['big_blind'], args.buckets, args.batch_size, args.workers,
+                         args.seed, hold_masks_path)
+    if args.resume and os.path.exists(args.checkpoint):
+        trainer.load_checkpoint(args.checkpoint)
+        print(f"Wznowiono trening od iteracji {trainer.state.iteration}.")
+
+    def progress(iteration: int) -> None:
+        if iteration % args.checkpoint_every == 0:
+            print(f"Iteracja {iteration}.")
+
+    report = trainer.train(args.iterations, args.checkpoint, args.checkpoint_every, progress)
+    trainer.write_strategy(args.out)
+    print(f"Iteracje: {report['iterations']}, rozdania: {report['deals']:,}, {report['seconds']:.1f} s "
+          f"({report['deals_per_second']:,.0f} rozdań/s, workery: {trainer.workers}).")
+    print(f"Zapisano strategię do {args.out} ({os.path.getsize(args.out)} B).")
+
+    average = trainer.average_strategy()
+    for infoset, actions in enumerate(INFOSET_ACTIONS):
+        print(f"{_INFOSET_NAMES[infoset]}:")
+        for bucket in range(trainer.num_buckets):
+            probabilities = ", ".join(f"{action} {average[infoset, bucket, i]:.2f}" for i, action in enumerate(actions))
+            print(f"  koszyk {bucket:3d}: {probabilities}")
+
+
+if __name__ == "__main__":
+    main()
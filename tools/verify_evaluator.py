@@ -0,0 +1,60 @@
+import argparse
+import random
+import sys
+import time
+from itertools import combinations
+from src.logic.deck import Deck
+from src.logic.hand_ranker import hand_rank
+from src.logic.hand_evaluator import evaluate, score_to_rank
+
+
+def verify_all_hands() -> int:
+    cards = Deck().cards
+    checked = 0
+    mismatches = 0
+    for combo in combinations(cards, 5):
+        hand = list(combo)
+        if score_to_rank(evaluate(hand)) != hand_rank(hand):
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"Niezgodność: {' '.join(str(c) for c in hand)}: {hand_rank(hand)} != {score_to_rank(evaluate(hand))}")
+        checked += 1
+    print(f"Sprawdzono {checked} rąk, niezgodności: {mismatches}.")
+    return mismatches
+
+
+def measure_throughput(num_hands: int, seed: int) -> float:
+    rng = random.Random(seed)
+    cards = Deck().cards
+    hands = [rng.sample(cards, 5) for _ in range(num_hands)]
+
+    start = time.perf_counter()
+    for hand in hands:
+        hand_rank(hand)
+    reference = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for hand in hands:
+        evaluate(hand)
+    fast = time.perf_counter() - start
+
+    print(f"hand_rank: {num_hands / reference:,.0f} rąk/s")
+    print(f"evaluate:  {num_hands / fast:,.0f} rąk/s")
+    print(f"Przyspieszenie: {reference / fast:.1f}x")
+    return reference / fast
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Weryfikacja tablicowego ewaluatora układów względem hand_rank.")
+    parser.add_argument("--hands", type=int, default=200_000, help="liczba losowych rąk do pomiaru wydajności")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--skip-exhaustive", action="store_true", help="pomiń sprawdzenie wszystkich 2 598 960 rąk")
+    args = parser.parse_args()
+
+    mismatches = 0 if args.skip_exhaustive else verify_all_hands()
+    measure_throughput(args.hands, args.seed)
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
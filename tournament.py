@@ -0,0 +1,114 @@
+import argparse
+import json
+import os
+import random
+import time
+from multiprocessing import Pool
+from typing import List, Tuple
+from src.logic.player import Player
+from src.engine.game_engine import GameEngine
+from src.engine.policies import CFRBotPolicy, EquityBotPolicy, PercentileBotPolicy, RandomBotPolicy
+from main import load_config
+
+TableResult = Tuple[int, int, List[int], int, int]
+BOT_POLICIES = {'equity': EquityBotPolicy, 'random': RandomBotPolicy, 'cfr': CFRBotPolicy, 'percentile': PercentileBotPolicy}
+
+
+def run_table(task: tuple) -> TableResult:
+    table_index, seed, config, max_hands, bot = task
+    player_specs = [
+        {"name": p_data['name'], "stack": config['initial_stack'], "is_human": p_data['is_human']}
+        for p_data in config['players']
+    ]
+    players = Player.create_players(player_specs)
+    game = GameEngine(
+        players=players,
+        history_logger=None,
+        small_blind=config['small_blind'],
+        big_blind=config['big_blind'],
+        seed=seed,
+        default_policy=BOT_POLICIES[bot](),
+        headless=True
+    )
+    while game.round_counter < max_hands:
+        game.players = [p for p in game.players if p.stack > 0]
+        if len(game.players) < 2:
+            break
+        game.play_round()
+
+    final_stacks = [p.stack for p in players]
+    winner_id = max(range(len(players)), key=lambda i: final_stacks[i])
+    return table_index, seed, final_stacks, game.round_counter, winner_id
+
+
+def run_tournament(config: dict, num_tables: int, seed: int, workers: int = None, max_hands: int = 10_000,
+                   bot: str = 'equity') -> dict:
+    rng = random.Random(seed)
+    tasks = [(i, rng.getrandbits(64), config, max_hands, bot) for i in range(num_tables)]
+    num_seats = len(config['players'])
+    wins = [0] * num_seats
+    stack_totals = [0] * num_seats
+    total_hands = 0
+    max_table_hands = 0
+    capped_tables = 0
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, num_tables // (workers * 8))
+    start = time.perf_counter()
+    with Pool(processes=workers) as pool:
+        for _, _, final_stacks, hands, winner_id in pool.imap_unordered(run_table, tasks, chunksize=chunksize):
+            wins[winner_id] += 1
+            for i, stack in enumerate(final_stacks):
+                stack_totals[i] += stack
+            total_hands += hands
+            max_table_hands = max(max_table_hands, hands)
+            if sum(1 for stack in final_stacks if stack > 0) > 1:
+                capped_tables += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        "tables": num_tables,
+        "workers": workers,
+        "seed": seed,
+        "bot": bot,
+        "seconds": elapsed,
+        "hands": total_hands,
+        "hands_per_second": total_hands / elapsed if elapsed > 0 else 0.0,
+        "avg_hands_per_table": total_hands / num_tables if num_tables else 0.0,
+        "max_hands_per_table": max_table_hands,
+        "unfinished_tables": capped_tables,
+        "seats": [
+            {
+                "name": p_data['name'],
+                "wins": wins[i],
+                "win_rate": wins[i] / num_tables if num_tables else 0.0,
+                "avg_final_stack": stack_totals[i] / num_tables if num_tables else 0.0
+            }
+            for i, p_data in enumerate(config['players'])
+        ]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Równoległy turniej wielu stołów rozgrywanych przez boty.")
+    parser.add_argument("--tables", type=int, default=1000, help="liczba niezależnych stołów")
+    parser.add_argument("--workers", type=int, default=None, help="liczba procesów (domyślnie liczba rdzeni)")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--max-hands", type=int, default=10_000, help="limit rozdań na stół")
+    parser.add_argument("--bot", choices=sorted(BOT_POLICIES), default='equity', help="polityka botów")
+    parser.add_argument("--json", action="store_true", help="wypisz wyniki w formacie JSON")
+    args = parser.parse_args()
+
+    summary = run_tournament(load_config(quiet=args.json), args.tables, args.seed, args.workers, args.max_hands, args.bot)
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+        return
+    print(f"Stoły: {summary['tables']}, procesy: {summary['workers']}, czas: {summary['seconds']:.2f} s")
+    print(f"Rozdania: {summary['hands']} ({summary['hands_per_second']:,.0f} rozdań/s), "
+          f"średnio {summary['avg_hands_per_table']:.1f} na stół, niedokończone stoły: {summary['unfinished_tables']}")
+    for seat in summary['seats']:
+        print(f"{seat['name']}: wygrane {seat['wins']} ({seat['win_rate']:.1%}), średni stos {seat['avg_final_stack']:.0f}")
+
+
+if __name__ == "__main__":
+    main()